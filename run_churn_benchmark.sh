@@ -0,0 +1,57 @@
+#!/bin/bash
+
+# Compares the git and pygit2 code churn engines on the full history of a
+# repository, once for all files and once for C/C++ files only.
+#
+# Usage: ./run_churn_benchmark.sh <repository> [jobs] [repetitions]
+#
+# jobs is the number of worker processes of the pygit2 engine (default 1,
+# 0 uses one per CPU core).
+
+if [ -z "$1" ]; then
+  echo "Usage: $0 <repository> [jobs] [repetitions]"
+  exit 1
+fi
+
+REPOSITORY=$1
+JOBS=${2:-1}
+REPETITIONS=${3:-3}
+
+python3 - "$REPOSITORY" "$JOBS" "$REPETITIONS" << 'EOF'
+import sys
+import timeit
+
+import pygit2
+
+from varats.utils.git_util import ChurnConfig, calc_repo_code_churn
+
+repo = pygit2.Repository(pygit2.discover_repository(sys.argv[1]))
+jobs = int(sys.argv[2])
+repetitions = int(sys.argv[3])
+
+print(f"{'files':<12} {'engine':<8} {'avg [s]':>10}")
+results = {}
+for name, create_config in (
+    ("all", ChurnConfig.create_default_config),
+    ("C/C++", ChurnConfig.create_c_style_languages_config),
+):
+    for engine in ChurnConfig.Engine:
+        churn_config = create_config()
+        churn_config.engine = engine
+        churn_config.jobs = jobs
+        results[engine] = calc_repo_code_churn(repo, churn_config)
+        runtime = timeit.timeit(
+            lambda: calc_repo_code_churn(repo, churn_config),
+            number=repetitions
+        ) / repetitions
+        print(f"{name:<12} {engine.value:<8} {runtime:>10.3f}")
+
+    differing_commits = [
+        c_hash for c_hash, churn in results[ChurnConfig.Engine.GIT].items()
+        if results[ChurnConfig.Engine.PYGIT2].get(c_hash) != churn
+    ]
+    print(
+        f"{name:<12} {len(differing_commits)} of "
+        f"{len(results[ChurnConfig.Engine.GIT])} commits differ"
+    )
+EOF
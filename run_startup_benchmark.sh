@@ -0,0 +1,40 @@
+#!/bin/bash
+
+# Measures the startup time of the vara-* tools by timing their help output,
+# which parses the command line without doing any work.
+#
+# Usage: ./run_startup_benchmark.sh [repetitions]
+
+REPETITIONS=${1:-5}
+
+TOOLS=(
+  vara-art
+  vara-buildsetup
+  vara-config
+  vara-cs
+  vara-develop
+  vara-gen-bbconfig
+  vara-gen-commitmap
+  vara-gen-blame-sidecars
+  vara-pc
+  vara-plot
+  vara-table
+  vara-cve
+)
+
+# The first run of a tool generates the plugin manifests, so warm them up
+# before measuring.
+for TOOL in "${TOOLS[@]}"; do
+  "$TOOL" -h > /dev/null 2>&1
+done
+
+printf "%-26s %10s\n" "tool" "avg [s]"
+for TOOL in "${TOOLS[@]}"; do
+  START=$(date +%s.%N)
+  for _ in $(seq "$REPETITIONS"); do
+    "$TOOL" -h > /dev/null 2>&1
+  done
+  END=$(date +%s.%N)
+  printf "%-26s %10.3f\n" "$TOOL" \
+    "$(python3 -c "print(($END - $START) / $REPETITIONS)")"
+done
@@ -11,8 +11,12 @@ from varats.data.reports.blame_report import (
     BlameReportDiff,
     BlameResultFunctionEntry,
     BlameInstInteractions,
+    create_blame_report_sidecar,
     generate_degree_tuples,
+    get_blame_report_sidecar_path,
 )
+from tests.test_utils import replace_config
+from varats.utils.filesystem_util import sha256_checksum
 
 FAKE_REPORT_PATH = (
     "BR-xz-xz-fdbc0cfa71_63959faf-66d9-41e0-8dbb-abeee2c255eb_success.yaml"
@@ -351,6 +355,25 @@ class TestBlameReport(unittest.TestCase):
         self.assertEqual(next(func_entry_iter).name, 'bool_exec')
         self.assertEqual(next(func_entry_iter).name, '_Z7doStuffii')
 
+    def test_interaction_table(self):
+        """Test if the interactions are stored in a compact table."""
+        table = self.report.interaction_table
+        self.assertEqual(
+            table.function_names,
+            ['adjust_assignment_expression', 'bool_exec', '_Z7doStuffii']
+        )
+        self.assertEqual(table.num_interactions, 2)
+        self.assertEqual(len(table.commits), 3)
+
+        func_entry = self.report.get_blame_result_function_entry('bool_exec')
+        self.assertEqual(
+            table.create_function_interactions(1), func_entry.interactions
+        )
+        self.assertEqual([
+            len(interaction.interacting_commits)
+            for interaction in func_entry.interactions
+        ], list(table.degrees))
+
 
 class TestBlameReportWithRepoData(unittest.TestCase):
     """Test if a blame report, containing repo data , is correctly reconstructed
@@ -641,3 +664,80 @@ class TestBlameReportHelperFunctions(unittest.TestCase):
         degree_tuples = generate_degree_tuples(self.report)
         self.assertEqual(degree_tuples[0], (1, 22))
         self.assertEqual(degree_tuples[1], (2, 5))
+
+
+class TestBlameReportSidecar(unittest.TestCase):
+    """Test if blame reports are correctly stored in and loaded from binary
+    sidecar files."""
+
+    def test_sidecar_round_trip(self):
+        """Test if a report loaded from its sidecar equals the yaml report."""
+        with replace_config() as config:
+            config["cache"]["blame_report_sidecars"] = True
+            report_path = Path(
+                str(config["data_cache"])
+            ).parent / FAKE_REPORT_PATH
+            report_path.write_text(
+                YAML_DOC_HEADER_2 + YAML_DOC_BR_METADATA + YAML_DOC_BR_5
+            )
+            sidecar_path = get_blame_report_sidecar_path(
+                sha256_checksum(report_path)
+            )
+
+            yaml_report = BlameReport(report_path)
+            self.assertTrue(sidecar_path.exists())
+            self.assertFalse(create_blame_report_sidecar(report_path))
+
+            with mock.patch(
+                "varats.data.reports.blame_report._parse_blame_report_data"
+            ) as parse_mock:
+                sidecar_report = BlameReport(report_path)
+                parse_mock.assert_not_called()
+
+            self.assertEqual(str(sidecar_report), str(yaml_report))
+            self.assertEqual(
+                sidecar_report.interaction_table.commits,
+                yaml_report.interaction_table.commits
+            )
+            self.assertEqual(sidecar_report.meta_data.num_functions, 3)
+            self.assertEqual(sidecar_report.meta_data.num_instructions, 21)
+
+    def test_no_sidecar_by_default(self):
+        """Test if loading a report does not create a sidecar unless sidecars
+        are enabled."""
+        with replace_config() as config:
+            report_path = Path(
+                str(config["data_cache"])
+            ).parent / FAKE_REPORT_PATH
+            report_path.write_text(
+                YAML_DOC_HEADER + YAML_DOC_BR_METADATA + YAML_DOC_BR_1
+            )
+
+            report = BlameReport(report_path)
+            self.assertEqual(report.interaction_table.num_interactions, 2)
+            sidecar_path = get_blame_report_sidecar_path(
+                sha256_checksum(report_path)
+            )
+            self.assertFalse(sidecar_path.exists())
+
+    def test_broken_sidecar_is_replaced(self):
+        """Test if an unreadable sidecar falls back to the yaml report."""
+        with replace_config() as config:
+            config["cache"]["blame_report_sidecars"] = True
+            report_path = Path(
+                str(config["data_cache"])
+            ).parent / FAKE_REPORT_PATH
+            report_path.write_text(
+                YAML_DOC_HEADER + YAML_DOC_BR_METADATA + YAML_DOC_BR_1
+            )
+            sidecar_path = get_blame_report_sidecar_path(
+                sha256_checksum(report_path)
+            )
+            sidecar_path.parent.mkdir(parents=True)
+            sidecar_path.write_bytes(b"no sidecar")
+
+            report = BlameReport(report_path)
+            self.assertEqual(report.interaction_table.num_interactions, 2)
+            self.assertEqual(
+                BlameReport(report_path).interaction_table.num_interactions, 2
+            )
@@ -1,10 +1,20 @@
 """Test the cache_helper module."""
+import time
 import unittest
 
 import pandas as pd
+import pytest
 
 from tests.test_utils import replace_config
-from varats.data.cache_helper import build_cached_report_table
+from varats.data.cache_helper import (
+    CACHE_ID_COL,
+    CACHE_TIMESTAMP_COL,
+    build_cached_report_table,
+    cache_dataframe,
+    get_data_file_path,
+    get_segment_file_path,
+    load_cached_df_or_none,
+)
 
 
 class TestCacheHelper(unittest.TestCase):
@@ -14,6 +24,7 @@ class TestCacheHelper(unittest.TestCase):
         "a": ("a", 1),
         "a2": ("a", 2),
         "b": ("b", 1),
+        "b2": ("b", 2),
         "c": ("c", 1),
         "c2": ("c", 2),
     }
@@ -74,3 +85,255 @@ class TestCacheHelper(unittest.TestCase):
             self.assertNotIn("a2", df["entry"].values)
             self.assertIn("b", df["entry"].values)
             self.assertIn("c2", df["entry"].values)
+
+    def test_build_cached_report_table_column_projection(self):
+        """Check whether only the requested columns are returned."""
+        data_id = "cache_test_data"
+        project_name = "project"
+
+        def create_empty_df():
+            return pd.DataFrame(columns=["entry", "value"])
+
+        def create_cache_entry_data(entry: str):
+            return pd.DataFrame({
+                "entry": entry,
+                "value": self.TEST_DATA[entry][1]
+            },
+                                index=[0]), get_entry_id(entry), str(
+                                    self.TEST_DATA[entry][1]
+                                )
+
+        def get_entry_id(entry: str) -> str:
+            return self.TEST_DATA[entry][0]
+
+        with replace_config():
+            build_cached_report_table(
+                data_id, project_name, ["a", "b"], [], create_empty_df,
+                create_cache_entry_data, get_entry_id,
+                lambda entry: str(self.TEST_DATA[entry][1]),
+                lambda a, b: int(a) > int(b)
+            )
+
+            df = build_cached_report_table(
+                data_id,
+                project_name, ["a", "b"], [],
+                create_empty_df,
+                create_cache_entry_data,
+                get_entry_id,
+                lambda entry: str(self.TEST_DATA[entry][1]),
+                lambda a, b: int(a) > int(b),
+                columns=["value"]
+            )
+
+            self.assertEqual(["value"], [*df])
+            self.assertEqual([1, 1], list(df["value"]))
+
+    def test_incremental_cache_update(self):
+        """Check whether updates are appended as delta segments and compacted
+        once there are too many of them."""
+        data_id = "cache_test_data"
+        project_name = "project"
+
+        def create_cache_entry_data(entry: str):
+            return pd.DataFrame({"entry": entry}, index=[0]), \
+                self.TEST_DATA[entry][0], str(self.TEST_DATA[entry][1])
+
+        def build_table(data_to_load, data_to_drop):
+            return build_cached_report_table(
+                data_id, project_name, data_to_load, data_to_drop,
+                lambda: pd.DataFrame(columns=["entry"]),
+                create_cache_entry_data, lambda entry: self.TEST_DATA[entry][0],
+                lambda entry: str(self.TEST_DATA[entry][1]),
+                lambda a, b: int(a) > int(b)
+            )
+
+        with replace_config() as config:
+            config["cache"]["max_delta_segments"] = 1
+
+            build_table(["a", "b"], [])
+            self.assertTrue(get_data_file_path(data_id, project_name).exists())
+            self.assertFalse(
+                get_segment_file_path(data_id, project_name, 1).exists()
+            )
+
+            df = build_table(["c"], [])
+            self.assertTrue(
+                get_segment_file_path(data_id, project_name, 1).exists()
+            )
+            self.assertEqual(["a", "b", "c"], sorted(df["entry"]))
+
+            # a second delta segment triggers the compaction
+            df = build_table(["a2"], [])
+            self.assertFalse(
+                get_segment_file_path(data_id, project_name, 1).exists()
+            )
+            self.assertFalse(
+                get_segment_file_path(data_id, project_name, 2).exists()
+            )
+            self.assertEqual(["a2", "b", "c"], sorted(df["entry"]))
+
+            df = build_table(["c2"], [])
+            self.assertTrue(
+                get_segment_file_path(data_id, project_name, 1).exists()
+            )
+            self.assertEqual(["a2", "b", "c2"], sorted(df["entry"]))
+
+            df = build_table([], ["b2"])
+            self.assertEqual(["a2", "c2"], sorted(df["entry"]))
+            self.assertEqual(["a2", "c2"],
+                             sorted(
+                                 load_cached_df_or_none(data_id,
+                                                        project_name)["entry"]
+                             ))
+
+    def test_build_cached_report_table_parallel(self):
+        """Check whether entries created by worker processes are cached in the
+        order of the data items."""
+        data_id = "cache_test_data"
+        project_name = "project"
+
+        with replace_config() as config:
+            config["cache"]["jobs"] = 2
+            df = build_cached_report_table(
+                data_id, project_name, ["c", "a", "b"], [],
+                lambda: pd.DataFrame(columns=["entry"]), lambda entry: (
+                    pd.DataFrame({"entry": entry}, index=[0]), self.TEST_DATA[
+                        entry][0], str(self.TEST_DATA[entry][1])
+                ), lambda entry: self.TEST_DATA[entry][0],
+                lambda entry: str(self.TEST_DATA[entry][1]),
+                lambda a, b: int(a) > int(b)
+            )
+
+            self.assertEqual(["c", "a", "b"], list(df["entry"]))
+
+    def test_staleness_detection_up_to_date_cache(self):
+        """Check whether no entry of an up-to-date cache is loaded again."""
+        data_id = "cache_staleness_data"
+        project_name = "project"
+        num_reports = 1000
+        reports = [(f"{rev:040x}", str(rev)) for rev in range(num_reports)]
+        loaded_reports = []
+
+        def create_entry(report):
+            loaded_reports.append(report)
+            return pd.DataFrame({"entry": report[0]}, index=[0]), *report
+
+        def build_table():
+            return build_cached_report_table(
+                data_id, project_name, reports, [],
+                lambda: pd.DataFrame(columns=["entry"]), create_entry,
+                lambda report: report[0], lambda report: report[1],
+                lambda a, b: int(a) > int(b)
+            )
+
+        with replace_config():
+            cache_dataframe(
+                data_id, project_name,
+                pd.DataFrame({
+                    "entry": [report_id for report_id, _ in reports],
+                    CACHE_ID_COL: [report_id for report_id, _ in reports],
+                    CACHE_TIMESTAMP_COL: [
+                        timestamp for _, timestamp in reports
+                    ]
+                })
+            )
+            # the first build creates the cache index
+            build_table()
+            self.assertEqual(num_reports, len(build_table()))
+
+        self.assertEqual([], loaded_reports)
+
+    @pytest.mark.slow
+    def test_staleness_detection_benchmark(self):
+        """Compare the staleness detection of an up-to-date cache with 10k
+        entries against the previous per-entry masking approach."""
+        data_id = "cache_benchmark_data"
+        project_name = "project"
+        num_reports = 10000
+        reports = [(f"{rev:040x}", str(rev)) for rev in range(num_reports)]
+
+        def build_table():
+            return build_cached_report_table(
+                data_id, project_name, reports, [],
+                lambda: pd.DataFrame(columns=["entry"]), lambda report:
+                (pd.DataFrame({"entry": report[0]}, index=[0]), *report),
+                lambda report: report[0], lambda report: report[1],
+                lambda a, b: int(a) > int(b)
+            )
+
+        with replace_config():
+            cache_dataframe(
+                data_id, project_name,
+                pd.DataFrame({
+                    "entry": [report_id for report_id, _ in reports],
+                    CACHE_ID_COL: [report_id for report_id, _ in reports],
+                    CACHE_TIMESTAMP_COL: [
+                        timestamp for _, timestamp in reports
+                    ]
+                })
+            )
+            # the first build creates the cache index
+            build_table()
+
+            start = time.perf_counter()
+            self.assertEqual(num_reports, len(build_table()))
+            hashed_time = time.perf_counter() - start
+
+            cached_df = load_cached_df_or_none(data_id, project_name)
+            start = time.perf_counter()
+            for report_id, report_timestamp in reports:
+                cached_entry = cached_df[cached_df[CACHE_ID_COL] == report_id]
+                self.assertFalse(
+                    int(report_timestamp) >
+                    int(cached_entry[CACHE_TIMESTAMP_COL].iloc[0])
+                )
+            masked_time = time.perf_counter() - start
+
+        self.assertLess(
+            hashed_time, masked_time,
+            f"Staleness detection for {num_reports} reports: "
+            f"{hashed_time:.3f}s (hashed) vs. {masked_time:.3f}s (masked)"
+        )
+
+
+class TestCacheBackend(unittest.TestCase):
+    """Test the different cache storage backends."""
+
+    def test_parquet_keeps_types(self):
+        """Check whether the parquet backend keeps column types."""
+        with replace_config() as config:
+            config["cache"]["format"] = "parquet"
+            data_frame = pd.DataFrame({
+                "revision": ["0123", "4567"],
+                "amount": [1, 2],
+                CACHE_TIMESTAMP_COL: ["1", "2"]
+            })
+            cache_dataframe("cache_test_data", "project", data_frame)
+
+            loaded_df = load_cached_df_or_none("cache_test_data", "project")
+            self.assertEqual("0123", loaded_df["revision"][0])
+            self.assertEqual("1", loaded_df[CACHE_TIMESTAMP_COL][0])
+
+            projected_df = load_cached_df_or_none(
+                "cache_test_data", "project", ["amount"]
+            )
+            self.assertEqual(["amount"], [*projected_df])
+
+    def test_migrate_csv_cache_file(self):
+        """Check whether csv cache files are converted to the configured
+        format."""
+        with replace_config() as config:
+            config["cache"]["format"] = "csv"
+            data_frame = pd.DataFrame({"amount": [1, 2]})
+            cache_dataframe("cache_test_data", "project", data_frame)
+            csv_path = get_data_file_path("cache_test_data", "project")
+            self.assertTrue(csv_path.exists())
+
+            config["cache"]["format"] = "parquet"
+            loaded_df = load_cached_df_or_none("cache_test_data", "project")
+
+            self.assertFalse(csv_path.exists())
+            self.assertTrue(
+                get_data_file_path("cache_test_data", "project").exists()
+            )
+            self.assertEqual([1, 2], list(loaded_df["amount"]))
@@ -1,7 +1,9 @@
 """Test VaRA commit reports."""
 
+import tempfile
 import unittest
 import unittest.mock as mock
+from pathlib import Path
 
 import yaml
 
@@ -13,6 +15,10 @@ from varats.data.reports.commit_report import (
     RegionMapping,
     generate_interactions,
 )
+from varats.mapping.commit_map import (
+    load_commit_map_from_path,
+    store_commit_map,
+)
 from varats.report.report import FileStatusExtension
 
 YAML_DOC_1 = """---
@@ -251,6 +257,57 @@ class TestCommitReport(unittest.TestCase):
         self.assertEqual(self.commit_report.calc_max_cf_edges(), 2)
         self.assertEqual(self.commit_report.calc_max_df_edges(), 3)
 
+    def test_interaction_degrees(self):
+        """Check if the interactions of every region are counted."""
+        self.assertEqual(
+            self.commit_report.region_ids, [
+                "8ac1b3f73baceb4a16e99504807d23d38e5123b1",
+                "38f87b03c2763bb2af05ae98905b0ac8ba55b3eb",
+                "b8b25e7f1593f6dcc20660ff9fb1ed59ede15b7a",
+                "3ea7fe86ac3c1a887038e0e3e1c07ba4634ad1a5",
+                "95ace546d3f6c5909a636017f141784105f9dab2"
+            ]
+        )
+        cf_out, cf_in = self.commit_report.cf_degrees()
+        self.assertEqual(cf_out.tolist(), [0, 0, 0, 2, 1])
+        self.assertEqual(cf_in.tolist(), [0, 0, 2, 1, 0])
+        df_out, df_in = self.commit_report.df_degrees()
+        self.assertEqual(df_out.tolist(), [0, 0, 2, 2, 0])
+        self.assertEqual(df_in.tolist(), [0, 0, 0, 1, 3])
+
+        self.assertEqual(self.commit_report.number_of_cf_interactions(), 3)
+        self.assertEqual(self.commit_report.number_of_df_interactions(), 4)
+
+        cf_map = {}
+        self.commit_report.init_cf_map_with_edges(cf_map)
+        self.assertEqual(
+            cf_map["3ea7fe86ac3c1a887038e0e3e1c07ba4634ad1a5"], [2, 1]
+        )
+        self.assertEqual(
+            cf_map["8ac1b3f73baceb4a16e99504807d23d38e5123b1"], [0, 0]
+        )
+
+    def test_head_interactions(self):
+        """Check if the interactions of the HEAD commit are counted."""
+        with mock.patch.object(
+            CommitReport,
+            "head_commit",
+            new_callable=mock.PropertyMock,
+            return_value="3ea7fe86ac"
+        ):
+            file_content = YAML_DOC_1 + YAML_DOC_2 + YAML_DOC_3
+            with mock.patch(
+                'builtins.open', new=mock.mock_open(read_data=file_content)
+            ):
+                commit_report = CommitReport("fake_file_path")
+
+            self.assertEqual(
+                commit_report.number_of_head_cf_interactions(), (2, 1)
+            )
+            self.assertEqual(
+                commit_report.number_of_head_df_interactions(), (2, 1)
+            )
+
     def test_is_result_file(self):
         """Check if the result file matcher works."""
         self.assertTrue(CommitReport.is_result_file(self.success_filename))
@@ -386,6 +443,54 @@ class TestCommitMap(unittest.TestCase):
         self.assertEqual(self.cmap.short_time_id("ae332f2"), 1)
         self.assertEqual(self.cmap.short_time_id("ef58a957a6c1"), 0)
         self.assertEqual(self.cmap.short_time_id("2054"), 32)
+        self.assertRaises(KeyError, self.cmap.short_time_id, "fff")
+
+    def test_c_hash(self):
+        """Test reverse look up of hashes."""
+        self.assertEqual(
+            self.cmap.c_hash(1), "ae332f2a5d2f6f3e0a23443f8a9bcb068c8af74d"
+        )
+        self.assertEqual(
+            self.cmap.c_hash(32), "20540be6186c159880dda3a49a5827722c1a0ac9"
+        )
+        self.assertRaises(KeyError, self.cmap.c_hash, 1000)
+
+    def test_time_ids(self):
+        """Test vectorized time id look up."""
+        self.assertEqual(
+            list(
+                self.cmap.time_ids([
+                    "20540be6186c159880dda3a49a5827722c1a0ac9",
+                    "ef58a957a6c1887930cc70d6199ae7e48aa8d716"
+                ])
+            ), [32, 0]
+        )
+        self.assertRaises(KeyError, self.cmap.time_ids, ["ae332f2"])
+
+    def test_mapping_items(self):
+        """Test if mapping items are ordered by time id."""
+        items = list(self.cmap.mapping_items())
+        self.assertEqual(len(items), len(self.cmap.mapping_items()))
+        self.assertEqual(
+            items[0], ("ef58a957a6c1887930cc70d6199ae7e48aa8d716", 0)
+        )
+        self.assertEqual([time_id for _, time_id in items],
+                         list(range(len(items))))
+
+    def test_binary_commit_map(self):
+        """Test storing and loading a binary commit map."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cmap_path = Path(tmp_dir) / "xz.npy"
+            store_commit_map(self.cmap, str(cmap_path))
+            loaded_cmap = load_commit_map_from_path(cmap_path)
+
+        self.assertEqual(
+            list(loaded_cmap.mapping_items()), list(self.cmap.mapping_items())
+        )
+        self.assertEqual(loaded_cmap.short_time_id("ae332f2"), 1)
+        self.assertEqual(
+            loaded_cmap.c_hash(32), "20540be6186c159880dda3a49a5827722c1a0ac9"
+        )
 
 
 class TestCommitConnectionGenerators(unittest.TestCase):
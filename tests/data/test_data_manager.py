@@ -0,0 +1,179 @@
+"""Test the DataManager."""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock as mock
+from pathlib import Path
+
+from varats.data.data_manager import DataManager, get_file_key
+from varats.data.reports.empty_report import EmptyReport
+from tests.test_utils import replace_config
+
+
+class TestDataManager(unittest.TestCase):
+    """Test the loading and caching of data classes."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.files = []
+        for idx in range(3):
+            file_path = Path(self.tmp_dir.name) / f"report_{idx}.txt"
+            file_path.write_text("x" * 100)
+            self.files.append(file_path)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_file_key_changes_with_file(self):
+        """Test if the file key changes if the file is modified."""
+        file_path = self.files[0]
+        key = get_file_key(file_path)
+        self.assertEqual(key, get_file_key(file_path))
+
+        file_path.write_text("y" * 101)
+        self.assertNotEqual(key, get_file_key(file_path))
+        self.assertNotEqual(
+            get_file_key(file_path, hash_content=True),
+            get_file_key(self.files[1], hash_content=True)
+        )
+
+    @replace_config()
+    def test_cache_hits_and_misses(self, config):
+        """Test if repeated loads are served from the cache."""
+        config["cache"]["data_manager_max_size"] = 0
+        data_manager = DataManager()
+
+        first_report = data_manager.load_data_class_sync(
+            self.files[0], EmptyReport
+        )
+        self.assertIs(
+            data_manager.load_data_class_sync(self.files[0], EmptyReport),
+            first_report
+        )
+        data_manager.load_data_class_sync(self.files[1], EmptyReport)
+
+        stats = data_manager.cache_statistics
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.misses, 2)
+        self.assertEqual(stats.num_entries, 2)
+        self.assertEqual(stats.size, 200)
+
+        # a modified file needs to be loaded again
+        self.files[0].write_text("y" * 100)
+        os.utime(self.files[0], ns=(0, 0))
+        self.assertIsNot(
+            data_manager.load_data_class_sync(self.files[0], EmptyReport),
+            first_report
+        )
+        self.assertEqual(data_manager.cache_statistics.misses, 3)
+
+    @replace_config()
+    def test_lru_eviction(self, config):
+        """Test if the least recently used files are evicted first."""
+        config["cache"]["data_manager_max_size"] = 250
+        data_manager = DataManager()
+
+        report_0 = data_manager.load_data_class_sync(
+            self.files[0], EmptyReport
+        )
+        data_manager.load_data_class_sync(self.files[1], EmptyReport)
+        # use report 0 again, so report 1 becomes the least recently used one
+        data_manager.load_data_class_sync(self.files[0], EmptyReport)
+        data_manager.load_data_class_sync(self.files[2], EmptyReport)
+
+        stats = data_manager.cache_statistics
+        self.assertEqual(stats.evictions, 1)
+        self.assertEqual(stats.num_entries, 2)
+        self.assertEqual(stats.size, 200)
+        self.assertIs(
+            data_manager.load_data_class_sync(self.files[0], EmptyReport),
+            report_0
+        )
+        data_manager.load_data_class_sync(self.files[1], EmptyReport)
+        self.assertEqual(data_manager.cache_statistics.misses, 4)
+
+        data_manager.clear_cache()
+        self.assertEqual(data_manager.cache_statistics.num_entries, 0)
+        self.assertEqual(data_manager.cache_statistics.size, 0)
+
+    @replace_config()
+    def test_concurrent_loads_of_same_file(self, config):
+        """Test if concurrent requests for the same file load it only once."""
+        config["cache"]["data_manager_max_size"] = 0
+        data_manager = DataManager()
+        loaded_paths = []
+        original_init = EmptyReport.__init__
+
+        def slow_init(report: EmptyReport, path: Path) -> None:
+            loaded_paths.append(path)
+            time.sleep(0.1)
+            original_init(report, path)
+
+        reports = []
+        with mock.patch.object(EmptyReport, "__init__", slow_init):
+            threads = [
+                threading.Thread(
+                    target=lambda: reports.append(
+                        data_manager.load_data_class_sync(
+                            self.files[0], EmptyReport
+                        )
+                    )
+                ) for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(loaded_paths, [self.files[0]])
+        self.assertEqual(len(reports), 4)
+        for report in reports:
+            self.assertIs(report, reports[0])
+
+    @replace_config()
+    def test_failed_cache_insert_resolves_load(self, config):
+        """Test if a file that cannot be inserted into the cache does not leave
+        its load pending."""
+        config["cache"]["data_manager_max_size"] = 0
+        data_manager = DataManager()
+
+        with mock.patch(
+            "varats.data.data_manager.os.path.getsize",
+            side_effect=FileNotFoundError
+        ):
+            self.assertRaises(
+                FileNotFoundError, data_manager.load_data_class_sync,
+                self.files[0], EmptyReport
+            )
+
+        self.assertIsInstance(
+            data_manager.load_data_class_sync(self.files[0], EmptyReport),
+            EmptyReport
+        )
+        self.assertEqual(data_manager.cache_statistics.num_entries, 1)
+
+    @replace_config()
+    def test_load_data_classes(self, config):
+        """Test if batch loads keep the order and use the cache."""
+        config["cache"]["data_manager_max_size"] = 0
+        data_manager = DataManager()
+        cached_report = data_manager.load_data_class_sync(
+            self.files[1], EmptyReport
+        )
+
+        reports = data_manager.load_data_classes(
+            self.files + [self.files[0]], EmptyReport, jobs=2
+        )
+
+        self.assertEqual([report.path for report in reports],
+                         self.files + [self.files[0]])
+        self.assertIs(reports[1], cached_report)
+        self.assertIs(reports[3], reports[0])
+        self.assertIs(
+            data_manager.load_data_class_sync(self.files[2], EmptyReport),
+            reports[2]
+        )
+        self.assertEqual(data_manager.cache_statistics.misses, 3)
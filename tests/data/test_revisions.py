@@ -1,14 +1,33 @@
 """Test revision helper functions."""
 
+import os
+import tempfile
 import unittest
 import unittest.mock as mock
+from pathlib import Path
 
-from benchbuild.utils.revision_ranges import block_revisions, SingleRevision
+import plumbum as pb
+import pygit2
+from benchbuild.source import Git
+from benchbuild.utils import revision_ranges
+from benchbuild.utils.revision_ranges import GoodBadSubgraph, SingleRevision
 
-from tests.test_utils import DummyGit
+import varats.revision.result_index as result_index_module
+import varats.revision.revisions as revisions_module
+from tests.test_utils import DummyGit, replace_config
+from varats.data.reports.blame_report import BlameReport
 from varats.projects.c_projects.glibc import Glibc
+from varats.project.project_util import block_revisions
 from varats.projects.c_projects.gravity import Gravity
-from varats.revision.revisions import filter_blocked_revisions
+from varats.revision.result_index import get_result_file_entries
+from varats.revision.revisions import (
+    blocked_mask,
+    filter_blocked_revisions,
+    get_blocked_revisions,
+    get_failed_revisions,
+    get_processed_revisions_files,
+    get_supplementary_result_files,
+)
 
 
 class TestFilterBlockedRevisions(unittest.TestCase):
@@ -63,3 +82,230 @@ class TestFilterBlockedRevisions(unittest.TestCase):
         )
 
         self.assertLessEqual(unblocked_revisions, filtered_revisions)
+
+
+class _LocalGit(Git):  # type: ignore
+    """A git source for an already existing local repository."""
+
+    def fetch(self) -> pb.LocalPath:
+        return pb.local.path(self.remote)
+
+
+class TestBlockedMask(unittest.TestCase):
+    """Test the bulk evaluation of blocked revisions."""
+
+    def setUp(self) -> None:
+        getattr(revisions_module, "__BLOCKED_REVISIONS").clear()
+        self.addCleanup(getattr(revisions_module, "__BLOCKED_REVISIONS").clear)
+        project_source_patcher = mock.patch(
+            'varats.revision.revisions.get_primary_project_source'
+        )
+        self.addCleanup(project_source_patcher.stop)
+        self.source_mock = project_source_patcher.start()
+
+    def test_blocked_mask(self):
+        """Checks if short and full revisions are matched like in
+        is_blocked_revision."""
+        self.source_mock.return_value = block_revisions([
+            SingleRevision("e207f0cc87f3"),
+            SingleRevision("109a1e6233")
+        ])(DummyGit(remote="/dev/null", local="/dev/null"))
+
+        self.assertEqual(
+            blocked_mask([
+                "e207f0cc87", "109a1e6233", "109a1e6233aa", "8bece6fd0c",
+                "e207f0cc87f3"
+            ], Gravity).tolist(), [True, True, False, False, True]
+        )
+        self.assertEqual(blocked_mask([], Gravity).tolist(), [])
+        self.assertIs(
+            get_blocked_revisions(Gravity), get_blocked_revisions(Gravity)
+        )
+
+    def test_source_without_exposed_ranges(self):
+        """Checks if revisions are checked one by one if the source does not
+        expose its blocked revision ranges."""
+        self.source_mock.return_value = revision_ranges.block_revisions([
+            SingleRevision("e207f0cc87f3")
+        ])(DummyGit(remote="/dev/null", local="/dev/null"))
+
+        self.assertIsNone(get_blocked_revisions(Gravity))
+        self.assertEqual(
+            blocked_mask(["e207f0cc87", "8bece6fd0c"], Gravity).tolist(),
+            [True, False]
+        )
+
+    def test_source_without_blocked_revisions(self):
+        """Checks if no revision is blocked without block specifications."""
+        self.source_mock.return_value = DummyGit(
+            remote="/dev/null", local="/dev/null"
+        )
+        self.assertEqual(
+            blocked_mask(["61416e1921"], Glibc).tolist(), [False]
+        )
+
+    @replace_config()
+    def test_cached_blocked_revisions(self, config):
+        """Checks if the blocked revisions are stored in the data cache and
+        recomputed when the branches of the repository change."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            repo = pygit2.init_repository(str(Path(tmp_dir) / "repo"))
+            signature = pygit2.Signature("VaRA", "vara@example.com", 1000, 0)
+            tree = repo.TreeBuilder().write()
+            commits = []
+            for idx in range(4):
+                commits.append(
+                    repo.create_commit(
+                        "refs/heads/main", signature, signature, f"c{idx}",
+                        tree, commits[-1:]
+                    )
+                )
+
+            def create_source() -> Git:
+                return block_revisions([
+                    GoodBadSubgraph([str(commits[1])], [str(commits[3])])
+                ])(_LocalGit(remote=str(Path(tmp_dir) / "repo"), local="repo"))
+
+            self.source_mock.return_value = create_source()
+
+            with mock.patch(
+                'varats.revision.revisions.target_prefix', return_value=tmp_dir
+            ):
+                self.assertEqual(
+                    blocked_mask([str(commit) for commit in commits],
+                                 Gravity).tolist(), [False, True, True, False]
+                )
+                self.assertTrue((
+                    Path(str(config["data_cache"])) / "blocked_revisions" /
+                    "gravity.npz"
+                ).exists())
+
+                # a new process loads the stored revisions
+                self.source_mock.return_value = create_source()
+                with mock.patch.object(
+                    GoodBadSubgraph, "init_cache"
+                ) as init_mock:
+                    self.assertEqual(
+                        get_blocked_revisions(Gravity).tolist(),
+                        sorted([
+                            str(commits[1]).encode(),
+                            str(commits[2]).encode()
+                        ])
+                    )
+                    init_mock.assert_not_called()
+
+                # a new branch invalidates the stored revisions
+                repo.branches.local.create("other", repo.get(commits[2]))
+                self.source_mock.return_value = create_source()
+                with mock.patch.object(
+                    GoodBadSubgraph,
+                    "init_cache",
+                    autospec=True,
+                    side_effect=GoodBadSubgraph.init_cache
+                ) as init_mock:
+                    get_blocked_revisions(Gravity)
+                    init_mock.assert_called_once()
+
+
+class TestResultFileIndex(unittest.TestCase):
+    """Test the lookup of result files through the result index."""
+
+    FILES = {
+        "BR-xz-xz-2f0bc9cd40_9e238675-ee7c-4325-8e9f-8ccf6fd3f05c_success.yaml":
+            1000,
+        "BR-xz-xz-2f0bc9cd40_77a6c5bc-e5c7-4532-8814-70dbcc6b5dda_failed.txt":
+            1001,
+        "BR-xz-xz-c5c7ceb08a_feeeecb2-1826-49e5-a188-d4d883f06d00_success.yaml":
+            1002,
+        "CR-xz-xz-c5c7ceb08a_8bc2ac4c-b6e3-43d1-aff9-c6b32126b155_failed.txt":
+            1003,
+        "BR-SUPPL-xz-xz-c5c7ceb08a_5f696090-edcc-433e-9dda-a55718f0c02d_"
+        "trace.json":
+            1004,
+        "README.md":
+            1005,
+    }
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.result_dir = Path(self.tmp_dir.name) / "xz"
+        self.result_dir.mkdir()
+        for file_name, mtime in self.FILES.items():
+            (self.result_dir / file_name).touch()
+            os.utime(self.result_dir / file_name, (mtime, mtime))
+        self.__age_result_dir(2000)
+        getattr(result_index_module, "__RESULT_INDICES").clear()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def __age_result_dir(self, mtime: int) -> None:
+        """Move the modification time of the result directory out of the
+        interval in which changes could be missed."""
+        os.utime(self.result_dir, (mtime, mtime))
+
+    def test_result_file_lookup(self):
+        """Test if the newest result files are found."""
+        with replace_config() as config:
+            config["result_dir"] = self.tmp_dir.name
+            self.assertEqual(
+                get_processed_revisions_files("xz", BlameReport), [
+                    self.result_dir /
+                    "BR-xz-xz-c5c7ceb08a_feeeecb2-1826-49e5-a188-d4d883f06d00_"
+                    "success.yaml"
+                ]
+            )
+            self.assertEqual(
+                get_failed_revisions("xz", BlameReport), ["2f0bc9cd40"]
+            )
+            self.assertEqual(
+                get_supplementary_result_files("xz"), [(
+                    self.result_dir /
+                    "BR-SUPPL-xz-xz-c5c7ceb08a_5f696090-edcc-433e-9dda-"
+                    "a55718f0c02d_trace.json", "c5c7ceb08a", "trace"
+                )]
+            )
+
+    def test_incremental_refresh(self):
+        """Test if only new files are parsed when the directory changes."""
+        with replace_config(), mock.patch.object(
+            result_index_module,
+            "__create_entry",
+            wraps=getattr(result_index_module, "__create_entry")
+        ) as create_mock:
+            self.assertEqual(
+                len(get_result_file_entries(self.result_dir)), len(self.FILES)
+            )
+            self.assertEqual(create_mock.call_count, len(self.FILES))
+
+            with mock.patch.object(
+                result_index_module.os, "listdir", wraps=os.listdir
+            ) as listdir_mock:
+                get_result_file_entries(self.result_dir)
+                listdir_mock.assert_not_called()
+
+            new_file = "BR-xz-xz-ef364d3abc_" \
+                "feeeecb2-1826-49e5-a188-d4d883f06d00_success.yaml"
+            (self.result_dir / new_file).touch()
+            (self.result_dir / "README.md").unlink()
+            self.__age_result_dir(2001)
+            create_mock.reset_mock()
+
+            entries = {
+                entry.name: entry
+                for entry in get_result_file_entries(self.result_dir)
+            }
+            create_mock.assert_called_once_with(self.result_dir, new_file)
+            self.assertNotIn("README.md", entries)
+            self.assertEqual(entries[new_file].commit_hash, "ef364d3abc")
+
+            # a new process loads the stored index
+            getattr(result_index_module, "__RESULT_INDICES").clear()
+            create_mock.reset_mock()
+            self.assertEqual(
+                {
+                    entry.name: entry
+                    for entry in get_result_file_entries(self.result_dir)
+                }, entries
+            )
+            create_mock.assert_not_called()
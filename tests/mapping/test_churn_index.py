@@ -0,0 +1,137 @@
+"""Test the code churn index."""
+
+import tempfile
+import unittest
+import unittest.mock as mock
+from pathlib import Path
+
+import numpy as np
+import pygit2
+
+import varats.mapping.churn_index as churn_index_module
+from tests.test_utils import create_commit
+from varats.mapping.churn_index import CodeChurnIndex, update_churn_index
+from varats.utils.git_util import ChurnConfig, calc_code_churn_range
+
+
+class TestCodeChurnIndex(unittest.TestCase):
+    """Test the creation and the queries of churn indices."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = pygit2.init_repository(
+            str(Path(self.tmp_dir.name) / "repo")
+        )
+        self.repo.set_head("refs/heads/main")
+        self.commits = [
+            create_commit(self.repo, files, commit_time=time)
+            for time, files in enumerate([{
+                "main.c": "a\nb\n"
+            }, {
+                "README": "readme\n"
+            }, {
+                "main.c": "a\nc\nd\n",
+                "util.h": "u\n"
+            }], 1000)
+        ]
+        self.c_config = ChurnConfig.create_c_language_config()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_matches_git_log_churn(self):
+        """Test if the index contains the churn that git log reports."""
+        churn_index = update_churn_index(
+            self.repo, self.commits[-1], self.c_config
+        )
+
+        self.assertEqual(len(churn_index), 3)
+        self.assertEqual([c_hash.decode() for c_hash in churn_index.hashes],
+                         [str(commit) for commit in self.commits])
+        for c_hash, churn in calc_code_churn_range(
+            self.repo, self.c_config
+        ).items():
+            self.assertEqual(churn_index.commit_churn(c_hash), churn)
+        self.assertEqual(
+            churn_index.commit_churn(str(self.commits[2])), (2, 3, 1)
+        )
+        self.assertEqual(churn_index.commit_churn(str(self.commits[1])[:10]),
+                         (0, 0, 0))
+
+    def test_churn_between(self):
+        """Test if range queries sum up the churn of the commits in between."""
+        churn_index = update_churn_index(
+            self.repo, self.commits[-1], ChurnConfig.create_default_config()
+        )
+        first, second, third = [str(commit) for commit in self.commits]
+
+        self.assertEqual(churn_index.churn_between(first, third), (3, 4, 1))
+        self.assertEqual(churn_index.churn_between(third, first), (3, 4, 1))
+        self.assertEqual(churn_index.churn_between(second, third), (2, 3, 1))
+        self.assertEqual(churn_index.churn_between(first, first), (0, 0, 0))
+        self.assertRaises(KeyError, churn_index.churn_between, first, "abc")
+
+    def test_incremental_update(self):
+        """Test if only the churn of new commits is calculated."""
+        churn_index = update_churn_index(
+            self.repo, self.commits[-1], self.c_config
+        )
+        self.assertIs(
+            update_churn_index(
+                self.repo, self.commits[-1], self.c_config, churn_index
+            ), churn_index
+        )
+        new_commit = create_commit(
+            self.repo, {"util.h": "v\n"}, commit_time=1003
+        )
+
+        with mock.patch.object(
+            churn_index_module,
+            "calc_code_churn_of_new_commits",
+            wraps=churn_index_module.calc_code_churn_of_new_commits
+        ) as churn_mock:
+            updated_index = update_churn_index(
+                self.repo, new_commit, self.c_config, churn_index
+            )
+            churn_mock.assert_called_once_with(
+                self.repo, str(new_commit), str(self.commits[-1]),
+                self.c_config
+            )
+
+        self.assertEqual(len(updated_index), 4)
+        self.assertEqual(updated_index.commit_churn(str(new_commit)), (1, 1, 1))
+        self.assertEqual(
+            updated_index.churn_between(str(self.commits[0]), str(new_commit)),
+            (3, 4, 2)
+        )
+
+    def test_rewritten_history(self):
+        """Test if the index is regenerated if the history was rewritten."""
+        churn_index = update_churn_index(
+            self.repo, self.commits[-1], self.c_config
+        )
+        self.repo.references["refs/heads/main"].set_target(self.commits[1])
+        new_commit = create_commit(
+            self.repo, {"other.c": "x\n"}, commit_time=1004
+        )
+
+        updated_index = update_churn_index(
+            self.repo, new_commit, self.c_config, churn_index
+        )
+        self.assertEqual(len(updated_index), 3)
+        self.assertNotIn(str(self.commits[2]), updated_index)
+        self.assertEqual(updated_index.commit_churn(str(new_commit)), (1, 1, 0))
+
+    def test_store_and_load(self):
+        """Test if a stored index can be loaded again."""
+        churn_index = update_churn_index(
+            self.repo, self.commits[-1], self.c_config
+        )
+        index_path = Path(self.tmp_dir.name) / "index.npz"
+        with open(index_path, "wb") as index_file:
+            churn_index.write_to_file(index_file)
+
+        loaded_index = CodeChurnIndex.load_from_file(index_path)
+        np.testing.assert_array_equal(loaded_index.hashes, churn_index.hashes)
+        np.testing.assert_array_equal(loaded_index.churn, churn_index.churn)
+        self.assertEqual(loaded_index.head, str(self.commits[-1]))
@@ -0,0 +1,86 @@
+"""Test commit map generation."""
+
+import tempfile
+import unittest
+import unittest.mock as mock
+from pathlib import Path
+
+import pygit2
+
+import varats.mapping.commit_map as commit_map_module
+from varats.mapping.commit_map import generate_commit_map
+from tests.test_utils import create_commit, replace_config
+
+
+class TestGenerateCommitMap(unittest.TestCase):
+    """Test the incremental commit map generation."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo_path = Path(self.tmp_dir.name) / "repo"
+        self.repo = pygit2.init_repository(str(self.repo_path))
+        self.repo.set_head("refs/heads/main")
+        self.commits = [
+            create_commit(self.repo, message=f"c{idx}", commit_time=1000 + idx)
+            for idx in range(4)
+        ]
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_generate_commit_map(self):
+        """Test if time ids are assigned from old to new commits."""
+        cmap = generate_commit_map(self.repo_path)
+        self.assertEqual([
+            time_id for _, time_id in cmap.mapping_items()
+        ], [0, 1, 2, 3])
+        for time_id, commit in enumerate(self.commits):
+            self.assertEqual(cmap.c_hash(time_id), str(commit))
+
+    def test_commit_range(self):
+        """Test if only the commits of the range are included."""
+        cmap = generate_commit_map(
+            self.repo_path, str(self.commits[2]), str(self.commits[0])
+        )
+        self.assertEqual(
+            list(cmap.mapping_items()), [(str(self.commits[1]), 1),
+                                         (str(self.commits[2]), 2)]
+        )
+
+    @replace_config()
+    def test_incremental_update(self, _):
+        """Test if a persisted map only walks new commits."""
+        generate_commit_map(self.repo_path, project_name="repo")
+        self.commits.append(
+            create_commit(self.repo, message="c4", commit_time=1004)
+        )
+
+        with mock.patch.object(
+            commit_map_module,
+            "walk_commits",
+            wraps=commit_map_module.walk_commits
+        ) as walk_mock:
+            cmap = generate_commit_map(self.repo_path, project_name="repo")
+            walk_mock.assert_called_once_with(
+                mock.ANY, self.commits[4], self.commits[3]
+            )
+
+        self.assertEqual(cmap.time_id(str(self.commits[4])), 4)
+        self.assertEqual(cmap.c_hash(3), str(self.commits[3]))
+
+    @replace_config()
+    def test_rewritten_history(self, _):
+        """Test if a persisted map is regenerated if the history changed."""
+        generate_commit_map(self.repo_path, project_name="repo")
+        self.repo.references["refs/heads/main"].set_target(self.commits[1])
+        new_commit = create_commit(
+            self.repo,
+            message="c2'",
+            commit_time=1005,
+            parents=[self.commits[1]]
+        )
+
+        cmap = generate_commit_map(self.repo_path, project_name="repo")
+        self.assertEqual(len(cmap.mapping_items()), 3)
+        self.assertEqual(cmap.time_id(str(new_commit)), 2)
+        self.assertRaises(KeyError, cmap.time_id, str(self.commits[3]))
@@ -0,0 +1,128 @@
+"""Test the incremental generation of artefacts."""
+import tempfile
+import unittest
+import unittest.mock as mock
+from pathlib import Path
+
+from tests.test_utils import replace_config
+from varats.data.discover_reports import initialize_reports
+from varats.paper_mgmt.artefact_builder import (
+    generate_artefacts,
+    get_artefact_states,
+)
+from varats.paper_mgmt.paper_config import (
+    get_paper_config,
+    load_paper_config,
+)
+from varats.plot.plot import Plot
+from varats.plots.discover_plots import initialize_plots
+from varats.table.table import Table
+from varats.tables.discover_tables import initialize_tables
+
+
+def _mock_plot(plot: Plot):
+    (
+        Path(plot.plot_kwargs["plot_dir"]) /
+        plot.plot_file_name(filetype=plot.plot_kwargs['file_type'])
+    ).touch()
+
+
+def _mock_table(table: Table):
+    (Path(table.table_kwargs["table_dir"]) / table.table_file_name()).touch()
+
+
+class TestArtefactBuilder(unittest.TestCase):
+    """Test which artefacts are generated."""
+
+    @classmethod
+    def setUpClass(cls):
+        initialize_reports()
+        initialize_tables()
+        initialize_plots()
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+        self.result_dir = self.tmp_path / "results" / "xz"
+        self.result_dir.mkdir(parents=True)
+
+        patches = [
+            mock.patch(
+                'varats.table.tables.build_table', side_effect=_mock_table
+            ),
+            mock.patch('varats.plot.plots.build_plot', side_effect=_mock_plot)
+        ]
+        self.build_table_mock, self.build_plot_mock = [
+            patch.start() for patch in patches
+        ]
+        for patch in patches:
+            self.addCleanup(patch.stop)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def __setup_config(self, config) -> None:
+        config['artefacts']['artefacts_dir'] = str(self.tmp_path / "artefacts")
+        config['paper_config']['current_config'] = "test_artefacts_driver"
+        config['result_dir'] = str(self.tmp_path / "results")
+        load_paper_config()
+
+    def test_skip_up_to_date_artefacts(self):
+        """Test if only artefacts with changed inputs or missing outputs are
+        generated again."""
+        with replace_config() as config:
+            self.__setup_config(config)
+            artefacts = list(get_paper_config().get_all_artefacts())
+            (self.tmp_path / "artefacts" / "test_artefacts_driver").mkdir(
+                parents=True
+            )
+
+            self.assertEqual(len(generate_artefacts(artefacts)), 2)
+            self.assertEqual(self.build_table_mock.call_count, 1)
+            self.assertEqual(generate_artefacts(artefacts), [])
+            self.assertEqual(self.build_table_mock.call_count, 1)
+
+            # a missing output file
+            table_artefact = artefacts[1]
+            table_file = table_artefact.get_artefact_file_infos(
+            )[0]["file_name"]
+            (table_artefact.output_path / table_file).unlink()
+            self.assertEqual([
+                (state.artefact.name, state.reason)
+                for state in get_artefact_states(artefacts)
+                if state.reason is not None
+            ], [("Correlation Table", "output files missing")])
+            self.assertEqual(generate_artefacts(artefacts), [table_artefact])
+
+            # a new result file
+            (
+                self.result_dir /
+                "BR-xz-xz-2f0bc9cd40_9e238675-ee7c-4325-8e9f-8ccf6fd3f05c_"
+                "success.yaml"
+            ).touch()
+            self.assertEqual({
+                state.reason for state in get_artefact_states(artefacts)
+            }, {"inputs changed"})
+            self.assertEqual(len(generate_artefacts(artefacts)), 2)
+            self.assertEqual(generate_artefacts(artefacts), [])
+
+    def test_parallel_generation(self):
+        """Test if worker processes generate all outdated artefacts."""
+        with replace_config() as config:
+            self.__setup_config(config)
+            artefacts = list(get_paper_config().get_all_artefacts())
+            (self.tmp_path / "artefacts" / "test_artefacts_driver").mkdir(
+                parents=True
+            )
+
+            self.assertEqual(len(generate_artefacts(artefacts, jobs=2)), 2)
+            for artefact in artefacts:
+                for file_info in artefact.get_artefact_file_infos():
+                    self.assertTrue(
+                        (artefact.output_path / file_info["file_name"]
+                        ).exists()
+                    )
+            self.assertEqual(generate_artefacts(artefacts, jobs=2), [])
+            self.assertEqual(
+                len(generate_artefacts(artefacts, jobs=2, force=True)), 2
+            )
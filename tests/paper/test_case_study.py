@@ -138,6 +138,34 @@ class TestCaseStudy(unittest.TestCase):
         )
         self.assertFalse(self.case_study.has_revision("42"))
 
+    def test_has_revisions_batched(self):
+        """Check if multiple revisions can be looked up at once."""
+        self.assertEqual(
+            self.case_study.has_revisions([
+                "b8b25e7f1593f6dcc20660ff9fb1ed59ede15b7a", "42", "a3",
+                "7620b817357d6f14356afd004ace2da426cf8c36", "f"
+            ]), [True, False, True, True, False]
+        )
+
+    def test_has_revision_after_modification(self):
+        """Check if revisions included later are found in shifted stages."""
+        case_study = CS.CaseStudy("gzip", 1)
+        case_study.include_revisions([("ccc", 3), ("aaa", 1)], 1)
+        case_study.insert_empty_stage(0)
+        case_study.include_revision("bbb", 2, 0)
+        case_study.shift_stage(1, 1)
+
+        self.assertTrue(case_study.has_revision("bb"))
+        self.assertTrue(case_study.has_revision_in_stage("aaa", 3))
+        self.assertTrue(case_study.has_revision_in_stage("ccc", 3))
+        self.assertFalse(case_study.has_revision_in_stage("ccc", 0))
+        self.assertFalse(case_study.has_revision("ab"))
+        self.assertEqual(
+            case_study.has_revisions(["a", "b", "c", "d"]),
+            [True, True, True, False]
+        )
+        self.assertEqual(case_study.stages[3].revisions, ["ccc", "aaa"])
+
     def test_gen_filter(self):
         """Check if the project generates a revision filter."""
         revision_filter = self.case_study.get_revision_filter()
@@ -281,6 +281,41 @@ class TestPaperConfigManager(unittest.TestCase):
         )
         mock_get_tagged_revisions.assert_called()
 
+    @mock.patch('varats.paper_mgmt.case_study.get_tagged_revisions')
+    def test_status_scans_results_once(self, mock_get_tagged_revisions):
+        """Check if the results of a project are only scanned once for the
+        status of all stages and case studies."""
+        mock_get_tagged_revisions.return_value = [
+            ('b8b25e7f15', FileStatusExtension.Success),
+            ('622e9b1d02', FileStatusExtension.Failed)
+        ]
+
+        PCM.get_status(self.case_study, CommitReport, 5, True, False)
+        mock_get_tagged_revisions.assert_called_once()
+
+        mock_get_tagged_revisions.reset_mock()
+        status_maps = PCM.get_revision_status_maps(["gzip", "gzip"],
+                                                   CommitReport, 1)
+        mock_get_tagged_revisions.assert_called_once()
+        self.assertEqual(
+            status_maps, {
+                "gzip": {
+                    'b8b25e7f15': ('b8b25e7f15', FileStatusExtension.Success),
+                    '622e9b1d02': ('622e9b1d02', FileStatusExtension.Failed)
+                }
+            }
+        )
+
+        mock_get_tagged_revisions.reset_mock()
+        status = PCM.get_short_status(
+            self.case_study,
+            CommitReport,
+            5,
+            status_map=status_maps["gzip"]
+        )
+        self.assertEqual(status, 'CS: gzip_1: (  1/10) processed [1/1/0/8/0]')
+        mock_get_tagged_revisions.assert_not_called()
+
     @mock.patch('varats.paper_mgmt.case_study.get_tagged_revisions')
     def test_status_color(self, mock_get_tagged_revisions):
         """
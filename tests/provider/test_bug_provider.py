@@ -1,5 +1,8 @@
 """Test bug_provider and bug modules."""
+import tempfile
+import typing as tp
 import unittest
+from pathlib import Path
 from unittest.mock import create_autospec, patch
 
 import pygit2
@@ -7,18 +10,24 @@ from github.Issue import Issue
 from github.IssueEvent import IssueEvent
 from github.Label import Label
 
+import varats.provider.bug.bug as bug_module
+from tests.test_utils import create_commit, replace_config
 from varats.projects.test_projects.bug_provider_test_repos import (
     BasicBugDetectionTestRepo,
 )
 from varats.provider.bug.bug import (
+    RawBug,
     _has_closed_a_bug,
     _is_closing_message,
     _create_corresponding_pygit_bug,
     _create_corresponding_raw_bug,
-    _filter_all_issue_raw_bugs,
-    _filter_all_issue_pygit_bugs,
-    _filter_all_commit_message_raw_bugs,
-    _filter_all_commit_message_pygit_bugs,
+    find_all_commit_message_raw_bugs,
+    find_all_issue_pygit_bugs,
+    find_all_issue_raw_bugs,
+    find_commit_message_pygit_bugs_by_fix,
+    find_commit_message_raw_bugs_by_fix,
+    find_issue_raw_bugs_by_fix,
+    find_issue_raw_bugs_by_introduction,
 )
 from varats.provider.bug.bug_provider import BugProvider
 
@@ -116,6 +125,7 @@ class TestBugDetectionStrategies(unittest.TestCase):
         # associated commit mock
         issue_commit = create_autospec(pygit2.Commit)
         issue_commit.hex = "1237"
+        issue_commit.peel.return_value = issue_commit
 
         mock_repo = create_autospec(pygit2.Repository)
         mock_repo.revparse_single = create_autospec(
@@ -177,6 +187,7 @@ class TestBugDetectionStrategies(unittest.TestCase):
         def mock_revparse(commit_id: str):
             mock_commit = create_autospec(pygit2.Commit)
             mock_commit.hex = commit_id
+            mock_commit.peel.return_value = mock_commit
             return mock_commit
 
         mock_repo = create_autospec(pygit2.Repository)
@@ -193,117 +204,164 @@ class TestBugDetectionStrategies(unittest.TestCase):
         def mock_get_repo(_project_name: str):
             return mock_repo
 
+        blamed_fixes = []
+
+        def mock_find_introducing_commits(_repo, fixing_commits):
+            blamed_fixes.append(list(fixing_commits))
+            return {
+                fixing_commit: frozenset({"1230"})
+                for fixing_commit in fixing_commits
+            }
+
         with patch(
                 'varats.provider.bug.bug._get_all_issue_events',
                 mock_get_all_issue_events),\
             patch(
                 'varats.provider.bug.bug.get_local_project_git',
-                mock_get_repo):
-
-            # issue filter method for pygit bugs
-            def accept_pybugs(event: IssueEvent):
-                if _has_closed_a_bug(event) and event.commit_id:
-                    return _create_corresponding_pygit_bug(
-                        event.commit_id, mock_repo, event.issue.number
-                    )
-                return None
-
-            # issue filter method for raw bugs
-            def accept_rawbugs(event: IssueEvent):
-                if _has_closed_a_bug(event) and event.commit_id:
-                    return _create_corresponding_raw_bug(
-                        event.commit_id, mock_repo, event.issue.number
-                    )
-                return None
+                mock_get_repo),\
+            patch(
+                'varats.provider.bug.bug.find_introducing_commits',
+                mock_find_introducing_commits):
 
             # create set of fixing IDs of found bugs
             pybug_ids = set(
                 pybug.fixing_commit.hex
-                for pybug in _filter_all_issue_pygit_bugs("", accept_pybugs)
+                for pybug in find_all_issue_pygit_bugs("")
             )
             rawbug_ids = set(
-                rawbug.fixing_commit
-                for rawbug in _filter_all_issue_raw_bugs("", accept_rawbugs)
+                rawbug.fixing_commit for rawbug in find_all_issue_raw_bugs("")
             )
             expected_ids = {"1239", "1240"}
 
             self.assertEqual(pybug_ids, expected_ids)
             self.assertEqual(rawbug_ids, expected_ids)
+            # the introducing commits of all fixes are found in one batch
+            self.assertEqual(blamed_fixes, [["1239", "1240"]] * 2)
 
-    def test_filter_commit_message_bugs(self):
-        """Test on the commit history of a project whether the corresponding set
-        of bugs is created correctly."""
-
-        first_fixing_commit = create_autospec(pygit2.Commit)
-        first_fixing_commit.hex = "1241"
-        first_fixing_commit.message = "Fixed first issue"
-
-        first_non_fixing_commit = create_autospec(pygit2.Commit)
-        first_non_fixing_commit.hex = "1242"
-        first_non_fixing_commit.message = "Added documentation\n" + \
-                                          "Grammar Errors need to be fixed"
+            blamed_fixes.clear()
+            self.assertEqual(
+                find_issue_raw_bugs_by_fix("", "1240"),
+                frozenset({RawBug("1240", {"1230"}, 5)})
+            )
+            self.assertEqual(blamed_fixes, [["1240"]])
+            self.assertEqual(
+                find_issue_raw_bugs_by_introduction("", "1230"),
+                frozenset({
+                    RawBug("1239", {"1230"}, 7),
+                    RawBug("1240", {"1230"}, 5)
+                })
+            )
 
-        second_non_fixing_commit = create_autospec(pygit2.Commit)
-        second_non_fixing_commit.hex = "1243"
-        second_non_fixing_commit.message = "Added feature X"
 
-        second_fixing_commit = create_autospec(pygit2.Commit)
-        second_fixing_commit.hex = "1244"
-        second_fixing_commit.message = "fixes second problem"
+class TestCommitMessageBugScanner(unittest.TestCase):
+    """Test the single pass scanner for bugs in commit messages."""
 
-        # Method that creates simple pygit2 Commit mocks for given ID
-        def mock_revparse(commit_id: str):
-            mock_commit = create_autospec(pygit2.Commit)
-            mock_commit.hex = commit_id
-            return mock_commit
-
-        def mock_walk(_start_id: str, _sort_mode: int):
-            return iter([
-                first_fixing_commit, first_non_fixing_commit,
-                second_non_fixing_commit, second_fixing_commit
-            ])
-
-        mock_repo = create_autospec(pygit2.Repository)
-        mock_repo.revparse_single = create_autospec(
-            pygit2.Repository.revparse_single, side_effect=mock_revparse
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = pygit2.init_repository(
+            str(Path(self.tmp_dir.name) / "repo")
         )
-        mock_repo.walk = create_autospec(
-            pygit2.Repository.walk, side_effect=mock_walk
+        self.repo.set_head("refs/heads/main")
+        self.commits = [
+            str(create_commit(self.repo, message=message, commit_time=time))
+            for time, message in enumerate([
+                "Initial commit", "Fixes crash on startup",
+                "Added documentation\nGrammar Errors need to be fixed",
+                "fix overflow in parser"
+            ], 1000)
+        ]
+        self.repo_patch = patch(
+            'varats.provider.bug.bug.get_local_project_git',
+            return_value=self.repo
         )
+        self.repo_patch.start()
+        getattr(bug_module, "__COMMIT_MESSAGE_BUG_INDICES").clear()
 
-        def mock_get_repo(_project_name: str):
-            return mock_repo
+    def tearDown(self) -> None:
+        self.repo_patch.stop()
+        self.tmp_dir.cleanup()
 
-        with patch(
-            'varats.provider.bug.bug.get_local_project_git', mock_get_repo
-        ):
+    def __assert_scans(
+        self, expected_fixes: tp.Set[str], expected_commits: int
+    ) -> None:
+        scanned_commits = []
+        find_closing_commits = bug_module._find_closing_commits
 
-            # commit filter method for pygit bugs
-            def accept_pybugs(commit: pygit2.Commit):
-                if _is_closing_message(commit.message):
-                    return _create_corresponding_pygit_bug(
-                        commit.hex, mock_repo
-                    )
-                return None
+        def record_scanned_commits(commit_summaries):
+            scanned_commits.extend(commit_summaries)
+            return find_closing_commits(commit_summaries)
 
-            # commit filter method for raw bugs
-            def accept_rawbugs(commit: pygit2.Commit):
-                if _is_closing_message(commit.message):
-                    return _create_corresponding_raw_bug(commit.hex, mock_repo)
-                return None
+        with patch(
+            'varats.provider.bug.bug._find_closing_commits',
+            side_effect=record_scanned_commits
+        ):
+            self.assertEqual({
+                raw_bug.fixing_commit for raw_bug in
+                find_all_commit_message_raw_bugs("scanner_test")
+            }, expected_fixes)
+        self.assertEqual(len(scanned_commits), expected_commits)
+
+    def test_scan_once_per_head(self):
+        """Test if the history is only scanned for new commits."""
+        with replace_config():
+            fixes = {self.commits[1], self.commits[3]}
+            self.__assert_scans(fixes, 4)
+            # the fixing commits of a known head are loaded from the cache
+            getattr(bug_module, "__COMMIT_MESSAGE_BUG_INDICES").clear()
+            self.__assert_scans(fixes, 0)
+
+            self.assertEqual(
+                find_commit_message_raw_bugs_by_fix(
+                    "scanner_test", self.commits[1]
+                ),
+                frozenset({RawBug(self.commits[1], set(), None)})
+            )
+            self.assertEqual(
+                find_commit_message_raw_bugs_by_fix(
+                    "scanner_test", self.commits[2]
+                ), frozenset()
+            )
+            pygit_bugs = find_commit_message_pygit_bugs_by_fix(
+                "scanner_test", self.commits[3]
+            )
+            self.assertEqual([
+                pybug.fixing_commit.message for pybug in pygit_bugs
+            ], ["fix overflow in parser"])
 
-            pybug_ids = set(
-                pybug.fixing_commit.hex for pybug in
-                _filter_all_commit_message_pygit_bugs("", accept_pybugs)
+            new_fix = create_commit(
+                self.repo, message="Fixed typo", commit_time=1004
             )
-            rawbug_ids = set(
-                rawbug.fixing_commit for rawbug in
-                _filter_all_commit_message_raw_bugs("", accept_rawbugs)
+            fixes.add(str(new_fix))
+            self.__assert_scans(fixes, 1)
+
+    def test_fix_only_counts_in_first_line(self):
+        """Test if a fix keyword after the first line of a commit message does
+        not make the commit a fixing commit."""
+        multi_line_message = "Added documentation\n" + \
+                             "Grammar Errors need to be fixed"
+        self.assertFalse(_is_closing_message(multi_line_message))
+        self.assertTrue(_is_closing_message("Fixed first issue"))
+        self.assertTrue(_is_closing_message("fixes second problem"))
+
+        with replace_config():
+            self.assertNotIn(
+                self.commits[2], {
+                    raw_bug.fixing_commit for raw_bug in
+                    find_all_commit_message_raw_bugs("scanner_test")
+                }
             )
-            expected_ids = {"1241", "1244"}
 
-            self.assertEqual(pybug_ids, expected_ids)
-            self.assertEqual(rawbug_ids, expected_ids)
+    def test_parallel_scan(self):
+        """Test if scanning in worker processes finds the same commits."""
+        with replace_config() as config, patch.object(
+            bug_module, "__MIN_COMMITS_PER_SCAN_JOB", 1
+        ):
+            config["cache"]["jobs"] = 2
+            self.assertEqual(
+                getattr(bug_module, "_get_fixing_commits")(
+                    "scanner_test", self.repo
+                ), [self.commits[3], self.commits[1]]
+            )
 
 
 class TestBugProvider(unittest.TestCase):
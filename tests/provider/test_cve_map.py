@@ -0,0 +1,138 @@
+"""Test the generation of CVE maps."""
+
+import tempfile
+import unittest
+import unittest.mock as mock
+from datetime import datetime
+from pathlib import Path
+
+import pygit2
+
+import varats.provider.cve.cve_map as cve_map_module
+from tests.test_utils import create_commit, replace_config
+from varats.provider.cve.cve import CVE, CWE
+from varats.provider.cve.cve_map import generate_cve_map, get_cve_map
+
+
+def _create_cve(cve_id: str, references: frozenset = frozenset()) -> CVE:
+    return CVE(
+        cve_id, 5.0, datetime(2014, 4, 7), frozenset(), references, "",
+        frozenset()
+    )
+
+
+class TestCVEMap(unittest.TestCase):
+    """Test the strategies to map CVEs and CWEs to commits."""
+
+    CWE_478 = CWE(
+        "CWE-478", "Missing Default Case in Switch Statement",
+        "The code does not have a default case in a switch statement."
+    )
+    CWE_20 = CWE("CWE-20", "Improper Input Validation", "")
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo_path = Path(self.tmp_dir.name) / "repo"
+        self.repo = pygit2.init_repository(str(self.repo_path))
+        self.repo.set_head("refs/heads/main")
+        self.commits = [
+            str(create_commit(self.repo, message=message)) for message in [
+                "Initial commit", "Fix CVE-2014-0160 and CWE-478",
+                "Fix CWE-999: Missing Default Case in Switch Statement",
+                "Fix heap overflow", "Also fixes CVE-2014-0160"
+            ]
+        ]
+
+        self.referencing_cve = _create_cve(
+            "CVE-2020-0001",
+            frozenset({
+                "https://example.com/advisory",
+                f"https://github.com/vendor/product/commit/"
+                f"{self.commits[3][:10]}"
+            })
+        )
+        self.found_cves = []
+
+        def find_cve(cve_id: str) -> CVE:
+            self.found_cves.append(cve_id)
+            return _create_cve(cve_id.upper())
+
+        self.patches = [
+            mock.patch.object(
+                cve_map_module,
+                "find_all_cve",
+                return_value=frozenset({self.referencing_cve})
+            ),
+            mock.patch.object(cve_map_module, "find_cve", find_cve),
+            mock.patch.object(
+                cve_map_module,
+                "find_all_cwe",
+                return_value=frozenset({self.CWE_478, self.CWE_20})
+            ),
+            mock.patch.object(cve_map_module, "__CWE_INDEX", None),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self) -> None:
+        for patch in self.patches:
+            patch.stop()
+        self.tmp_dir.cleanup()
+
+    def test_generate_cve_map(self):
+        """Test if CVEs and CWEs are found in messages and references."""
+        cve_map = generate_cve_map(self.repo_path, [("vendor", "product")])
+
+        self.assertEqual(
+            set(cve_map.keys()),
+            {self.commits[1], self.commits[2], self.commits[3], self.commits[4]}
+        )
+        self.assertEqual(
+            cve_map[self.commits[1]]["cve"], {_create_cve("CVE-2014-0160")}
+        )
+        self.assertEqual(cve_map[self.commits[1]]["cwe"], {self.CWE_478})
+        self.assertEqual(cve_map[self.commits[2]]["cve"], set())
+        self.assertEqual(cve_map[self.commits[2]]["cwe"], {self.CWE_478})
+        self.assertEqual(
+            cve_map[self.commits[3]]["cve"], {self.referencing_cve}
+        )
+        self.assertEqual(
+            cve_map[self.commits[4]]["cve"], {_create_cve("CVE-2014-0160")}
+        )
+        # every mentioned CVE is only requested once
+        self.assertEqual(self.found_cves, ["CVE-2014-0160"])
+
+    def test_stored_cve_map(self):
+        """Test if maps are stored per project and head."""
+        with replace_config() as config, mock.patch.object(
+            cve_map_module, "get_local_project_git", return_value=self.repo
+        ), mock.patch.object(
+            cve_map_module,
+            "get_local_project_git_path",
+            return_value=self.repo_path
+        ), mock.patch.object(
+            cve_map_module, "generate_cve_map", wraps=generate_cve_map
+        ) as generate_mock:
+            products = [("vendor", "product")]
+            cve_map = get_cve_map("product", products)
+            self.assertEqual(generate_mock.call_count, 1)
+
+            getattr(cve_map_module, "__CVE_MAPS").clear()
+            self.assertEqual(get_cve_map("product", products), cve_map)
+            self.assertEqual(generate_mock.call_count, 1)
+
+            new_commit = str(
+                create_commit(self.repo, message="Fix CVE-2021-1234")
+            )
+            self.assertEqual(
+                get_cve_map("product", products)[new_commit]["cve"],
+                {_create_cve("CVE-2021-1234")}
+            )
+            self.assertEqual(generate_mock.call_count, 2)
+            # the map of the previous head is removed
+            self.assertEqual(
+                len(
+                    list((Path(str(config["data_cache"])) /
+                          "cve_map").iterdir())
+                ), 1
+            )
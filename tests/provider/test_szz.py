@@ -0,0 +1,97 @@
+"""Test the SZZ-style detection of bug introducing commits."""
+
+import tempfile
+import unittest
+import unittest.mock as mock
+from pathlib import Path
+
+import pygit2
+
+import varats.provider.bug.szz as szz_module
+from tests.test_utils import create_commit, replace_config
+from varats.provider.bug.szz import find_introducing_commits
+
+
+class TestFindIntroducingCommits(unittest.TestCase):
+    """Test blaming the lines removed by fixes."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = pygit2.init_repository(
+            str(Path(self.tmp_dir.name) / "repo")
+        )
+        self.repo.set_head("refs/heads/main")
+
+        self.initial = str(
+            create_commit(self.repo, {"main.c": "1\n2\n3\n4\n5\n"})
+        )
+        self.change_two = str(
+            create_commit(self.repo, {"main.c": "1\ntwo\n3\n4\n5\n"})
+        )
+        # modifies a line of each of the previous commits and adds a file
+        self.fix = str(
+            create_commit(
+                self.repo, {
+                    "main.c": "1\nTWO\n3\nFOUR\n5\n",
+                    "util.c": "u\n"
+                }
+            )
+        )
+        self.fix_util = str(create_commit(self.repo, {"util.c": "U\n"}))
+        getattr(szz_module, "__INTRODUCING_COMMITS").clear()
+        getattr(szz_module, "__BLAME_CACHE").clear()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_blame_removed_lines(self):
+        """Test if the commits that last changed the modified lines are
+        found."""
+        with replace_config():
+            self.assertEqual(
+                find_introducing_commits(
+                    self.repo,
+                    [self.fix, self.fix_util, self.initial, "0" * 40]
+                ), {
+                    self.fix: frozenset({self.initial, self.change_two}),
+                    self.fix_util: frozenset({self.fix}),
+                    self.initial: frozenset(),
+                    "0" * 40: frozenset()
+                }
+            )
+
+    def test_memoized_results(self):
+        """Test if known fixes and blamed files are not processed again."""
+        with replace_config():
+            find_introducing_commits(self.repo, [self.fix])
+
+            with mock.patch.object(
+                pygit2.Repository, "blame", autospec=True
+            ) as blame_mock:
+                self.assertEqual(
+                    find_introducing_commits(self.repo, [self.fix])[self.fix],
+                    frozenset({self.initial, self.change_two})
+                )
+                blame_mock.assert_not_called()
+
+            # recomputing a fix reuses the blame of the parent file
+            getattr(szz_module, "__INTRODUCING_COMMITS").clear()
+            with mock.patch.object(
+                pygit2.Repository, "blame", autospec=True
+            ) as blame_mock:
+                find_introducing_commits(self.repo, [self.fix])
+                blame_mock.assert_not_called()
+
+    def test_parallel_detection(self):
+        """Test if worker processes find the same introducing commits."""
+        with replace_config() as config, mock.patch.object(
+            szz_module, "__MIN_FIXES_PER_JOB", 1
+        ):
+            config["cache"]["jobs"] = 2
+            self.assertEqual(
+                find_introducing_commits(self.repo, [self.fix, self.fix_util]),
+                {
+                    self.fix: frozenset({self.initial, self.change_two}),
+                    self.fix_util: frozenset({self.fix})
+                }
+            )
@@ -9,6 +9,7 @@ from pathlib import Path
 
 import benchbuild.utils.settings
 import plumbum as pb
+import pygit2
 from benchbuild.source import Git, base
 
 import varats.utils.settings as settings
@@ -180,3 +181,43 @@ class DummyGit(Git):
 
     def versions(self) -> tp.List[base.Variant]:
         return []
+
+
+def create_commit(
+    repo: pygit2.Repository,
+    files: tp.Optional[tp.Dict[str, str]] = None,
+    message: str = "commit",
+    commit_time: int = 1000,
+    parents: tp.Optional[tp.List[pygit2.Oid]] = None
+) -> pygit2.Oid:
+    """
+    Create a commit on the ``main`` branch of a pygit2 repository.
+
+    Args:
+        repo: the repository to commit to
+        files: contents of files to add or replace in the tree of the first
+               parent
+        message: the commit message
+        commit_time: author and committer time of the commit
+        parents: parents of the commit; defaults to the current head
+
+    Returns:
+        the id of the new commit
+    """
+    if parents is None:
+        parents = [] if repo.head_is_unborn else [repo.head.target]
+    if parents:
+        parent_tree = repo[parents[0]].peel(pygit2.Commit).tree
+        tree_builder = repo.TreeBuilder(parent_tree)
+    else:
+        tree_builder = repo.TreeBuilder()
+    for file_name, content in (files or {}).items():
+        tree_builder.insert(
+            file_name, repo.create_blob(content.encode()),
+            pygit2.GIT_FILEMODE_BLOB
+        )
+    signature = pygit2.Signature("VaRA", "vara@example.com", commit_time, 0)
+    return repo.create_commit(
+        "refs/heads/main", signature, signature, message, tree_builder.write(),
+        parents
+    )
@@ -0,0 +1,39 @@
+"""Test filesystem utilities."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from varats.utils.filesystem_util import atomic_write
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Test the atomic replacement of files."""
+
+    def test_replaces_file(self):
+        """Check that the written temporary file replaces the target."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / "sub" / "data.json"
+
+            with atomic_write(file_path) as tmp_path:
+                self.assertEqual(tmp_path.parent, file_path.parent)
+                self.assertEqual(tmp_path.suffix, ".json")
+                tmp_path.write_text("new")
+
+            self.assertEqual(file_path.read_text(), "new")
+            self.assertEqual(list(file_path.parent.iterdir()), [file_path])
+
+    def test_keeps_file_on_error(self):
+        """Check that a failed write neither replaces the target nor leaves a
+        temporary file behind."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / "data.json"
+            file_path.write_text("old")
+
+            with self.assertRaises(ValueError):
+                with atomic_write(file_path) as tmp_path:
+                    tmp_path.write_text("partial")
+                    raise ValueError()
+
+            self.assertEqual(file_path.read_text(), "old")
+            self.assertEqual(list(file_path.parent.iterdir()), [file_path])
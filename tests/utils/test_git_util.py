@@ -1,7 +1,18 @@
 """Test VaRA git utilities."""
+import tempfile
+import typing as tp
 import unittest
+from pathlib import Path
 
-from varats.utils.git_util import ChurnConfig, CommitRepoPair
+import pygit2
+
+from varats.utils.git_util import (
+    ChurnConfig,
+    CommitRepoPair,
+    calc_code_churn,
+    calc_code_churn_range,
+)
+from tests.test_utils import create_commit
 
 
 class TestChurnConfig(unittest.TestCase):
@@ -52,6 +63,82 @@ class TestChurnConfig(unittest.TestCase):
             c_style_config.get_extensions_repr("|"), "c|cpp|cxx|h|hpp|hxx"
         )
 
+    def test_default_engine(self):
+        init_config = ChurnConfig.create_default_config()
+        self.assertEqual(init_config.engine, ChurnConfig.Engine.GIT)
+        init_config.engine = ChurnConfig.Engine.PYGIT2
+        self.assertEqual(init_config.engine, ChurnConfig.Engine.PYGIT2)
+
+
+class TestChurnEngines(unittest.TestCase):
+    """Test if the git and the pygit2 churn engines calculate the same
+    churn."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = pygit2.init_repository(
+            str(Path(self.tmp_dir.name) / "repo")
+        )
+        self.repo.set_head("refs/heads/main")
+        self.commits = [
+            self.repo.get(create_commit(self.repo, files, commit_time=time))
+            for time, files in enumerate([{
+                "main.c": "a\nb\n"
+            }, {
+                "README": "readme\n",
+                "lib.cpp": "x\n"
+            }, {
+                "main.c": "a\nc\nd\n",
+                "foo.p": "p\n"
+            }], 1000)
+        ]
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    @staticmethod
+    def __create_configs() -> tp.List[ChurnConfig]:
+        configs = []
+        for create_config in (
+            ChurnConfig.create_default_config,
+            ChurnConfig.create_c_language_config,
+            ChurnConfig.create_c_style_languages_config
+        ):
+            for engine in ChurnConfig.Engine:
+                config = create_config()
+                config.engine = engine
+                configs.append(config)
+        return configs
+
+    def test_calc_code_churn_range(self):
+        """Test if both engines calculate the churn of every commit."""
+        expected_churn = [
+            [(1, 2, 0), (2, 2, 0), (2, 3, 1)],
+            [(1, 2, 0), (0, 0, 0), (1, 2, 1)],
+            [(1, 2, 0), (1, 1, 0), (1, 2, 1)],
+        ]
+        for idx, config in enumerate(self.__create_configs()):
+            churn = calc_code_churn_range(self.repo, config)
+            self.assertEqual([churn[str(commit.id)] for commit in self.commits],
+                             expected_churn[idx // 2], config.engine)
+
+            churn = calc_code_churn_range(
+                self.repo, config, self.commits[1], self.commits[2]
+            )
+            self.assertEqual(
+                set(churn), {str(commit.id) for commit in self.commits[1:]}
+            )
+
+    def test_calc_code_churn(self):
+        """Test if both engines calculate the churn between two commits."""
+        expected_churn = [(4, 5, 1), (1, 2, 1), (2, 3, 1)]
+        for idx, config in enumerate(self.__create_configs()):
+            self.assertEqual(
+                calc_code_churn(
+                    self.repo, self.commits[0], self.commits[2], config
+                ), expected_churn[idx // 2], config.engine
+            )
+
 
 class TestCommitRepoPair(unittest.TestCase):
     """Test driver for the CommitRepoPair class."""
@@ -1,17 +1,31 @@
 """Test github utilities."""
+import json
+import threading
 import typing as tp
 import unittest
+import unittest.mock as mock
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
 
 from github import Github, PaginatedList
 from github.GithubObject import GithubObject, NonCompletableGithubObject
+from github.NamedUser import NamedUser
 from github.PaginatedList import PaginatedListBase
 
-from tests.test_utils import replace_config
+import varats.utils.github_util as github_util_module
+from tests.test_utils import TEST_INPUTS_DIR, replace_config
 from varats.utils.github_util import (
     get_cached_github_object,
+    _cache_pygithub_object_list,
+    _dump_pygithub_object,
     _get_cached_pygithub_object,
     _get_cached_pygithub_object_list,
+    clear_synced_github_object_lists,
     get_cached_github_object_list,
+    get_synced_github_object_list,
 )
 
 
@@ -93,3 +107,256 @@ class TestGithubObjectCache(unittest.TestCase):
             cached_list = _get_cached_pygithub_object_list("demo_github_list")
             self.assertIsNotNone(cached_list)
             self.assertEqual(3, len(cached_list))
+
+
+def create_named_user(login: str) -> NamedUser:
+    return Github().create_from_raw_data(NamedUser, {"login": login})
+
+
+class TestGithubObjectCacheStore(unittest.TestCase):
+    """Test the database that backs the GithubObject cache."""
+
+    def test_cache_object_list(self):
+        """Test storing and replacing a list of GithubObjects."""
+        with replace_config():
+            self.assertIsNone(_get_cached_pygithub_object_list("users"))
+
+            _cache_pygithub_object_list(
+                "users", [create_named_user(f"user{idx}") for idx in range(3)]
+            )
+            self.assertEqual([
+                user.login for user in _get_cached_pygithub_object_list("users")
+            ], ["user0", "user1", "user2"])
+
+            _cache_pygithub_object_list("users", [create_named_user("other")])
+            self.assertEqual([
+                user.login for user in _get_cached_pygithub_object_list("users")
+            ], ["other"])
+
+            _cache_pygithub_object_list("empty", [])
+            self.assertEqual(_get_cached_pygithub_object_list("empty"), [])
+
+    def test_migrate_legacy_cache(self):
+        """Test if the entries of the old CSV cache are imported."""
+        with replace_config() as config:
+            cache_dir = Path(str(config["data_cache"]))
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            legacy_cache_file = cache_dir / "pygithub.csv.gz"
+            pd.DataFrame([
+                {
+                    "key": "user",
+                    "object": _dump_pygithub_object(create_named_user("foo"))
+                },
+                {
+                    "key": "users",
+                    "length": 2
+                },
+                {
+                    "key": "users_0",
+                    "object": _dump_pygithub_object(create_named_user("a"))
+                },
+                {
+                    "key": "users_1",
+                    "object": _dump_pygithub_object(create_named_user("b"))
+                },
+                {
+                    "key": "broken",
+                    "length": 2
+                },
+                {
+                    "key": "broken_0",
+                    "object": _dump_pygithub_object(create_named_user("c"))
+                },
+            ]).to_csv(str(legacy_cache_file), compression="infer")
+
+            self.assertEqual(_get_cached_pygithub_object("user").login, "foo")
+            self.assertEqual([
+                user.login for user in _get_cached_pygithub_object_list("users")
+            ], ["a", "b"])
+            self.assertIsNone(_get_cached_pygithub_object_list("broken"))
+            self.assertFalse(legacy_cache_file.exists())
+
+
+class _RecordedGithubAPI(HTTPServer):
+    """Local stand-in for the GitHub API that serves recorded issue events
+    in pages of two events."""
+
+    PAGE_SIZE = 2
+
+    def __init__(self, recording: tp.Dict[str, tp.Any]) -> None:
+        super().__init__(("127.0.0.1", 0), _RecordedGithubAPIHandler)
+        self.recording = recording
+        self.visible_events = recording["issue_events"]
+        self.requested_pages: tp.List[int] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _RecordedGithubAPIHandler(BaseHTTPRequestHandler):
+    """Request handler of :class:`_RecordedGithubAPI`."""
+
+    server: _RecordedGithubAPI
+
+    # pylint: disable=invalid-name
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        repo_path = "/repos/" + self.server.recording["repository"]["full_name"]
+        headers = {}
+        events_path = repo_path + "/issues/events"
+        if url.path == repo_path:
+            body: tp.Any = self.server.recording["repository"]
+        elif url.path.startswith(events_path + "/"):
+            # single events are requested to complete listed events
+            event_id = int(url.path[len(events_path) + 1:])
+            matching_events = [
+                event for event in self.server.recording["issue_events"]
+                if event["id"] == event_id
+            ]
+            if not matching_events:
+                self.send_error(404)
+                return
+            body = matching_events[0]
+        elif url.path == events_path:
+            page = int(parse_qs(url.query).get("page", ["1"])[0])
+            self.server.requested_pages.append(page)
+            start = (page - 1) * self.server.PAGE_SIZE
+            body = self.server.visible_events[start:start +
+                                              self.server.PAGE_SIZE]
+            if start + self.server.PAGE_SIZE < len(self.server.visible_events):
+                headers["Link"] = (
+                    f"<{self.server.url}{url.path}?page={page + 1}>; "
+                    f"rel=\"next\""
+                )
+        else:
+            self.send_error(404)
+            return
+
+        # recorded urls need to point to the stand-in
+        content = json.dumps(body).replace(
+            "https://api.github.com", self.server.url
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args: tp.Any) -> None:
+        pass
+
+
+class TestGithubObjectListSync(unittest.TestCase):
+    """Test the incremental synchronization of cached GithubObject lists."""
+
+    def setUp(self) -> None:
+        with open(
+            TEST_INPUTS_DIR / "github" / "issue_events.json"
+        ) as recording_file:
+            self.recording = json.load(recording_file)
+        self.api = _RecordedGithubAPI(self.recording)
+        self.api_thread = threading.Thread(target=self.api.serve_forever)
+        self.api_thread.start()
+        self.github_patch = mock.patch.object(
+            github_util_module,
+            "get_github_instance",
+            side_effect=lambda: Github(base_url=self.api.url)
+        )
+        self.github_patch.start()
+        clear_synced_github_object_lists()
+
+    def tearDown(self) -> None:
+        clear_synced_github_object_lists()
+        self.github_patch.stop()
+        self.api.shutdown()
+        self.api.server_close()
+        self.api_thread.join()
+
+    def __sync(self) -> tp.List[int]:
+
+        def load_issue_events(github: Github) -> PaginatedList:
+            return github.get_repo("se-passau/vara-test").get_issues_events()
+
+        return [
+            event.id for event in get_synced_github_object_list(
+                "vara-test_issues_events", load_issue_events,
+                lambda event: event.id
+            )
+        ]
+
+    def test_sync_only_requests_new_events(self):
+        """Test if only pages with new events are requested and merged into
+        the cached list."""
+        with replace_config():
+            # the API only knows the three oldest events
+            self.api.visible_events = self.recording["issue_events"][2:]
+            self.assertEqual(self.__sync(), [1003, 1002, 1001])
+            self.assertEqual(self.api.requested_pages, [1, 2])
+
+            self.api.visible_events = self.recording["issue_events"]
+            self.api.requested_pages.clear()
+            clear_synced_github_object_lists()
+            self.assertEqual(self.__sync(), [1005, 1004, 1003, 1002, 1001])
+            self.assertEqual(self.api.requested_pages, [1, 2])
+
+            self.api.requested_pages.clear()
+            clear_synced_github_object_lists()
+            self.assertEqual(self.__sync(), [1005, 1004, 1003, 1002, 1001])
+            self.assertEqual(self.api.requested_pages, [1])
+
+            cached_events = _get_cached_pygithub_object_list(
+                "vara-test_issues_events"
+            )
+            self.assertEqual(cached_events[-1].event, "closed")
+            self.assertEqual(cached_events[-1].issue.labels[0].name, "bug")
+
+    def test_sync_once_per_process(self):
+        """Test if a list is only synchronized again after the refresh
+        interval."""
+        with replace_config() as config:
+            self.assertEqual(self.__sync(), [1005, 1004, 1003, 1002, 1001])
+            self.api.requested_pages.clear()
+            self.assertEqual(self.__sync(), [1005, 1004, 1003, 1002, 1001])
+            self.assertEqual(self.api.requested_pages, [])
+
+            config["sources"]["refresh_interval"] = 0
+            self.assertEqual(self.__sync(), [1005, 1004, 1003, 1002, 1001])
+            self.assertEqual(self.api.requested_pages, [1])
+
+    def test_offline_uses_cached_list(self):
+        """Test if GitHub is not queried in offline mode."""
+        with replace_config() as config:
+            self.api.visible_events = self.recording["issue_events"][2:]
+            self.assertEqual(self.__sync(), [1003, 1002, 1001])
+
+            clear_synced_github_object_lists()
+            self.api.visible_events = self.recording["issue_events"]
+            self.api.requested_pages.clear()
+            config["sources"]["offline"] = True
+            self.assertEqual(self.__sync(), [1003, 1002, 1001])
+            self.assertEqual(self.api.requested_pages, [])
+
+            clear_synced_github_object_lists()
+            config["data_cache"] = str(Path(str(config["data_cache"])) / "new")
+            self.assertRaises(LookupError, self.__sync)
+
+    def test_unreachable_github_uses_cached_list(self):
+        """Test if the cached list is used if GitHub cannot be reached."""
+        with replace_config():
+            self.api.visible_events = self.recording["issue_events"][2:]
+            self.assertEqual(self.__sync(), [1003, 1002, 1001])
+
+            clear_synced_github_object_lists()
+            self.api.visible_events = self.recording["issue_events"]
+            with mock.patch.object(
+                github_util_module,
+                "get_github_instance",
+                side_effect=lambda: Github(base_url="http://127.0.0.1:1")
+            ), self.assertLogs(github_util_module.LOG, "WARNING"):
+                self.assertEqual(self.__sync(), [1003, 1002, 1001])
+
+            clear_synced_github_object_lists()
+            self.assertEqual(self.__sync(), [1005, 1004, 1003, 1002, 1001])
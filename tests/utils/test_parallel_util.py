@@ -0,0 +1,50 @@
+"""Test parallel processing utilities."""
+
+import os
+import unittest
+
+from tests.test_utils import replace_config
+from varats.utils.parallel_util import fork_map, get_num_jobs
+
+
+class TestGetNumJobs(unittest.TestCase):
+    """Test the resolution of the number of worker processes."""
+
+    def test_explicit_jobs(self):
+        """Check that explicitly requested jobs are used."""
+        self.assertEqual(get_num_jobs(3), 3)
+        self.assertEqual(get_num_jobs(0), os.cpu_count() or 1)
+
+    def test_configured_jobs(self):
+        """Check that the ``cache.jobs`` setting is the default."""
+        with replace_config() as vara_cfg:
+            vara_cfg["cache"]["jobs"] = 2
+            self.assertEqual(get_num_jobs(), 2)
+            vara_cfg["cache"]["jobs"] = 0
+            self.assertEqual(get_num_jobs(), os.cpu_count() or 1)
+
+
+class TestForkMap(unittest.TestCase):
+    """Test mapping functions in forked worker processes."""
+
+    def test_results_are_ordered(self):
+        """Check that unpicklable functions work and that the results keep the
+        order of the items."""
+        offset = 10
+        items = list(range(20))
+        for jobs in (1, 4):
+            self.assertEqual(
+                list(fork_map(lambda item: item + offset, items, jobs)),
+                [item + offset for item in items]
+            )
+
+    def test_nested_map_is_serial(self):
+        """Check that a map inside a worker process does not fork again."""
+
+        def get_pids(_):
+            inner_pids = list(fork_map(lambda _: os.getpid(), [0, 1], 2))
+            return os.getpid(), inner_pids
+
+        for worker_pid, inner_pids in fork_map(get_pids, [0, 1], 2):
+            self.assertNotEqual(worker_pid, os.getpid())
+            self.assertEqual(inner_pids, [worker_pid, worker_pid])
@@ -0,0 +1,100 @@
+"""Test the lazy loading of plugins."""
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from varats.plots.discover_plots import initialize_plots
+from varats.utils.settings import vara_cfg
+
+
+class TestLazyRegistry(unittest.TestCase):
+    """Test that announced plugins are only imported when needed."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        sys.path.insert(0, self.tmp_dir.name)
+        (Path(self.tmp_dir.name) / "lazy_plugin_registry.py").write_text(
+            "from varats.utils.plugin_util import LazyRegistry\n"
+            "REGISTRY = LazyRegistry()\n"
+        )
+        for module_name, plugin_name in [("lazy_plugin_a", "plugin_a"),
+                                         ("lazy_plugin_b", "plugin_b")]:
+            (Path(self.tmp_dir.name) / f"{module_name}.py").write_text(
+                "from lazy_plugin_registry import REGISTRY\n"
+                f"REGISTRY['{plugin_name}'] = '{module_name}'\n"
+            )
+
+        # pylint: disable=import-outside-toplevel,import-error
+        from lazy_plugin_registry import REGISTRY
+        self.registry = REGISTRY
+        self.registry.add_plugin_modules({
+            "plugin_a": "lazy_plugin_a",
+            "plugin_b": "lazy_plugin_b"
+        })
+
+    def tearDown(self) -> None:
+        sys.path.remove(self.tmp_dir.name)
+        for module_name in [
+            "lazy_plugin_registry", "lazy_plugin_a", "lazy_plugin_b"
+        ]:
+            sys.modules.pop(module_name, None)
+        self.tmp_dir.cleanup()
+
+    def test_lookup_imports_only_requested_module(self):
+        """Test if looking up a plugin only imports its module."""
+        self.assertEqual(self.registry.keys(), ["plugin_a", "plugin_b"])
+        self.assertIn("plugin_b", self.registry)
+        self.assertNotIn("lazy_plugin_b", sys.modules)
+
+        self.assertEqual(self.registry["plugin_a"], "lazy_plugin_a")
+        self.assertIn("lazy_plugin_a", sys.modules)
+        self.assertNotIn("lazy_plugin_b", sys.modules)
+        self.assertFalse(self.registry.is_loaded("plugin_b"))
+
+        self.assertRaises(KeyError, lambda: self.registry["plugin_c"])
+        self.assertIsNone(self.registry.get("plugin_c"))
+
+    def test_values_import_all_modules(self):
+        """Test if accessing all plugins imports all announced modules."""
+        self.assertEqual(
+            sorted(self.registry.values()), ["lazy_plugin_a", "lazy_plugin_b"]
+        )
+        self.assertTrue(self.registry.is_loaded("plugin_b"))
+
+
+class TestPluginManifest(unittest.TestCase):
+    """Test the initialization of plugins from the plugin manifest."""
+
+    def test_initialize_from_manifest(self):
+        """Test if a tool that uses one plot only imports the module of this
+        plot once the manifest was generated."""
+        initialize_plots()
+        manifest_dir = Path(str(vara_cfg()["data_cache"])) / "plugin_manifests"
+        self.assertTrue(any(manifest_dir.glob("varats.plots-*.json")))
+
+        output = subprocess.run([
+            sys.executable, "-c",
+            textwrap.dedent(
+                """
+                import sys
+                from varats.plot.plots import PlotRegistry
+                from varats.plots.discover_plots import initialize_plots
+                initialize_plots()
+                assert "case_study_overview_plot" in PlotRegistry.plots
+                print(PlotRegistry.get_class_for_plot_type("repo_churn"))
+                print(" ".join(sys.modules))
+                """
+            )
+        ],
+                                check=True,
+                                capture_output=True,
+                                text=True).stdout.splitlines()
+
+        self.assertIn("repository_churn", output[0])
+        loaded_modules = output[1].split()
+        self.assertIn("varats.plots.repository_churn", loaded_modules)
+        self.assertNotIn("varats.plots.case_study_overview", loaded_modules)
+        self.assertNotIn("varats.plots.blame_lorenz_curve", loaded_modules)
@@ -5,6 +5,7 @@ import unittest.mock as mock
 from os.path import isdir
 from pathlib import Path
 
+import pygit2
 from benchbuild.utils.cmd import git, mkdir
 from plumbum import local
 
@@ -12,6 +13,9 @@ from tests.test_utils import replace_config
 from varats.project.project_util import (
     VaraTestRepoSource,
     VaraTestRepoSubmodule,
+    clear_local_project_git_registry,
+    get_local_project_git,
+    get_local_project_git_path,
 )
 
 
@@ -213,3 +217,63 @@ class TestVaraTestRepoSource(unittest.TestCase):
                             "58ec513",
                             git('rev-parse', '--short', 'HEAD').rstrip()
                         )
+
+
+class TestLocalProjectGitRegistry(unittest.TestCase):
+    """Test that project sources are only fetched when necessary."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        pygit2.init_repository(str(Path(self.tmp_dir.name) / "repo"))
+        self.source = mock.MagicMock()
+        self.source.local = "repo"
+
+        patches = [
+            mock.patch(
+                'varats.project.project_util.get_primary_project_source',
+                return_value=self.source
+            ),
+            mock.patch(
+                'varats.project.project_util.target_prefix',
+                return_value=self.tmp_dir.name
+            )
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        clear_local_project_git_registry()
+
+    def tearDown(self) -> None:
+        clear_local_project_git_registry()
+        self.tmp_dir.cleanup()
+
+    @replace_config()
+    def test_fetch_once(self, _):
+        """Test that a source is only fetched on the first request."""
+        repo_path = get_local_project_git_path("project")
+        self.assertEqual(repo_path, Path(self.tmp_dir.name) / "repo")
+        repo = get_local_project_git("project")
+        self.assertIs(get_local_project_git("project"), repo)
+        self.source.fetch.assert_called_once()
+
+        refreshed_repo = get_local_project_git("project", refresh=True)
+        self.assertEqual(self.source.fetch.call_count, 2)
+        self.assertIsNot(refreshed_repo, repo)
+
+    @replace_config()
+    def test_refresh_interval(self, config):
+        """Test that a source is fetched again after the refresh interval."""
+        config["sources"]["refresh_interval"] = 0
+        get_local_project_git_path("project")
+        get_local_project_git_path("project")
+        self.assertEqual(self.source.fetch.call_count, 2)
+
+    @replace_config()
+    def test_offline(self, config):
+        """Test that sources are never fetched in offline mode."""
+        config["sources"]["offline"] = True
+        get_local_project_git("project", refresh=True)
+        self.source.fetch.assert_not_called()
+
+        self.source.local = "missing_repo"
+        self.assertRaises(LookupError, get_local_project_git_path, "project")
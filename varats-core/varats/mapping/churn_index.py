@@ -0,0 +1,272 @@
+"""
+Persistent index of the code churn of all commits of a project.
+
+The churn index stores the churn of every commit reachable from the refspec of
+a project in time order, oldest first, together with the prefix sums of these
+values. This allows to look up the churn of a single commit or to sum up the
+churn of all commits between two revisions without running git again. Indices
+are stored in the data cache per project, refspec, and set of file extensions,
+and are updated incrementally when new commits appear.
+"""
+
+import logging
+import typing as tp
+from pathlib import Path
+
+import numpy as np
+import pygit2
+
+from varats.mapping.commit_map import CommitMap
+from varats.project.project_util import (
+    get_local_project_git,
+    get_primary_project_source,
+)
+from varats.utils.filesystem_util import atomic_write
+from varats.utils.git_util import (
+    ChurnConfig,
+    calc_code_churn_of_new_commits,
+    walk_commits,
+)
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
+
+CHURN_INDEX_SUFFIX = ".npz"
+
+ChurnTy = tp.Tuple[int, int, int]
+
+
+class CodeChurnIndex():
+    """
+    Time ordered churn values, i.e., (files changed, insertions, deletions), of
+    the commits of a repository.
+
+    Args:
+        hashes: commit hashes as byte strings, ordered from old to new
+        churn: array of shape ``(len(hashes), 3)`` with the churn triple of
+               every commit
+    """
+
+    def __init__(self, hashes: np.ndarray, churn: np.ndarray) -> None:
+        if len(hashes) == 0:
+            hashes = np.array([], dtype="S40")
+            churn = np.zeros((0, 3), dtype=np.int64)
+
+        self.__hashes = hashes
+        self.__churn = churn
+        self.__prefix_sums = np.zeros((len(churn) + 1, 3), dtype=np.int64)
+        np.cumsum(churn, axis=0, out=self.__prefix_sums[1:])
+        self.__positions = CommitMap.create_commit_map(
+            hashes, np.arange(len(hashes), dtype=np.int64)
+        )
+
+    def __len__(self) -> int:
+        return len(self.__hashes)
+
+    def __contains__(self, c_hash: str) -> bool:
+        return c_hash in self.__positions
+
+    @property
+    def head(self) -> tp.Optional[str]:
+        """Hash of the newest commit of the index."""
+        if len(self.__hashes) == 0:
+            return None
+        return tp.cast(str, self.__hashes[-1].decode())
+
+    @property
+    def hashes(self) -> np.ndarray:
+        """Commit hashes as byte strings, ordered from old to new."""
+        return self.__hashes
+
+    @property
+    def churn(self) -> np.ndarray:
+        """Churn triples of all commits, ordered like ``hashes``."""
+        return self.__churn
+
+    def __position(self, c_hash: str) -> int:
+        if len(c_hash) == 40:
+            return self.__positions.time_id(c_hash)
+        return self.__positions.short_time_id(c_hash)
+
+    def commit_churn(self, c_hash: str) -> ChurnTy:
+        """
+        Look up the churn of a single commit.
+
+        Args:
+            c_hash: (short) commit hash
+
+        Returns:
+            churn triple (files changed, insertions, deletions)
+        """
+        files, insertions, deletions = self.__churn[self.__position(c_hash)]
+        return int(files), int(insertions), int(deletions)
+
+    def churn_between(self, c_hash_a: str, c_hash_b: str) -> ChurnTy:
+        """
+        Sum up the churn of all commits after the older and up to the newer one
+        of the two given commits in time order, i.e., ``]a..b]``.
+
+        Args:
+            c_hash_a: (short) commit hash of the first revision
+            c_hash_b: (short) commit hash of the second revision
+
+        Returns:
+            summed up churn triple (files changed, insertions, deletions)
+        """
+        pos_a, pos_b = sorted(
+            (self.__position(c_hash_a), self.__position(c_hash_b))
+        )
+        files, insertions, deletions = (
+            self.__prefix_sums[pos_b + 1] - self.__prefix_sums[pos_a + 1]
+        )
+        return int(files), int(insertions), int(deletions)
+
+    def append_commits(
+        self, c_hashes: tp.Sequence[str],
+        churn_values: tp.Mapping[str, ChurnTy]
+    ) -> 'CodeChurnIndex':
+        """
+        Create a new index that contains all commits of this index followed by
+        the given commits.
+
+        Args:
+            c_hashes: new commit hashes, ordered from old to new
+            churn_values: churn triples of the new commits; missing commits
+                          have no churn
+
+        Returns:
+            the extended ``CodeChurnIndex``
+        """
+        new_churn = np.array(
+            [churn_values.get(c_hash, (0, 0, 0)) for c_hash in c_hashes],
+            dtype=np.int64
+        ).reshape(-1, 3)
+        return CodeChurnIndex(
+            np.concatenate([
+                self.__hashes.astype(bytes),
+                np.array([c_hash.encode() for c_hash in c_hashes],
+                         dtype=bytes)
+            ]).astype(bytes), np.concatenate([self.__churn, new_churn])
+        )
+
+    def write_to_file(self, target_file: tp.BinaryIO) -> None:
+        """
+        Write the index to a binary ``.npz`` file.
+
+        Args:
+            target_file: needs to be a writable binary stream
+        """
+        np.savez(target_file, hash=self.__hashes, churn=self.__churn)
+
+    @staticmethod
+    def load_from_file(index_path: Path) -> 'CodeChurnIndex':
+        """
+        Load an index from a ``.npz`` file.
+
+        Args:
+            index_path: path to the stored index
+
+        Returns:
+            the loaded ``CodeChurnIndex``
+        """
+        with np.load(index_path, allow_pickle=False) as stored_index:
+            return CodeChurnIndex(stored_index["hash"], stored_index["churn"])
+
+
+def __get_churn_index_path(
+    project_name: str, refspec: str, churn_config: ChurnConfig
+) -> Path:
+    extensions = "all" if churn_config.include_everything else \
+        churn_config.get_extensions_repr("_")
+    return Path(str(vara_cfg()["data_cache"])) / "churn_index" / (
+        f"{project_name}-{refspec.replace('/', '_')}-{extensions}"
+        f"{CHURN_INDEX_SUFFIX}"
+    )
+
+
+def update_churn_index(
+    repo: pygit2.Repository,
+    head: pygit2.Oid,
+    churn_config: ChurnConfig,
+    cached_index: tp.Optional[CodeChurnIndex] = None
+) -> CodeChurnIndex:
+    """
+    Update a churn index so that it contains all commits reachable from
+    ``head``, only calculating the churn of commits that are not in the cached
+    index. If the history was rewritten, the index is created from scratch.
+
+    Args:
+        repo: git repository
+        head: newest commit of the index
+        churn_config: churn config to customize churn generation
+        cached_index: previously created index
+
+    Returns:
+        the updated index, or ``cached_index`` if it is up to date
+    """
+    if cached_index is not None and cached_index.head is not None:
+        cached_head = pygit2.Oid(hex=cached_index.head)
+        if cached_head == head:
+            return cached_index
+        if cached_head in repo and repo.descendant_of(head, cached_head):
+            return cached_index.append_commits(
+                walk_commits(repo, head, cached_head),
+                calc_code_churn_of_new_commits(
+                    repo, str(head), str(cached_head), churn_config
+                )
+            )
+        LOG.info("History was rewritten, regenerating churn index.")
+
+    empty_index = CodeChurnIndex(
+        np.array([], dtype="S40"), np.zeros((0, 3), dtype=np.int64)
+    )
+    return empty_index.append_commits(
+        walk_commits(repo, head),
+        calc_code_churn_of_new_commits(
+            repo, str(head), churn_config=churn_config
+        )
+    )
+
+
+def get_churn_index(
+    project_name: str,
+    churn_config: tp.Optional[ChurnConfig] = None
+) -> CodeChurnIndex:
+    """
+    Get the churn index of a project, which contains all commits reachable
+    from the refspec of the project's primary source.
+
+    The index is persisted in the data cache, so only the churn of commits
+    that were added since the last call needs to be calculated.
+
+    Args:
+        project_name: name of the project
+        churn_config: churn config to customize churn generation
+
+    Returns:
+        the up to date churn index of the project
+    """
+    churn_config = ChurnConfig.init_as_default_if_none(churn_config)
+    primary_source = get_primary_project_source(project_name)
+    refspec = "HEAD"
+    if hasattr(primary_source, "refspec"):
+        refspec = primary_source.refspec
+
+    repo = get_local_project_git(project_name)
+    head = repo.revparse_single(refspec).peel(pygit2.Commit).id
+
+    index_path = __get_churn_index_path(project_name, refspec, churn_config)
+    cached_index = None
+    if index_path.exists():
+        try:
+            cached_index = CodeChurnIndex.load_from_file(index_path)
+        except (OSError, ValueError, KeyError):
+            LOG.warning(f"Could not load churn index {index_path}.")
+
+    churn_index = update_churn_index(repo, head, churn_config, cached_index)
+    if churn_index is not cached_index:
+        with atomic_write(index_path) as tmp_index_path:
+            with open(tmp_index_path, "wb") as index_file:
+                churn_index.write_to_file(index_file)
+
+    return churn_index
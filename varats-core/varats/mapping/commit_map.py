@@ -5,27 +5,89 @@ import typing as tp
 from collections.abc import ItemsView
 from pathlib import Path
 
-from benchbuild.utils.cmd import git, mkdir
-from plumbum import local
-from pygtrie import CharTrie
+import numpy as np
+import pygit2
+from benchbuild.utils.cmd import mkdir
 
 from varats.project.project_util import (
     get_local_project_git_path,
     get_primary_project_source,
 )
-from varats.utils.git_util import get_current_branch
+from varats.utils.filesystem_util import atomic_write
+from varats.utils.git_util import walk_commits
+from varats.utils.settings import vara_cfg
 
 LOG = logging.getLogger(__name__)
 
+BINARY_COMMIT_MAP_SUFFIX = ".npy"
+
 
 class CommitMap():
-    """Provides a mapping from commit hash to additional information."""
+    """
+    Provides a mapping from commit hash to additional information.
+
+    The mapping is stored in two arrays: the commit hashes sorted
+    lexicographically together with their time ids, which allows (prefix)
+    lookups of hashes by binary search, and a dense array indexed by time id,
+    which allows constant time lookups of the hash of a time id.
+    """
 
     def __init__(self, stream: tp.Iterable[str]) -> None:
-        self.__hash_to_id: CharTrie = CharTrie()
+        hashes: tp.List[str] = []
+        time_ids: tp.List[int] = []
         for line in stream:
             slices = line.strip().split(', ')
-            self.__hash_to_id[slices[1]] = int(slices[0])
+            hashes.append(slices[1])
+            time_ids.append(int(slices[0]))
+
+        self.__set_mapping(
+            np.array(hashes, dtype=bytes), np.array(time_ids, dtype=np.int64)
+        )
+
+    @classmethod
+    def create_commit_map(
+        cls, hashes: np.ndarray, time_ids: np.ndarray
+    ) -> 'CommitMap':
+        """
+        Create a commit map from an array of commit hashes and an array with
+        the corresponding time ids.
+
+        Args:
+            hashes: commit hashes as byte strings
+            time_ids: time id of every commit hash
+
+        Returns:
+            initialized ``CommitMap``
+        """
+        commit_map = cls.__new__(cls)
+        commit_map.__set_mapping(hashes, time_ids)
+        return commit_map
+
+    def __set_mapping(self, hashes: np.ndarray, time_ids: np.ndarray) -> None:
+        if len(hashes) == 0:
+            hashes = np.array([], dtype="S40")
+
+        if np.all(hashes[:-1] < hashes[1:]):
+            # already sorted and free of duplicates, e.g., a stored map
+            self.__hashes = hashes
+            self.__time_ids = time_ids
+        else:
+            order = np.argsort(hashes, kind="stable")
+            sorted_hashes = hashes[order]
+            # like in a dict, the last entry of a hash wins
+            is_last = np.append(sorted_hashes[1:] != sorted_hashes[:-1], True)
+            self.__hashes = sorted_hashes[is_last]
+            self.__time_ids = time_ids[order][is_last]
+
+        num_time_ids = int(self.__time_ids.max()) + 1 if len(
+            self.__time_ids
+        ) else 0
+        self.__id_to_hash = np.zeros(num_time_ids, dtype=self.__hashes.dtype)
+        self.__id_to_hash[self.__time_ids] = self.__hashes
+
+    def __find_hash(self, c_hash: str) -> int:
+        """Index of the first hash that is not smaller than ``c_hash``."""
+        return int(np.searchsorted(self.__hashes, c_hash.encode()))
 
     def time_id(self, c_hash: str) -> int:
         """
@@ -39,7 +101,38 @@ class CommitMap():
         Returns:
             unique time-ordered id
         """
-        return tp.cast(int, self.__hash_to_id[c_hash])
+        idx = self.__find_hash(c_hash)
+        if idx < len(self.__hashes) and \
+                self.__hashes[idx] == c_hash.encode():
+            return int(self.__time_ids[idx])
+        raise KeyError(c_hash)
+
+    def __contains__(self, c_hash: str) -> bool:
+        idx = self.__find_hash(c_hash)
+        return idx < len(self.__hashes) and \
+            bool(self.__hashes[idx] == c_hash.encode())
+
+    def time_ids(self, c_hashes: tp.Iterable[str]) -> np.ndarray:
+        """
+        Convert multiple commit hashes to their time ids.
+
+        Args:
+            c_hashes: commit hashes
+
+        Returns:
+            array with the time id of every commit hash
+        """
+        lookup_hashes = np.array([c_hash.encode() for c_hash in c_hashes],
+                                 dtype=bytes)
+        if len(lookup_hashes) == 0:
+            return np.array([], dtype=np.int64)
+
+        indices = np.searchsorted(self.__hashes, lookup_hashes)
+        found = indices < len(self.__hashes)
+        found[found] = self.__hashes[indices[found]] == lookup_hashes[found]
+        if not np.all(found):
+            raise KeyError(lookup_hashes[~found][0].decode())
+        return self.__time_ids[indices]
 
     def short_time_id(self, c_hash: str) -> int:
         """
@@ -56,12 +149,15 @@ class CommitMap():
         Returns:
             unique time-ordered id
         """
-        subtrie = self.__hash_to_id.items(prefix=c_hash)
-        if subtrie:
-            if len(subtrie) > 1:
+        prefix = c_hash.encode()
+        idx = self.__find_hash(c_hash)
+        if idx < len(self.__hashes) and \
+                self.__hashes[idx].startswith(prefix):
+            if idx + 1 < len(self.__hashes) and \
+                    self.__hashes[idx + 1].startswith(prefix):
                 LOG.warning(f"Short commit hash is ambiguous: {c_hash}.")
-            return tp.cast(int, subtrie[0][1])
-        raise KeyError
+            return int(self.__time_ids[idx])
+        raise KeyError(c_hash)
 
     def c_hash(self, time_id: int) -> str:
         """
@@ -73,14 +169,43 @@ class CommitMap():
         Returns:
             commit hash
         """
-        for c_hash, t_id in self.__hash_to_id.items():
-            if t_id == time_id:
-                return tp.cast(str, c_hash)
-        raise KeyError
+        if 0 <= time_id < len(self.__id_to_hash):
+            c_hash = self.__id_to_hash[time_id]
+            if c_hash:
+                return tp.cast(str, c_hash.decode())
+        raise KeyError(time_id)
 
     def mapping_items(self) -> tp.ItemsView[str, int]:
         """Get an iterator over the mapping items."""
-        return ItemsView(self.__hash_to_id)
+        return _CommitMapItems(
+            _CommitMapView(self.__hashes, self.__time_ids, self)
+        )
+
+    def append_commits(self, c_hashes: tp.Sequence[str]) -> 'CommitMap':
+        """
+        Create a new commit map that contains all commits of this map and the
+        given commits, which get the time ids following the last time id of
+        this map in the given order.
+
+        Args:
+            c_hashes: new commit hashes, ordered from old to new
+
+        Returns:
+            the extended ``CommitMap``
+        """
+        first_new_id = len(self.__id_to_hash)
+        return CommitMap.create_commit_map(
+            np.concatenate([
+                self.__hashes.astype(bytes),
+                np.array([c_hash.encode() for c_hash in c_hashes], dtype=bytes)
+            ]).astype(bytes),
+            np.concatenate([
+                self.__time_ids,
+                np.arange(
+                    first_new_id, first_new_id + len(c_hashes), dtype=np.int64
+                )
+            ])
+        )
 
     def write_to_file(self, target_file: tp.TextIO) -> None:
         """
@@ -89,69 +214,197 @@ class CommitMap():
         Args:
             target_file: needs to be a writable stream, i.e., support .write()
         """
-        for item in self.__hash_to_id.items():
-            target_file.write("{}, {}\n".format(item[1], item[0]))
+        for c_hash, time_id in self.mapping_items():
+            target_file.write("{}, {}\n".format(time_id, c_hash))
+
+    def write_to_binary_file(self, target_file: tp.BinaryIO) -> None:
+        """
+        Write commit map to a binary ``.npy`` file that can be memory-mapped
+        when loading it.
+
+        Args:
+            target_file: needs to be a writable binary stream
+        """
+        binary_map = np.empty(
+            len(self.__hashes),
+            dtype=[("hash", self.__hashes.dtype), ("time_id", np.int64)]
+        )
+        binary_map["hash"] = self.__hashes
+        binary_map["time_id"] = self.__time_ids
+        np.save(target_file, binary_map, allow_pickle=False)
 
     def __str__(self) -> str:
-        return str(self.__hash_to_id)
+        return "CommitMap({})".format(
+            ", ".join(
+                "{}: {}".format(c_hash, time_id)
+                for c_hash, time_id in self.mapping_items()
+            )
+        )
+
+
+class _CommitMapView(tp.Mapping[str, int]):
+    """Read-only mapping view of a ``CommitMap`` that iterates the commits in
+    time order."""
+
+    def __init__(
+        self, hashes: np.ndarray, time_ids: np.ndarray, commit_map: CommitMap
+    ) -> None:
+        self.__hashes = hashes
+        self.__time_ids = time_ids
+        self.__commit_map = commit_map
+
+    def __getitem__(self, c_hash: str) -> int:
+        return self.__commit_map.time_id(c_hash)
+
+    def __iter__(self) -> tp.Iterator[str]:
+        for c_hash, _ in self.iter_items():
+            yield c_hash
+
+    def __len__(self) -> int:
+        return len(self.__hashes)
+
+    def iter_items(self) -> tp.Iterator[tp.Tuple[str, int]]:
+        """Iterate over all hashes and their time ids in time order."""
+        order = np.argsort(self.__time_ids, kind="stable")
+        for c_hash, time_id in zip(
+            self.__hashes[order].tolist(), self.__time_ids[order].tolist()
+        ):
+            yield c_hash.decode(), time_id
+
+
+class _CommitMapItems(ItemsView):  # type: ignore
+    """Items view of a ``CommitMap`` that iterates the commits in time order
+    without looking up every hash again."""
+
+    _mapping: _CommitMapView
+
+    def __iter__(self) -> tp.Iterator[tp.Tuple[str, int]]:
+        return self._mapping.iter_items()
+
+
+def __get_full_commit_map_path(project_name: str, refspec: str) -> Path:
+    return Path(str(vara_cfg()["data_cache"])) / "commit_maps" / (
+        f"{project_name}-{refspec.replace('/', '_')}"
+        f"{BINARY_COMMIT_MAP_SUFFIX}"
+    )
+
+
+def __update_full_commit_map(
+    repo: pygit2.Repository, head: pygit2.Oid,
+    cached_cmap: tp.Optional[CommitMap]
+) -> CommitMap:
+    """Update a map of all commits reachable from ``head``, only walking
+    commits that are not in the cached map."""
+    if cached_cmap is not None:
+        num_commits = len(cached_cmap.mapping_items())
+        cached_head = pygit2.Oid(hex=cached_cmap.c_hash(num_commits - 1)) \
+            if num_commits else None
+        if cached_head == head:
+            return cached_cmap
+        if cached_head is not None and cached_head in repo and \
+                repo.descendant_of(head, cached_head):
+            return cached_cmap.append_commits(
+                walk_commits(repo, head, cached_head)
+            )
+        LOG.info("History was rewritten, regenerating commit map.")
+
+    c_hashes = walk_commits(repo, head)
+    return CommitMap.create_commit_map(
+        np.array([c_hash.encode() for c_hash in c_hashes], dtype=bytes),
+        np.arange(len(c_hashes), dtype=np.int64)
+    )
 
 
 def generate_commit_map(
     path: Path,
     end: str = "HEAD",
     start: tp.Optional[str] = None,
-    refspec: str = "HEAD"
+    refspec: str = "HEAD",
+    project_name: tp.Optional[str] = None
 ) -> CommitMap:
     """
     Generate a commit map for a repository including the commits.
 
     Range of commits that get included in the map: `]start..end]`
 
+    The history is read with a revwalk, so the repository is not checked out.
+    Time ids are assigned to all commits reachable from ``refspec``, oldest
+    first. If a project name is given, this full map is persisted in the data
+    cache, so later calls only need to walk commits that are newer than the
+    ones already stored. The time ids of stored commits stay stable as long as
+    the history of ``refspec`` is not rewritten.
+
     Args:
         path: to the repository
-        end: last commit that should be included
+        end: last commit that should be included; ``HEAD`` refers to the
+             commit of ``refspec``
         start: parent of the first commit that should be included
-        refspec: that should be checked out
+        refspec: the commits of the map are reachable from
+        project_name: name of the project used to persist the map
 
     Returns: initalized ``CommitMap``
     """
-    search_range = ""
-    if start is not None:
-        search_range += start + ".."
-    search_range += end
-
-    with local.cwd(path):
-        old_head = get_current_branch()
-        git("checkout", refspec)
-        full_out = git("--no-pager", "log", "--pretty=format:'%H'")
-        wanted_out = git(
-            "--no-pager", "log", "--pretty=format:'%H'", search_range
-        )
-
-        def format_stream() -> tp.Generator[str, None, None]:
-            wanted_cm = set()
-            for line in wanted_out.split('\n'):
-                wanted_cm.add(line[1:-1])
-
-            for number, line in enumerate(reversed(full_out.split('\n'))):
-                line = line[1:-1]
-                if line in wanted_cm:
-                    yield "{}, {}\n".format(number, line)
-
-        git("checkout", old_head)
-        return CommitMap(format_stream())
+    repo = pygit2.Repository(pygit2.discover_repository(str(path)))
+    head = repo.revparse_single(refspec).peel(pygit2.Commit).id
+
+    full_cmap_path = __get_full_commit_map_path(
+        project_name, refspec
+    ) if project_name else None
+    cached_cmap = load_commit_map_from_path(full_cmap_path) \
+        if full_cmap_path is not None and full_cmap_path.exists() else None
+
+    full_cmap = __update_full_commit_map(repo, head, cached_cmap)
+    if full_cmap_path is not None and full_cmap is not cached_cmap:
+        with atomic_write(full_cmap_path) as tmp_cmap_path:
+            store_commit_map(full_cmap, str(tmp_cmap_path))
+
+    end_commit = head if end == "HEAD" else repo.revparse_single(end).peel(
+        pygit2.Commit
+    ).id
+    if end_commit == head and start is None:
+        return full_cmap
+
+    wanted_hashes = walk_commits(
+        repo, end_commit,
+        repo.revparse_single(start).peel(pygit2.Commit).id
+        if start is not None else None
+    )
+    wanted_hashes = [c_hash for c_hash in wanted_hashes if c_hash in full_cmap]
+    return CommitMap.create_commit_map(
+        np.array([c_hash.encode() for c_hash in wanted_hashes], dtype=bytes),
+        full_cmap.time_ids(wanted_hashes)
+    )
 
 
 def store_commit_map(cmap: CommitMap, output_file_path: str) -> None:
-    """Store commit map to file."""
+    """
+    Store commit map to file.
+
+    Commit maps are stored in the binary format if the file name ends with
+    ``.npy`` and in the textual ``.cmap`` format otherwise.
+    """
     mkdir("-p", Path(output_file_path).parent)
 
-    with open(output_file_path, "w") as c_map_file:
-        cmap.write_to_file(c_map_file)
+    if output_file_path.endswith(BINARY_COMMIT_MAP_SUFFIX):
+        with open(output_file_path, "wb") as c_map_file:
+            cmap.write_to_binary_file(c_map_file)
+    else:
+        with open(output_file_path, "w") as c_map_file:
+            cmap.write_to_file(c_map_file)
 
 
 def load_commit_map_from_path(cmap_path: Path) -> CommitMap:
-    """Load a commit map from a given `.cmap` file path."""
+    """
+    Load a commit map from a given `.cmap` file path.
+
+    Binary commit maps (`.npy`) are memory-mapped instead of being read.
+    """
+    if str(cmap_path).endswith(BINARY_COMMIT_MAP_SUFFIX):
+        binary_map = np.load(cmap_path, mmap_mode="r", allow_pickle=False)
+        return CommitMap.create_commit_map(
+            binary_map["hash"], binary_map["time_id"]
+        )
+
     with open(cmap_path, "r") as c_map_file:
         return CommitMap(c_map_file.readlines())
 
@@ -182,7 +435,9 @@ def get_commit_map(
         if hasattr(primary_source, "refspec"):
             refspec = primary_source.refspec
 
-        return generate_commit_map(project_git_path, end, start, refspec)
+        return generate_commit_map(
+            project_git_path, end, start, refspec, project_name
+        )
 
     return load_commit_map_from_path(cmap_path)
 
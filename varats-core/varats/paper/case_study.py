@@ -2,6 +2,7 @@
 analysed for a project."""
 
 import typing as tp
+from bisect import bisect_left
 from pathlib import Path
 
 from varats.base.configuration import Configuration
@@ -81,7 +82,9 @@ class CSStage():
     """
     A stage in a case-study, i.e., a collection of revisions.
 
-    Stages are used to separate revisions into groups.
+    Stages are used to separate revisions into groups. Besides the ordered
+    list of revisions, a stage keeps its entries sorted by commit hash, so
+    that (short) revisions can be looked up by binary search.
     """
 
     def __init__(
@@ -96,6 +99,12 @@ class CSStage():
         self.__release_type: tp.Optional[ReleaseType] = release_type
         self.__revisions: tp.List[CSEntry
                                  ] = revisions if revisions is not None else []
+        self.__sorted_entries = sorted(
+            self.__revisions, key=lambda entry: entry.commit_hash
+        )
+        self.__sorted_hashes = [
+            entry.commit_hash for entry in self.__sorted_entries
+        ]
 
     @property
     def revisions(self) -> tp.List[str]:
@@ -143,11 +152,17 @@ class CSStage():
             ``True``, in case the revision is part of the case study,
             ``False`` otherwise.
         """
-        for cs_revision in self.__revisions:
-            if cs_revision.commit_hash.startswith(revision):
-                return True
+        idx = bisect_left(self.__sorted_hashes, revision)
+        return idx < len(self.__sorted_hashes) and \
+            self.__sorted_hashes[idx].startswith(revision)
 
-        return False
+    def __find_entries(self, revision: str) -> tp.Iterator[CSEntry]:
+        """Entries whose commit hash starts with the given revision."""
+        idx = bisect_left(self.__sorted_hashes, revision)
+        while idx < len(self.__sorted_hashes) and \
+                self.__sorted_hashes[idx].startswith(revision):
+            yield self.__sorted_entries[idx]
+            idx += 1
 
     def add_revision(
         self,
@@ -164,7 +179,11 @@ class CSStage():
             config_ids: list of configuration IDs
         """
         if not self.has_revision(revision):
-            self.__revisions.append(CSEntry(revision, commit_id, config_ids))
+            entry = CSEntry(revision, commit_id, config_ids)
+            self.__revisions.append(entry)
+            idx = bisect_left(self.__sorted_hashes, revision)
+            self.__sorted_hashes.insert(idx, revision)
+            self.__sorted_entries.insert(idx, entry)
 
     def get_config_ids_for_revision(self, revision: str) -> tp.List[int]:
         """
@@ -176,8 +195,7 @@ class CSStage():
         Returns: list of config IDs
         """
         return list({
-            config_id for entry in self.__revisions
-            if entry.commit_hash.startswith(revision)
+            config_id for entry in self.__find_entries(revision)
             for config_id in entry.config_ids
         })
 
@@ -308,6 +326,32 @@ class CaseStudy():
 
         return False
 
+    def has_revisions(self, revisions: tp.Iterable[str]) -> tp.List[bool]:
+        """
+        Check for multiple revisions if they are part of this case study.
+
+        Instead of searching every stage for every revision, the revisions of
+        all stages are merged into one sorted list first.
+
+        Args:
+            revisions: (short) project revisions to check
+
+        Returns:
+            for every revision, ``True`` if it was found in one of the stages,
+            ``False`` otherwise
+        """
+        cs_revisions = sorted({
+            cs_revision for stage in self.__stages
+            for cs_revision in stage.revisions
+        })
+
+        def lookup(revision: str) -> bool:
+            idx = bisect_left(cs_revisions, revision)
+            return idx < len(cs_revisions) and \
+                cs_revisions[idx].startswith(revision)
+
+        return [lookup(revision) for revision in revisions]
+
     def has_revision_in_stage(self, revision: str, num_stage: int) -> bool:
         """
         Checks if a revision is in a specific stage.
@@ -6,6 +6,7 @@ from pathlib import Path
 
 from varats.mapping.commit_map import create_lazy_commit_map_loader
 from varats.plot.plot_utils import check_required_args
+from varats.utils.plugin_util import LazyRegistry
 from varats.utils.settings import vara_cfg
 
 if tp.TYPE_CHECKING:
@@ -19,7 +20,7 @@ class PlotRegistry(type):
 
     to_snake_case_pattern = re.compile(r'(?<!^)(?=[A-Z])')
 
-    plots: tp.Dict[str, tp.Type[tp.Any]] = {}
+    plots: LazyRegistry[tp.Type[tp.Any]] = LazyRegistry()
     plots_discovered = False
 
     def __init__(
@@ -1,6 +1,9 @@
 """Utility module for BenchBuild project handling."""
+import importlib
 import logging
 import os
+import threading
+import time
 import typing as tp
 from distutils.dir_util import copy_tree
 from enum import Enum
@@ -12,21 +15,50 @@ import pygit2
 from benchbuild.source import Git, GitSubmodule
 from benchbuild.source.base import target_prefix
 from benchbuild.utils.cmd import git, mkdir, cp
+from benchbuild.utils.revision_ranges import AbstractRevisionRange
 from plumbum import local
 
+from varats.utils.settings import vara_cfg
+
 LOG = logging.getLogger(__name__)
 
+# Registry of the local project repositories that were already fetched or
+# opened in this process, keyed by target prefix, project, and git name.
+__REPOSITORY_LOCK = threading.Lock()
+__LAST_FETCHES: tp.Dict[tp.Tuple[str, str, tp.Optional[str]], float] = {}
+__OPENED_REPOSITORIES: tp.Dict[tp.Tuple[str, str, tp.Optional[str]],
+                               pygit2.Repository] = {}
+# BenchBuild project registry keys of projects that are not imported yet,
+# mapped to the modules that define them
+__PROJECT_MODULES: tp.Dict[str, str] = {}
+
+
+def add_project_modules(project_modules: tp.Mapping[str, str]) -> None:
+    """
+    Announce the modules that define projects without importing them, so that
+    looking up a project only imports the module of this project.
+
+    Args:
+        project_modules: mapping from BenchBuild project registry keys to the
+                         modules that define the projects
+    """
+    for proj, module_name in project_modules.items():
+        if proj not in bb.project.ProjectRegistry.projects:
+            __PROJECT_MODULES[proj] = module_name
+
 
 def get_project_cls_by_name(project_name: str) -> tp.Type[bb.Project]:
     """Look up a BenchBuild project by it's name."""
-    for proj in bb.project.ProjectRegistry.projects:
+    registry = bb.project.ProjectRegistry.projects
+    for proj in dict.fromkeys([*__PROJECT_MODULES, *registry]):
         if proj.endswith('gentoo') or proj.endswith("benchbuild"):
             # currently we only support vara provided projects
             continue
 
         if proj.startswith(project_name):
-            project: tp.Type[bb.Project
-                            ] = bb.project.ProjectRegistry.projects[proj]
+            if proj not in registry:
+                importlib.import_module(__PROJECT_MODULES.pop(proj))
+            project: tp.Type[bb.Project] = registry[proj]
             return project
 
     raise LookupError
@@ -38,17 +70,25 @@ def get_primary_project_source(project_name: str) -> bb.source.FetchableSource:
 
 
 def get_local_project_git_path(
-    project_name: str, git_name: tp.Optional[str] = None
+    project_name: str,
+    git_name: tp.Optional[str] = None,
+    refresh: bool = False
 ) -> Path:
     """
     Get the path to the local download location of a git repository for a given
     benchbuild project.
 
+    Sources are only fetched the first time their repository is requested in a
+    process, when the ``sources/refresh_interval`` has passed since the last
+    fetch, or when a refresh is requested explicitly. In
+    ``sources/offline`` mode, sources are never fetched.
+
     Args:
         project_name: name of the given benchbuild project
         git_name: name of the git repository, i.e., the name of the repository
                   folder. If no git_name is provided, the name of the primary
                   source is used.
+        refresh: fetch the source again, even if it was fetched before
 
     Returns:
         Path to the local download location of the git repository.
@@ -59,10 +99,46 @@ def get_local_project_git_path(
     else:
         source = get_primary_project_source(project_name)
 
-    if is_git_source(source):
-        source.fetch()
+    repo_path = tp.cast(Path, Path(target_prefix()) / source.local)
+    if not is_git_source(source):
+        return repo_path
+
+    repo_key = (str(target_prefix()), project_name, git_name)
+    with __REPOSITORY_LOCK:
+        if __needs_fetch(repo_key, repo_path, refresh):
+            source.fetch()
+            __LAST_FETCHES[repo_key] = time.monotonic()
+            __OPENED_REPOSITORIES.pop(repo_key, None)
+
+    return repo_path
+
+
+def __needs_fetch(
+    repo_key: tp.Tuple[str, str, tp.Optional[str]], repo_path: Path,
+    refresh: bool
+) -> bool:
+    if vara_cfg()["sources"]["offline"]:
+        if not repo_path.exists():
+            raise LookupError(
+                f"The repository {repo_path} is not available locally and "
+                "sources are not fetched in offline mode."
+            )
+        return False
+
+    if refresh or repo_key not in __LAST_FETCHES:
+        return True
+
+    refresh_interval = vara_cfg()["sources"]["refresh_interval"].value
+    return refresh_interval is not None and \
+        time.monotonic() - __LAST_FETCHES[repo_key] >= float(refresh_interval)
+
 
-    return tp.cast(Path, Path(target_prefix()) / source.local)
+def clear_local_project_git_registry() -> None:
+    """Forget which project repositories were already fetched and opened, so
+    that they are fetched and opened again on their next request."""
+    with __REPOSITORY_LOCK:
+        __LAST_FETCHES.clear()
+        __OPENED_REPOSITORIES.clear()
 
 
 def get_extended_commit_lookup_source(
@@ -99,21 +175,34 @@ def get_extended_commit_lookup_source(
 
 
 def get_local_project_git(
-    project_name: str, git_name: tp.Optional[str] = None
+    project_name: str,
+    git_name: tp.Optional[str] = None,
+    refresh: bool = False
 ) -> pygit2.Repository:
     """
     Get the git repository for a given benchbuild project.
 
+    The repository is only opened once per process and reused afterwards,
+    until its source is fetched again.
+
     Args:
         project_name: name of the given benchbuild project
         git_name: name of the git repository
+        refresh: fetch the source again, even if it was fetched before
 
     Returns:
         git repository that matches the given git_name.
     """
-    git_path = get_local_project_git_path(project_name, git_name)
-    repo_path = pygit2.discover_repository(str(git_path))
-    return pygit2.Repository(repo_path)
+    git_path = get_local_project_git_path(project_name, git_name, refresh)
+    repo_key = (str(target_prefix()), project_name, git_name)
+    with __REPOSITORY_LOCK:
+        repo = __OPENED_REPOSITORIES.get(repo_key)
+        if repo is None:
+            repo = pygit2.Repository(
+                pygit2.discover_repository(str(git_path))
+            )
+            __OPENED_REPOSITORIES[repo_key] = repo
+    return repo
 
 
 def get_tagged_commits(project_name: str) -> tp.List[tp.Tuple[str, str]]:
@@ -169,6 +258,55 @@ def is_git_source(source: bb.source.FetchableSource) -> bool:
     return hasattr(source, "fetch")
 
 
+# BenchBuild ships no type information, so mypy sees its decorator as ``Any``
+class block_revisions(  # pylint: disable=invalid-name
+    bb.utils.revision_ranges.block_revisions  # type: ignore[misc]
+):
+    """
+    Decorator for git sources for blocking revisions, like BenchBuild's
+    :class:`~benchbuild.utils.revision_ranges.block_revisions`.
+
+    In addition, the blocked revision ranges are kept on the source, so that
+    all blocked revisions of a project can be computed at once (see
+    :func:`get_blocked_revision_ranges`).
+
+    Args:
+        blocks: A list of :class:`AbstractRevisionRange` s.
+    """
+
+    def __init__(self, blocks: tp.List[AbstractRevisionRange]) -> None:
+        super().__init__(blocks)
+        self.__blocks = blocks
+
+    def __call__(self, git_source: Git) -> Git:
+        git_source = super().__call__(git_source)
+        git_source.blocked_revision_ranges = self.__blocks
+        return git_source
+
+
+def get_blocked_revision_ranges(
+    source: bb.source.FetchableSource
+) -> tp.Optional[tp.List[AbstractRevisionRange]]:
+    """
+    Get the revision ranges that are blocked for a source.
+
+    Args:
+        source: project source
+
+    Returns:
+        the blocked revision ranges, an empty list if the source blocks no
+        revisions, or ``None`` if the source blocks revisions but does not
+        expose its ranges, e.g., because it was decorated with BenchBuild's
+        ``block_revisions`` instead of :class:`block_revisions`
+    """
+    if not hasattr(source, "is_blocked_revision"):
+        return []
+    return tp.cast(
+        tp.Optional[tp.List[AbstractRevisionRange]],
+        getattr(source, "blocked_revision_ranges", None)
+    )
+
+
 class BinaryType(Enum):
     """Enum for different binary types."""
     value: int
@@ -1,6 +1,9 @@
 """Bug Classes used by bug_provider."""
 
 import typing as tp
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 import pygit2
 from github import Github
@@ -11,10 +14,14 @@ from varats.project.project_util import (
     get_local_project_git,
     get_project_cls_by_name,
 )
+from varats.provider.bug.szz import find_introducing_commits
+from varats.utils.filesystem_util import atomic_write
 from varats.utils.github_util import (
-    get_cached_github_object_list,
     get_github_repo_name_for_project,
+    get_synced_github_object_list,
 )
+from varats.utils.parallel_util import get_num_jobs
+from varats.utils.settings import vara_cfg
 
 if tp.TYPE_CHECKING:
     # pylint: disable=ungrouped-imports,unused-import
@@ -148,6 +155,9 @@ def _get_all_issue_events(project_name: str) -> tp.List[IssueEvent]:
     """
     Loads and returns all issue events for a given project.
 
+    Issue events are cached and only events that are newer than the newest
+    cached event are requested from GitHub.
+
     Args:
         project_name: The name of the project to look in.
 
@@ -173,8 +183,9 @@ def _get_all_issue_events(project_name: str) -> tp.List[IssueEvent]:
 
         cache_file_name = github_repo_name.replace("/", "_") + "_issues_events"
 
-        issue_events = get_cached_github_object_list(
-            cache_file_name, load_issue_events
+        # GitHub lists issue events from new to old with increasing ids
+        issue_events = get_synced_github_object_list(
+            cache_file_name, load_issue_events, lambda event: int(event.id)
         )
 
         if issue_events:
@@ -204,10 +215,13 @@ def _create_corresponding_pygit_bug(
 
     closing_pycommit: pygit2.Commit = project_repo.revparse_single(
         closing_commit
-    )
+    ).peel(pygit2.Commit)
 
-    introducing_pycommits: tp.Set[pygit2.Commit] = set()
-    # TODO find introducing commits
+    introducing_pycommits: tp.Set[pygit2.Commit] = {
+        project_repo.revparse_single(introducing_commit).peel(pygit2.Commit)
+        for introducing_commit in
+        find_introducing_commits(project_repo, [closing_commit])[closing_commit]
+    }
 
     return PygitBug(closing_pycommit, introducing_pycommits, issue_number)
 
@@ -230,130 +244,247 @@ def _create_corresponding_raw_bug(
         A RawBug Object or None.
     """
 
-    introducing_ids: tp.Set[str] = set()
-
-    # TODO find introducing commits
+    introducing_ids: tp.Set[str] = set(
+        find_introducing_commits(project_repo, [closing_commit])[closing_commit]
+    )
 
     return RawBug(closing_commit, introducing_ids, issue_number)
 
 
-def _filter_all_issue_pygit_bugs(
-    project_name: str, issue_filter_function: tp.Callable[[IssueEvent],
-                                                          tp.Optional[PygitBug]]
-) -> tp.FrozenSet[PygitBug]:
+def _filter_all_issue_raw_bugs(
+    project_name: str,
+    fix_filter_function: tp.Callable[[str], bool] = lambda _: True
+) -> tp.FrozenSet[RawBug]:
     """
-    Wrapper function that uses given function to filter out a certain type of
-    PygitBugs using issue events.
+    Creates the RawBugs of all issue events that closed a bug with a commit
+    accepted by the given function.
+
+    The introducing commits of all accepted fixes are determined in one batch.
 
     Args:
         project_name: Name of the project to draw the issue events and
             commit history out of.
-        issue_filter_function: Function that determines for an issue event
-            whether it produces an acceptable PygitBug or not.
+        fix_filter_function: Function that determines for the hash of a
+            closing commit whether its bugs are needed.
 
     Returns:
-        The set of PygitBugs considered acceptable by the filtering method.
-    """
-    resulting_pygit_bugs = set()
+        The RawBugs of the accepted closing commits.
+    """
+    bug_fixes = [(issue_event.commit_id, issue_event.issue.number)
+                 for issue_event in _get_all_issue_events(project_name)
+                 if _has_closed_a_bug(issue_event) and
+                 fix_filter_function(issue_event.commit_id)]
+    if not bug_fixes:
+        return frozenset()
+
+    introducing_commits = find_introducing_commits(
+        get_local_project_git(project_name),
+        [closing_commit for closing_commit, _ in bug_fixes]
+    )
+    return frozenset(
+        RawBug(
+            closing_commit, set(introducing_commits[closing_commit]),
+            issue_number
+        ) for closing_commit, issue_number in bug_fixes
+    )
 
-    # iterate over all issue events
-    issue_events = _get_all_issue_events(project_name)
-    for issue_event in issue_events:
-        pybug = issue_filter_function(issue_event)
-        if pybug:
-            resulting_pygit_bugs.add(pybug)
 
-    return frozenset(resulting_pygit_bugs)
+__MIN_COMMITS_PER_SCAN_JOB = 10000
 
 
-def _filter_all_issue_raw_bugs(
-    project_name: str, issue_filter_function: tp.Callable[[IssueEvent],
-                                                          tp.Optional[RawBug]]
-) -> tp.FrozenSet[RawBug]:
+def _find_closing_commits(
+    commit_summaries: tp.List[tp.Tuple[str, str]]
+) -> tp.List[str]:
     """
-    Wrapper function that uses given function to filter out a certain type of
-    RawBugs using issue events.
+    Determines which commits of a batch have a closing message.
 
     Args:
-        project_name: Name of the project to draw the issue events and
-            commit history out of.
-        issue_filter_function: Function that determines for an issue event
-            whether it produces an acceptable RawBug or not.
+        commit_summaries: pairs of commit hash and first line of the commit
+                          message
 
     Returns:
-        The set of RawBugs considered acceptable by the filtering method.
+        the hashes of the commits with a closing message
+    """
+    return [
+        c_hash for c_hash, summary in commit_summaries
+        if _is_closing_message(summary)
+    ]
+
+
+def __scan_commit_messages(
+    project_repo: pygit2.Repository,
+    head: pygit2.Oid,
+    hidden: tp.Optional[pygit2.Oid] = None
+) -> tp.List[str]:
     """
-    resulting_raw_bugs = set()
+    Walks the history once and checks the commit messages in batches.
 
-    # iterate over all issue events
-    issue_events = _get_all_issue_events(project_name)
-    for issue_event in issue_events:
-        rawbug = issue_filter_function(issue_event)
-        if rawbug:
-            resulting_raw_bugs.add(rawbug)
+    Large histories are split between ``cache.jobs`` worker processes.
 
-    return frozenset(resulting_raw_bugs)
+    Returns:
+        the hashes of the commits with a closing message, ordered from new to
+        old
+    """
+    walker = project_repo.walk(head, pygit2.GIT_SORT_TIME)
+    if hidden is not None:
+        walker.hide(hidden)
+    commit_summaries = [
+        (str(commit.id), commit.message.partition('\n')[0]) for commit in walker
+    ]
+
+    jobs = min(
+        get_num_jobs(),
+        len(commit_summaries) // __MIN_COMMITS_PER_SCAN_JOB
+    )
+    if jobs <= 1:
+        return _find_closing_commits(commit_summaries)
 
+    chunk_size = -(-len(commit_summaries) // jobs)
+    with ProcessPoolExecutor(jobs) as executor:
+        return [
+            c_hash for chunk in executor.map(
+                _find_closing_commits, [
+                    commit_summaries[idx:idx + chunk_size]
+                    for idx in range(0, len(commit_summaries), chunk_size)
+                ]
+            ) for c_hash in chunk
+        ]
 
-def _filter_all_commit_message_pygit_bugs(
-    project_name: str,
-    commit_filter_function: tp.Callable[[pygit2.Commit], tp.Optional[PygitBug]]
-) -> tp.FrozenSet[PygitBug]:
+
+def __get_fixing_commits_path(project_name: str) -> Path:
+    return Path(str(vara_cfg()["data_cache"])
+               ) / "bug_scanner" / f"{project_name}-fixing_commits.txt"
+
+
+def _get_fixing_commits(
+    project_name: str, project_repo: pygit2.Repository
+) -> tp.List[str]:
     """
-    Wrapper function that uses given function to filter out a certain type of
-    PygitBugs using the commit history.
+    Finds all commits reachable from the head of a project's repository whose
+    commit message indicates that they fix a bug.
+
+    The result is stored in the data cache together with the head it was
+    computed for, so later calls only scan commits that were added since.
 
     Args:
-        project_name: Name of the project to draw the commit history from.
-        commit_filter_function: Function that determines for a commit
-            whether it produces an acceptable PygitBug or not.
+        project_name: name of the project
+        project_repo: the project's repository
 
     Returns:
-        The set of PygitBugs considered acceptable by the filtering method.
-    """
-    resulting_pygit_bugs = set()
-    project_repo = get_local_project_git(project_name)
+        the hashes of the fixing commits, ordered from new to old
+    """
+    head = project_repo.head.peel(pygit2.Commit).id
+    cache_path = __get_fixing_commits_path(project_name)
+
+    cached_head: tp.Optional[str] = None
+    cached_fixing_commits: tp.List[str] = []
+    if cache_path.exists():
+        cached_lines = cache_path.read_text().split()
+        if cached_lines:
+            cached_head, cached_fixing_commits = (
+                cached_lines[0], cached_lines[1:]
+            )
+
+    if cached_head == str(head):
+        return cached_fixing_commits
 
-    # traverse commit history
-    for commit in project_repo.walk(
-        project_repo.head.target.hex, pygit2.GIT_SORT_TIME
-    ):
-        pybug = commit_filter_function(commit)
-        if pybug:
-            resulting_pygit_bugs.add(pybug)
+    if cached_head is not None and cached_head in project_repo and \
+            project_repo.descendant_of(head, cached_head):
+        fixing_commits = __scan_commit_messages(
+            project_repo, head, pygit2.Oid(hex=cached_head)
+        ) + cached_fixing_commits
+    else:
+        fixing_commits = __scan_commit_messages(project_repo, head)
 
-    return frozenset(resulting_pygit_bugs)
+    with atomic_write(cache_path) as tmp_cache_path:
+        tmp_cache_path.write_text(
+            "\n".join([str(head)] + fixing_commits) + "\n"
+        )
+    return fixing_commits
+
+
+class _CommitMessageBugIndex():
+    """RawBugs found in the commit history of a project, indexed by their
+    fixing and introducing commits."""
+
+    def __init__(self, raw_bugs: tp.Iterable[RawBug]) -> None:
+        self.__by_fix: tp.Dict[str, tp.Set[RawBug]] = defaultdict(set)
+        self.__by_introduction: tp.Dict[str, tp.Set[RawBug]] = defaultdict(set)
+        for raw_bug in raw_bugs:
+            self.__by_fix[raw_bug.fixing_commit].add(raw_bug)
+            for introducing_commit in raw_bug.introducing_commits:
+                self.__by_introduction[introducing_commit].add(raw_bug)
+        self.__bugs = frozenset(
+            raw_bug for raw_bugs_of_fix in self.__by_fix.values()
+            for raw_bug in raw_bugs_of_fix
+        )
 
+    @property
+    def bugs(self) -> tp.FrozenSet[RawBug]:
+        """All bugs of the index."""
+        return self.__bugs
 
-def _filter_all_commit_message_raw_bugs(
-    project_name: str, commit_filter_function: tp.Callable[[pygit2.Commit],
-                                                           tp.Optional[RawBug]]
-) -> tp.FrozenSet[RawBug]:
+    def bugs_by_fix(self, fixing_commit: str) -> tp.FrozenSet[RawBug]:
+        """Bugs fixed by the given commit."""
+        return frozenset(self.__by_fix.get(fixing_commit, ()))
+
+    def bugs_by_introduction(
+        self, introducing_commit: str
+    ) -> tp.FrozenSet[RawBug]:
+        """Bugs introduced by the given commit."""
+        return frozenset(self.__by_introduction.get(introducing_commit, ()))
+
+
+__COMMIT_MESSAGE_BUG_INDICES: tp.Dict[tp.Tuple[str, str],
+                                      _CommitMessageBugIndex] = {}
+
+
+def _get_commit_message_bug_index(
+    project_name: str
+) -> _CommitMessageBugIndex:
     """
-    Wrapper function that uses given function to filter out a certain type of
-    RawBugs using the commit history.
+    Returns the index of all bugs found in the commit history of a project.
+
+    Indices are kept per project and head, so repeated queries do not walk
+    the history again.
 
     Args:
-        project_name: Name of the project to draw the commit history from.
-        commit_filter_function: Function that determines for a commit
-            whether it produces an acceptable RawBug or not.
+        project_name: name of the project
 
     Returns:
-        The set of RawBugs considered acceptable by the filtering method.
+        the bug index for the current head of the project
     """
-    resulting_raw_bugs = set()
     project_repo = get_local_project_git(project_name)
+    index_key = (project_name, str(project_repo.head.target))
+    if index_key not in __COMMIT_MESSAGE_BUG_INDICES:
+        fixing_commits = _get_fixing_commits(project_name, project_repo)
+        # determine the introducing commits of all fixes in one batch
+        find_introducing_commits(project_repo, fixing_commits)
+        __COMMIT_MESSAGE_BUG_INDICES[index_key] = _CommitMessageBugIndex(
+            _create_corresponding_raw_bug(fixing_commit, project_repo)
+            for fixing_commit in fixing_commits
+        )
+    return __COMMIT_MESSAGE_BUG_INDICES[index_key]
 
-    # traverse commit history
-    most_recent_commit = project_repo[project_repo.head.target]
-    for commit in project_repo.walk(
-        most_recent_commit.id, pygit2.GIT_SORT_TIME
-    ):
-        rawbug = commit_filter_function(commit)
-        if rawbug:
-            resulting_raw_bugs.add(rawbug)
 
-    return frozenset(resulting_raw_bugs)
+def __as_pygit_bugs(
+    project_name: str, raw_bugs: tp.FrozenSet[RawBug]
+) -> tp.FrozenSet[PygitBug]:
+    if not raw_bugs:
+        return frozenset()
+    project_repo = get_local_project_git(project_name)
+
+    def get_commit(c_hash: str) -> pygit2.Commit:
+        return project_repo.revparse_single(c_hash).peel(pygit2.Commit)
+
+    return frozenset(
+        PygitBug(
+            get_commit(raw_bug.fixing_commit), {
+                get_commit(introducing_commit)
+                for introducing_commit in raw_bug.introducing_commits
+            }, raw_bug.issue_id
+        ) for raw_bug in raw_bugs
+    )
 
 
 def find_all_issue_pygit_bugs(project_name: str) -> tp.FrozenSet[PygitBug]:
@@ -366,18 +497,7 @@ def find_all_issue_pygit_bugs(project_name: str) -> tp.FrozenSet[PygitBug]:
     Returns:
         A set of PygitBugs.
     """
-
-    def accept_all_issue_pybugs(
-        issue_event: IssueEvent
-    ) -> tp.Optional[PygitBug]:
-        if _has_closed_a_bug(issue_event) and issue_event.commit_id:
-            pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-            return _create_corresponding_pygit_bug(
-                issue_event.commit_id, pygit_repo, issue_event.issue.number
-            )
-        return None
-
-    return _filter_all_issue_pygit_bugs(project_name, accept_all_issue_pybugs)
+    return __as_pygit_bugs(project_name, find_all_issue_raw_bugs(project_name))
 
 
 def find_all_issue_raw_bugs(project_name: str) -> tp.FrozenSet[RawBug]:
@@ -390,18 +510,7 @@ def find_all_issue_raw_bugs(project_name: str) -> tp.FrozenSet[RawBug]:
     Returns:
         A set of RawBugs.
     """
-
-    def accept_all_issue_rawbugs(
-        issue_event: IssueEvent
-    ) -> tp.Optional[RawBug]:
-        if _has_closed_a_bug(issue_event) and issue_event.commit_id:
-            pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-            return _create_corresponding_raw_bug(
-                issue_event.commit_id, pygit_repo, issue_event.issue.number
-            )
-        return None
-
-    return _filter_all_issue_raw_bugs(project_name, accept_all_issue_rawbugs)
+    return _filter_all_issue_raw_bugs(project_name)
 
 
 def find_issue_pygit_bugs_by_fix(project_name: str,
@@ -417,21 +526,8 @@ def find_issue_pygit_bugs_by_fix(project_name: str,
     Returns:
         A set of PygitBugs fixed by fixing_commit
     """
-
-    def accept_issue_pybug_with_certain_fix(
-        issue_event: IssueEvent
-    ) -> tp.Optional[PygitBug]:
-        if _has_closed_a_bug(issue_event) and issue_event.commit_id:
-            pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-            pybug = _create_corresponding_pygit_bug(
-                issue_event.commit_id, pygit_repo, issue_event.issue.number
-            )
-            if pybug.fixing_commit.hex == fixing_commit:
-                return pybug
-        return None
-
-    return _filter_all_issue_pygit_bugs(
-        project_name, accept_issue_pybug_with_certain_fix
+    return __as_pygit_bugs(
+        project_name, find_issue_raw_bugs_by_fix(project_name, fixing_commit)
     )
 
 
@@ -448,21 +544,9 @@ def find_issue_raw_bugs_by_fix(project_name: str,
     Returns:
         A set of RawBugs fixed by fixing_commit
     """
-
-    def accept_issue_rawbug_with_certain_fix(
-        issue_event: IssueEvent
-    ) -> tp.Optional[RawBug]:
-        if _has_closed_a_bug(issue_event) and issue_event.commit_id:
-            pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-            rawbug = _create_corresponding_raw_bug(
-                issue_event.commit_id, pygit_repo, issue_event.issue.number
-            )
-            if rawbug.fixing_commit == fixing_commit:
-                return rawbug
-        return None
-
+    # only the introducing commits of the requested fix are needed
     return _filter_all_issue_raw_bugs(
-        project_name, accept_issue_rawbug_with_certain_fix
+        project_name, lambda closing_commit: closing_commit == fixing_commit
     )
 
 
@@ -480,24 +564,9 @@ def find_issue_pygit_bugs_by_introduction(
     Returns:
         A set of PygitBugs introduced by introducing_commit
     """
-
-    def accept_issue_pybug_with_certain_introduction(
-        issue_event: IssueEvent
-    ) -> tp.Optional[PygitBug]:
-        if _has_closed_a_bug(issue_event) and issue_event.commit_id:
-            pygit_repo = get_local_project_git(project_name)
-            pybug = _create_corresponding_pygit_bug(
-                issue_event.commit_id, pygit_repo, issue_event.issue.number
-            )
-
-            for introducing_pycommit in pybug.introducing_commits:
-                if introducing_pycommit.hex == introducing_commit:
-                    return pybug
-                    # found wanted ID
-        return None
-
-    return _filter_all_issue_pygit_bugs(
-        project_name, accept_issue_pybug_with_certain_introduction
+    return __as_pygit_bugs(
+        project_name,
+        find_issue_raw_bugs_by_introduction(project_name, introducing_commit)
     )
 
 
@@ -515,24 +584,9 @@ def find_issue_raw_bugs_by_introduction(
     Returns:
         A set of RawBugs introduced by introducing_commit
     """
-
-    def accept_issue_rawbug_with_certain_introduction(
-        issue_event: IssueEvent
-    ) -> tp.Optional[RawBug]:
-        if _has_closed_a_bug(issue_event) and issue_event.commit_id:
-            pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-            rawbug = _create_corresponding_raw_bug(
-                issue_event.commit_id, pygit_repo, issue_event.issue.number
-            )
-
-            for introducing_id in rawbug.introducing_commits:
-                if introducing_id == introducing_commit:
-                    return rawbug
-                    # found wanted ID
-        return None
-
-    return _filter_all_issue_raw_bugs(
-        project_name, accept_issue_rawbug_with_certain_introduction
+    return frozenset(
+        raw_bug for raw_bug in _filter_all_issue_raw_bugs(project_name)
+        if introducing_commit in raw_bug.introducing_commits
     )
 
 
@@ -548,17 +602,9 @@ def find_all_commit_message_pygit_bugs(
     Returns:
         A set of PygitBugs
     """
-
-    def accept_all_commit_message_pybugs(
-        commit: pygit2.Commit
-    ) -> tp.Optional[PygitBug]:
-        if _is_closing_message(commit.message):
-            pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-            return _create_corresponding_pygit_bug(commit.hex, pygit_repo)
-        return None
-
-    return _filter_all_commit_message_pygit_bugs(
-        project_name, accept_all_commit_message_pybugs
+    return __as_pygit_bugs(
+        project_name,
+        _get_commit_message_bug_index(project_name).bugs
     )
 
 
@@ -570,27 +616,16 @@ def find_all_commit_message_raw_bugs(project_name: str) -> tp.FrozenSet[RawBug]:
         project_name: Name of the project in which to search for bugs
 
     Returns:
-        A set of PygitBugs
+        A set of RawBugs
     """
-
-    def accept_all_commit_message_rawbugs(
-        commit: pygit2.Commit
-    ) -> tp.Optional[RawBug]:
-        if _is_closing_message(commit.message):
-            pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-            return _create_corresponding_raw_bug(commit.hex, pygit_repo)
-        return None
-
-    return _filter_all_commit_message_raw_bugs(
-        project_name, accept_all_commit_message_rawbugs
-    )
+    return _get_commit_message_bug_index(project_name).bugs
 
 
 def find_commit_message_pygit_bugs_by_fix(
     project_name: str, fixing_commit: str
 ) -> tp.FrozenSet[PygitBug]:
     """
-    Traverses the commit history of given project to find the bug associated to
+    Uses the commit history of given project to find the bug associated to
     some fixing commit, if there is any.
 
     Args:
@@ -600,27 +635,15 @@ def find_commit_message_pygit_bugs_by_fix(
     Returns:
         A set of PygitBugs fixed by fixing_commit
     """
-
-    def accept_commit_message_pybug_with_certain_fix(
-        commit: pygit2.Commit
-    ) -> tp.Optional[PygitBug]:
-        if _is_closing_message(commit.message):
-            pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-            pybug = _create_corresponding_pygit_bug(commit.hex, pygit_repo)
-            if pybug.fixing_commit.hex == fixing_commit:
-                return pybug
-        return None
-
-    return _filter_all_commit_message_pygit_bugs(
-        project_name, accept_commit_message_pybug_with_certain_fix
-    )
+    bug_index = _get_commit_message_bug_index(project_name)
+    return __as_pygit_bugs(project_name, bug_index.bugs_by_fix(fixing_commit))
 
 
 def find_commit_message_raw_bugs_by_fix(
     project_name: str, fixing_commit: str
 ) -> tp.FrozenSet[RawBug]:
     """
-    Traverses the commit history of given project to find the bug associated to
+    Uses the commit history of given project to find the bug associated to
     some fixing commit, if there is any.
 
     Args:
@@ -630,28 +653,16 @@ def find_commit_message_raw_bugs_by_fix(
     Returns:
         A set of RawBugs fixed by fixing_commit
     """
-
-    def accept_commit_message_rawbug_with_certain_fix(
-        commit: pygit2.Commit
-    ) -> tp.Optional[RawBug]:
-        if _is_closing_message(commit.message):
-            pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-            rawbug = _create_corresponding_raw_bug(commit.hex, pygit_repo)
-            if rawbug.fixing_commit == fixing_commit:
-                return rawbug
-        return None
-
-    return _filter_all_commit_message_raw_bugs(
-        project_name, accept_commit_message_rawbug_with_certain_fix
-    )
+    bug_index = _get_commit_message_bug_index(project_name)
+    return bug_index.bugs_by_fix(fixing_commit)
 
 
 def find_commit_message_pygit_bugs_by_introduction(
     project_name: str, introducing_commit: str
 ) -> tp.FrozenSet[PygitBug]:
     """
-    Create a (potentially empty) list of bugs introduced by a certain commit by
-    traversing the commit history of given project.
+    Create a (potentially empty) list of bugs introduced by a certain commit
+    using the commit history of given project.
 
     Args:
         project_name: Name of the project in which to search for bugs
@@ -660,21 +671,9 @@ def find_commit_message_pygit_bugs_by_introduction(
     Returns:
         A set of PygitBugs introduced by introducing_commit
     """
-
-    def accept_commit_message_pybug_with_certain_introduction(
-        commit: pygit2.Commit
-    ) -> tp.Optional[PygitBug]:
-        if _is_closing_message(commit.message):
-            pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-            pybug = _create_corresponding_pygit_bug(commit.hex, pygit_repo)
-
-            for introducing_pycommit in pybug.introducing_commits:
-                if introducing_pycommit.hex == introducing_commit:
-                    return pybug
-        return None
-
-    return _filter_all_commit_message_pygit_bugs(
-        project_name, accept_commit_message_pybug_with_certain_introduction
+    bug_index = _get_commit_message_bug_index(project_name)
+    return __as_pygit_bugs(
+        project_name, bug_index.bugs_by_introduction(introducing_commit)
     )
 
 
@@ -682,29 +681,15 @@ def find_commit_message_raw_bugs_by_introduction(
     project_name: str, introducing_commit: str
 ) -> tp.FrozenSet[RawBug]:
     """
-    Create a (potentially empty) list of bugs introduced by a certain commit by
-    traversing the commit history of given project.
+    Create a (potentially empty) list of bugs introduced by a certain commit
+    using the commit history of given project.
 
     Args:
         project_name: Name of the project in which to search for bugs
         introducing_commit: Commit Hash of the introducing commit to look for
 
     Returns:
-        A set of PygitBugs introduced by introducing_commit
+        A set of RawBugs introduced by introducing_commit
     """
-
-    def accept_commit_message_rawbug_with_certain_introduction(
-        commit: pygit2.Commit
-    ) -> tp.Optional[RawBug]:
-        if _is_closing_message(commit.message):
-            pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-            rawbug = _create_corresponding_raw_bug(commit.hex, pygit_repo)
-
-            for introducing_id in rawbug.introducing_commits:
-                if introducing_id == introducing_commit:
-                    return rawbug
-        return None
-
-    return _filter_all_commit_message_raw_bugs(
-        project_name, accept_commit_message_rawbug_with_certain_introduction
-    )
+    bug_index = _get_commit_message_bug_index(project_name)
+    return bug_index.bugs_by_introduction(introducing_commit)
@@ -0,0 +1,189 @@
+"""
+SZZ-style detection of the commits that introduced a bug.
+
+A fixing commit is assumed to remove or modify the lines that caused the bug.
+The commits that last changed these lines before the fix, as reported by
+blaming the parent of the fixing commit, are considered to have introduced the
+bug.
+"""
+
+import logging
+import typing as tp
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import pygit2
+
+from varats.utils.parallel_util import get_num_jobs
+
+LOG = logging.getLogger(__name__)
+
+__MIN_FIXES_PER_JOB = 50
+__MAX_CACHED_BLAMES = 1024
+
+BlameHunksTy = tp.Tuple[tp.List[int], tp.List[str]]
+
+# (repo path, file path, commit) -> (hunk start lines, hunk commits)
+__BLAME_CACHE: 'OrderedDict[tp.Tuple[str, str, str], BlameHunksTy]' = \
+    OrderedDict()
+# (repo path, fixing commit) -> introducing commits
+__INTRODUCING_COMMITS: tp.Dict[tp.Tuple[str, str], tp.FrozenSet[str]] = {}
+
+
+def __get_removed_lines(
+    repo: pygit2.Repository, fixing_commit: pygit2.Commit
+) -> tp.Dict[str, tp.List[int]]:
+    """
+    Collects the lines of the parent of a fixing commit that the fix removed
+    or modified.
+
+    Returns:
+        mapping from file paths in the parent to 1-based line numbers
+    """
+    removed_lines: tp.Dict[str, tp.List[int]] = {}
+    diff = repo.diff(
+        fixing_commit.parents[0], fixing_commit, context_lines=0
+    )
+    for patch in diff:
+        if patch is None:
+            # unmodified deltas have no patch
+            continue
+        delta = patch.delta
+        if delta.status == pygit2.GIT_DELTA_ADDED or delta.is_binary:
+            continue
+        lines = [
+            line for hunk in patch.hunks
+            for line in range(hunk.old_start, hunk.old_start + hunk.old_lines)
+        ]
+        if lines:
+            removed_lines[delta.old_file.path] = lines
+    return removed_lines
+
+
+def __blame_lines(
+    repo: pygit2.Repository, file_path: str, commit_id: pygit2.Oid,
+    lines: tp.Iterable[int]
+) -> tp.Set[str]:
+    """
+    Looks up the commits that last changed the given lines of a file.
+
+    Blame results are memoized per file and commit.
+    """
+    cache_key = (repo.path, file_path, str(commit_id))
+    blame_hunks = __BLAME_CACHE.get(cache_key)
+    if blame_hunks is None:
+        blame = repo.blame(file_path, newest_commit=commit_id)
+        blame_hunks = (
+            [hunk.final_start_line_number for hunk in blame],
+            [str(hunk.final_commit_id) for hunk in blame],
+        )
+        __BLAME_CACHE[cache_key] = blame_hunks
+        if len(__BLAME_CACHE) > __MAX_CACHED_BLAMES:
+            __BLAME_CACHE.popitem(last=False)
+    else:
+        __BLAME_CACHE.move_to_end(cache_key)
+
+    start_lines, c_hashes = blame_hunks
+    return {c_hashes[bisect_right(start_lines, line) - 1] for line in lines}
+
+
+def _calc_introducing_commits(
+    repo: tp.Union[pygit2.Repository, str], fixing_commits: tp.List[str]
+) -> tp.Dict[str, tp.FrozenSet[str]]:
+    """
+    Determines the introducing commits of a batch of fixing commits.
+
+    The removed lines of all fixes are collected first, so that every file of
+    a parent commit is only blamed once, even if several fixes share it.
+
+    Args:
+        repo: git repository or path to it
+        fixing_commits: hashes of the fixing commits
+
+    Returns:
+        mapping from fixing commits to their introducing commits
+    """
+    if isinstance(repo, str):
+        repo = pygit2.Repository(repo)
+    introducing_commits: tp.Dict[str, tp.Set[str]] = {}
+    # (parent, file path) -> fixing commit -> removed lines
+    blame_requests: tp.Dict[tp.Tuple[pygit2.Oid, str],
+                            tp.Dict[str, tp.List[int]]] = defaultdict(dict)
+
+    for fixing_commit in fixing_commits:
+        introducing_commits[fixing_commit] = set()
+        try:
+            commit = repo.revparse_single(fixing_commit).peel(pygit2.Commit)
+        except (KeyError, ValueError):
+            LOG.debug(f"Fixing commit {fixing_commit} is not in {repo.path}.")
+            continue
+        # fixes without parent cannot modify existing lines and the changes
+        # of merges were introduced by their parents
+        if len(commit.parents) != 1:
+            continue
+        for file_path, lines in __get_removed_lines(repo, commit).items():
+            blame_requests[(commit.parent_ids[0],
+                            file_path)][fixing_commit] = lines
+
+    for (parent_id, file_path), requested_lines in blame_requests.items():
+        for fixing_commit, lines in requested_lines.items():
+            introducing_commits[fixing_commit].update(
+                __blame_lines(repo, file_path, parent_id, lines)
+            )
+
+    return {
+        fixing_commit: frozenset(commits)
+        for fixing_commit, commits in introducing_commits.items()
+    }
+
+
+def find_introducing_commits(
+    repo: pygit2.Repository, fixing_commits: tp.Iterable[str]
+) -> tp.Dict[str, tp.FrozenSet[str]]:
+    """
+    Finds the commits that introduced the bugs fixed by the given commits.
+
+    Results are memoized per repository and fixing commit. Large batches of
+    new fixing commits are split between ``cache.jobs`` worker processes.
+
+    Args:
+        repo: git repository
+        fixing_commits: hashes of the fixing commits
+
+    Returns:
+        mapping from fixing commits to their introducing commits
+    """
+    repo_path = repo.path
+    fixing_commits = list(dict.fromkeys(fixing_commits))
+    missing_commits = [
+        fixing_commit for fixing_commit in fixing_commits
+        if (repo_path, fixing_commit) not in __INTRODUCING_COMMITS
+    ]
+
+    if missing_commits:
+        jobs = min(get_num_jobs(), len(missing_commits) // __MIN_FIXES_PER_JOB)
+
+        if jobs <= 1:
+            new_introducing_commits = _calc_introducing_commits(
+                repo, missing_commits
+            )
+        else:
+            chunk_size = -(-len(missing_commits) // jobs)
+            new_introducing_commits = {}
+            with ProcessPoolExecutor(jobs) as executor:
+                for chunk_result in executor.map(
+                    _calc_introducing_commits, [repo_path] * jobs, [
+                        missing_commits[idx:idx + chunk_size]
+                        for idx in range(0, len(missing_commits), chunk_size)
+                    ]
+                ):
+                    new_introducing_commits.update(chunk_result)
+
+        for fixing_commit, commits in new_introducing_commits.items():
+            __INTRODUCING_COMMITS[(repo_path, fixing_commit)] = commits
+
+    return {
+        fixing_commit: __INTRODUCING_COMMITS[(repo_path, fixing_commit)]
+        for fixing_commit in fixing_commits
+    }
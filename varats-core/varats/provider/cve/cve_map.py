@@ -25,9 +25,13 @@ Example Output::
         [..]
     }
 """
+import hashlib
 import logging
+import pickle  # nosec
 import re
+import time
 import typing as tp
+from bisect import bisect_left
 from collections import defaultdict
 from pathlib import Path
 
@@ -36,17 +40,37 @@ from packaging.version import LegacyVersion, Version
 from packaging.version import parse as parse_version
 from plumbum import local
 
+from varats.project.project_util import (
+    get_local_project_git,
+    get_local_project_git_path,
+)
 from varats.provider.cve.cve import (
     CVE,
     CWE,
     find_all_cve,
     find_all_cwe,
     find_cve,
-    find_cwe,
 )
+from varats.utils.filesystem_util import atomic_write
+from varats.utils.settings import vara_cfg
 
 LOG = logging.getLogger(__name__)
 
+CVEMapTy = tp.Dict[str, tp.Dict[str, tp.Set[tp.Union[CVE, CWE]]]]
+
+# CVE IDs include the old format with just 4 numbers at the end, as well as
+# the new one with 8
+__CVE_CWE_ID_PATTERN = re.compile(
+    r'(CVE-\d{4}-\d{4,8})|(CWE-[\d\-]+\d)', re.IGNORECASE
+)
+__COMMIT_REFERENCE_PATTERN = re.compile(
+    r'/commit/([0-9a-f]{4,40})', re.IGNORECASE
+)
+
+# stored CVE maps are regenerated after a week, like cached CVE requests
+__CVE_MAP_MAX_AGE = 604800
+__CVE_MAP_SUFFIX = ".pickle"
+
 
 def __n_grams(
     text: str,
@@ -75,6 +99,38 @@ def __n_grams(
     return results
 
 
+class _CWEIndex(tp.NamedTuple):
+    """Lookup tables for all CWEs."""
+
+    by_id: tp.Dict[str, CWE]
+    by_text: tp.Dict[str, tp.FrozenSet[CWE]]
+    by_n_grams: tp.Dict[tp.FrozenSet[str], tp.FrozenSet[CWE]]
+
+
+__CWE_INDEX: tp.Optional[_CWEIndex] = None
+
+
+def __get_cwe_index() -> _CWEIndex:
+    """Build the CWE lookup tables once per process."""
+    # pylint:  disable=W0603
+    global __CWE_INDEX
+    if __CWE_INDEX is None:
+        by_text: tp.Dict[str, tp.Set[CWE]] = defaultdict(set)
+        by_n_grams: tp.Dict[tp.FrozenSet[str], tp.Set[CWE]] = defaultdict(set)
+        all_cwe = find_all_cwe()
+        for cwe in all_cwe:
+            for text in (cwe.name, cwe.description):
+                if text:
+                    by_text[text].add(cwe)
+                by_n_grams[frozenset(__n_grams(text=text))].add(cwe)
+        __CWE_INDEX = _CWEIndex(
+            {cwe.cwe_id: cwe for cwe in all_cwe},
+            {text: frozenset(cwes) for text, cwes in by_text.items()},
+            {n_grams: frozenset(cwes) for n_grams, cwes in by_n_grams.items()}
+        )
+    return __CWE_INDEX
+
+
 def __collect_via_commit_mgs(
     commits: tp.List[str]
 ) -> tp.Dict[str, tp.Dict[str, tp.Set[tp.Union[CVE, CWE]]]]:
@@ -90,43 +146,46 @@ def __collect_via_commit_mgs(
     """
     results: tp.Dict[str, tp.Dict[str, tp.Set[tp.Union[
         CVE, CWE]]]] = defaultdict(lambda: defaultdict(set))
+    found_cves: tp.Dict[str, tp.Optional[CVE]] = {}
 
     for line in commits:
-        line_parts = line.split(' ')
-        commit, message = line_parts[0], ' '.join(line_parts[1:])
-        if 'CVE-' in message or 'CWE-' in message:
-            # Check commit message for "CVE-XXXX-XXXXXXXX"
-            # Includes old CVE format with just 4 numbers at the end,
-            # as well as the new one with 8
-            cve_list = re.findall(r'CVE-\d{4}-\d{4,8}', message, re.IGNORECASE)
-            cve_data = []
-            for cve in cve_list:
-                try:
-                    cve_data.append(find_cve(cve))
-                except ValueError as error_msg:
-                    LOG.error(error_msg)
-            # Check commit message for "CWE-XXXX"
-            cwe_list = re.findall(r'CWE-[\d\-]+\d', message, re.IGNORECASE)
-            cwe_data = []
-            for cwe in cwe_list:
-                try:
-                    cwe_data.append(find_cwe(cwe_id=cwe))
-                except ValueError as error_msg:
-                    LOG.error(error_msg)
-            # Check commit message whether it contains any name or description
-            # from the CWE entries
-            for cwe in find_all_cwe():
-                if cwe.name in message or cwe.description in message:
-                    cwe_data.append(cwe)
-            # Compare commit messages with CWE list using n-grams
-            message_parts = __n_grams(text=message)
-            for cwe in find_all_cwe():
-                if not __n_grams(text=cwe.name) ^ message_parts or \
-                   not __n_grams(text=cwe.description) ^ message_parts:
-                    cwe_data.append(cwe)
-
-            results[commit]['cve'].update(cve_data)
-            results[commit]['cwe'].update(cwe_data)
+        commit, _, message = line.partition(' ')
+        if 'CVE-' not in message and 'CWE-' not in message:
+            continue
+
+        cwe_index = __get_cwe_index()
+        cve_data: tp.Set[CVE] = set()
+        cwe_data: tp.Set[CWE] = set()
+        # Check commit message for "CVE-XXXX-XXXXXXXX" and "CWE-XXXX"
+        for cve_id, cwe_id in __CVE_CWE_ID_PATTERN.findall(message):
+            if cve_id:
+                if cve_id not in found_cves:
+                    try:
+                        found_cves[cve_id] = find_cve(cve_id)
+                    except ValueError as error_msg:
+                        LOG.error(error_msg)
+                        found_cves[cve_id] = None
+                cve = found_cves[cve_id]
+                if cve is not None:
+                    cve_data.add(cve)
+            elif cwe_id in cwe_index.by_id:
+                cwe_data.add(cwe_index.by_id[cwe_id])
+            else:
+                LOG.error(f'Could not find CWE {cwe_id}!')
+        # Check commit message whether it contains any name or description
+        # from the CWE entries
+        for text, cwes in cwe_index.by_text.items():
+            if text in message:
+                cwe_data.update(cwes)
+        # Compare commit messages with CWE list using n-grams
+        cwe_data.update(
+            cwe_index.by_n_grams.get(
+                frozenset(__n_grams(text=message)), frozenset()
+            )
+        )
+
+        results[commit]['cve'].update(cve_data)
+        results[commit]['cwe'].update(cwe_data)
 
     return results
 
@@ -188,21 +247,22 @@ def __collect_via_references(
     results: tp.Dict[str, tp.Dict[str, tp.Set[tp.Union[
         CVE, CWE]]]] = defaultdict(lambda: defaultdict(set))
 
+    # sorted hashes allow to look up (abbreviated) referenced hashes
+    c_hashes = sorted(line.partition(' ')[0] for line in commits)
+
     for cve in cve_list:
         # Parse for github/gitlab urls which usually look like
         # {protocol}://{domain}/{vendor}/{product}/commit/{hash}
-        referenced_commits = [
-            x for x in cve.references if f'{vendor}/{product}/commit' in x
-        ]
-        if not referenced_commits:
-            continue
-
-        for referenced_commit in referenced_commits:
-            for line in commits:
-                commit = line.split(' ')[0]
-                if referenced_commit == commit:
-                    results[commit]['cve'].add(cve)
-                    break
+        for reference in cve.references:
+            if f'{vendor}/{product}/commit' not in reference:
+                continue
+            match = __COMMIT_REFERENCE_PATTERN.search(reference)
+            if not match:
+                continue
+            hash_prefix = match.group(1).lower()
+            idx = bisect_left(c_hashes, hash_prefix)
+            if idx < len(c_hashes) and c_hashes[idx].startswith(hash_prefix):
+                results[c_hashes[idx]]['cve'].add(cve)
 
     return results
 
@@ -296,3 +356,80 @@ def generate_cve_map(
             get_results_for_product(vendor, product)
             for vendor, product in products
         ])
+
+
+__CVE_MAPS: tp.Dict[Path, CVEMapTy] = {}
+
+
+def __get_products_digest(
+    products: tp.List[tp.Tuple[str, str]], only_precise: bool
+) -> str:
+    return hashlib.sha256(repr((sorted(products), only_precise)).encode()
+                         ).hexdigest()[:16]
+
+
+def __get_cve_map_path(
+    project_name: str, head: str, products_digest: str
+) -> Path:
+    return Path(str(vara_cfg()["data_cache"])) / "cve_map" / (
+        f"{project_name}-{head}-{products_digest}{__CVE_MAP_SUFFIX}"
+    )
+
+
+def get_cve_map(
+    project_name: str,
+    products: tp.List[tp.Tuple[str, str]],
+    only_precise: bool = True
+) -> CVEMapTy:
+    """
+    Get the CVE map of all commits reachable from the head of a project's
+    repository.
+
+    Generated maps are stored in the data cache per project, head, and
+    products, so they are only generated again if the repository changed or
+    the stored map is older than a week.
+
+    Args:
+        project_name: name of the project
+        products: a list of tuples used for querying the CVE database
+        only_precise: only include CVEs where an exact fixing commit can be
+            identified
+
+    Return:
+        a map ``revision -> set of CVEs fixed by that revision``
+    """
+    head = str(get_local_project_git(project_name).head.target)
+    products_digest = __get_products_digest(products, only_precise)
+    cve_map_path = __get_cve_map_path(project_name, head, products_digest)
+
+    cve_map = __CVE_MAPS.get(cve_map_path)
+    if cve_map is None and cve_map_path.exists() and \
+            time.time() - cve_map_path.stat().st_mtime < __CVE_MAP_MAX_AGE:
+        try:
+            with open(cve_map_path, "rb") as cve_map_file:
+                cve_map = pickle.load(cve_map_file)  # nosec
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            LOG.warning(f"Could not load CVE map {cve_map_path}.")
+
+    if cve_map is None:
+        cve_map = {
+            commit: dict(entry) for commit, entry in generate_cve_map(
+                get_local_project_git_path(project_name),
+                products,
+                end=head,
+                only_precise=only_precise
+            ).items()
+        }
+        cve_map_path.parent.mkdir(parents=True, exist_ok=True)
+        # maps of older heads are outdated
+        for outdated_path in cve_map_path.parent.glob(
+            __get_cve_map_path(project_name, "[0-9a-f]" * 40,
+                               products_digest).name
+        ):
+            outdated_path.unlink()
+        with atomic_write(cve_map_path) as tmp_cve_map_path:
+            with open(tmp_cve_map_path, "wb") as cve_map_file:
+                pickle.dump(cve_map, cve_map_file)
+
+    __CVE_MAPS[cve_map_path] = cve_map
+    return cve_map
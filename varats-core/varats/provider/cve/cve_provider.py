@@ -3,9 +3,8 @@ import typing as tp
 
 from benchbuild.project import Project
 
-from varats.project.project_util import get_local_project_git_path
 from varats.provider.cve.cve import CVE, find_all_cve, find_cve, find_cwe
-from varats.provider.cve.cve_map import generate_cve_map
+from varats.provider.cve.cve_map import get_cve_map
 from varats.provider.provider import Provider
 
 
@@ -34,9 +33,8 @@ class CVEProvider(Provider):
     def __init__(self, project: tp.Type[Project]) -> None:
         super().__init__(project)
         if hasattr(project, "get_cve_product_info"):
-            self.__cve_map = generate_cve_map(
-                get_local_project_git_path(project.NAME),
-                project.get_cve_product_info()
+            self.__cve_map = get_cve_map(
+                project.NAME, project.get_cve_product_info()
             )
         else:
             raise ValueError(
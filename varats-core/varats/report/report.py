@@ -10,6 +10,8 @@ from pathlib import Path
 from plumbum import colors
 from plumbum.colorlib.styles import Color
 
+from varats.utils.plugin_util import LazyRegistry
+
 
 class FileStatusExtension(Enum):
     """
@@ -104,7 +106,7 @@ class MetaReport(type):
     """Meta class for report to manage all reports and implement the basic
     static functionality for handling report-file names."""
 
-    REPORT_TYPES: tp.Dict[str, 'MetaReport'] = dict()
+    REPORT_TYPES: LazyRegistry['MetaReport'] = LazyRegistry()
 
     __RESULT_FILE_REGEX = re.compile(
         r"(?P<project_shorthand>.*)-" +
@@ -139,7 +141,7 @@ class MetaReport(type):
 
         if name != 'BaseReport':
             MetaReport.__check_required_vars(cls, name, ["SHORTHAND"])
-            if name not in cls.REPORT_TYPES:
+            if not cls.REPORT_TYPES.is_loaded(name):
                 cls.REPORT_TYPES[name] = cls
 
     def __check_accessor_methods(cls: tp.Any) -> None:
@@ -300,6 +302,48 @@ class MetaReport(type):
         match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
         return match is not None
 
+    @staticmethod
+    def get_result_file_components(
+        file_name: str
+    ) -> tp.Optional[tp.Dict[str, tp.Optional[str]]]:
+        """
+        Split a result file name into its components, i.e., the groups
+        project_shorthand, project_name, binary_name, file_commit_hash, UUID,
+        status_ext, and file_ext.
+
+        Args:
+            file_name: name of the file to split
+
+        Returns:
+            the components of the file name, or ``None`` if the file name is
+            not formated like a result file
+        """
+        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
+        if match:
+            return match.groupdict()
+        return None
+
+    @staticmethod
+    def get_supplementary_result_file_components(
+        file_name: str
+    ) -> tp.Optional[tp.Dict[str, tp.Optional[str]]]:
+        """
+        Split a supplementary result file name into its components, i.e., the
+        groups project_shorthand, project_name, binary_name, file_commit_hash,
+        UUID, info_type, and file_ext.
+
+        Args:
+            file_name: name of the file to split
+
+        Returns:
+            the components of the file name, or ``None`` if the file name is
+            not formated like a supplementary result file
+        """
+        match = MetaReport.__SUPPLEMENTARY_RESULT_FILE_REGEX.search(file_name)
+        if match:
+            return match.groupdict()
+        return None
+
     @staticmethod
     def is_result_file_supplementary(file_name: str) -> bool:
         """
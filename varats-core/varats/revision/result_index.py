@@ -0,0 +1,180 @@
+"""
+Persistent index of the result files of a project.
+
+Looking up the result files of a project requires to list the project's result
+directory, to parse the name of every file, and to look up the modification
+time of every file to find the newest result of a revision. The result index
+stores these components per file and is only refreshed when the modification
+time of the result directory changes, i.e., when files were added, removed, or
+renamed. On a refresh, only the files that are new since the last refresh are
+parsed and looked up.
+
+Indices are stored in the data cache and not next to the results, so that the
+result directories only contain result files and writing an index does not
+change the modification time of the directory it describes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+import typing as tp
+from pathlib import Path
+
+from varats.report.report import FileStatusExtension, MetaReport
+from varats.utils.filesystem_util import atomic_write
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
+
+# changes of a directory within this interval after its modification time
+# could be missed with coarse grained timestamps, so such directories are
+# listed again on the next lookup
+__RACY_INTERVAL_NS = 2 * 10**9
+__INDEX_VERSION = 1
+
+
+class ResultFileEntry(tp.NamedTuple):
+    """
+    The components of a file in a result directory.
+
+    Files that are no (supplementary) result files are indexed as well, with
+    all optional components set to ``None``, so they are not parsed again.
+    """
+
+    name: str
+    mtime: float
+    shorthand: tp.Optional[str] = None
+    commit_hash: tp.Optional[str] = None
+    status_ext: tp.Optional[str] = None
+    suppl_commit_hash: tp.Optional[str] = None
+    info_type: tp.Optional[str] = None
+
+    @property
+    def is_result_file(self) -> bool:
+        """Whether the file name is formated like a result file."""
+        return self.commit_hash is not None
+
+    @property
+    def is_supplementary(self) -> bool:
+        """Whether the file name is formated like a supplementary result
+        file."""
+        return self.info_type is not None
+
+    @property
+    def status(self) -> FileStatusExtension:
+        """The ``FileStatusExtension`` of the result file."""
+        return FileStatusExtension.get_file_status_from_str(
+            tp.cast(str, self.status_ext)
+        )
+
+
+class _ResultIndex(tp.NamedTuple):
+    dir_mtime_ns: int
+    entries: tp.Dict[str, ResultFileEntry]
+
+
+# result directory -> index
+__RESULT_INDICES: tp.Dict[str, _ResultIndex] = {}
+
+
+def __create_entry(result_dir: Path, file_name: str) -> ResultFileEntry:
+    mtime = (result_dir / file_name).stat().st_mtime
+    components = MetaReport.get_result_file_components(file_name) or {}
+    suppl_components = MetaReport.get_supplementary_result_file_components(
+        file_name
+    ) or {}
+    return ResultFileEntry(
+        file_name, mtime, components.get("project_shorthand"),
+        components.get("file_commit_hash"), components.get("status_ext"),
+        suppl_components.get("file_commit_hash"),
+        suppl_components.get("info_type")
+    )
+
+
+def __get_index_path(result_dir: Path) -> Path:
+    dir_digest = hashlib.sha256(str(result_dir.resolve()).encode()
+                               ).hexdigest()[:16]
+    return Path(str(vara_cfg()["data_cache"])
+               ) / "result_index" / f"{result_dir.name}-{dir_digest}.json"
+
+
+def __load_index(index_path: Path) -> tp.Optional[_ResultIndex]:
+    if not index_path.exists():
+        return None
+    try:
+        with open(index_path, "r", encoding="utf-8") as index_file:
+            stored_index = json.load(index_file)
+        if stored_index["version"] != __INDEX_VERSION:
+            return None
+        return _ResultIndex(
+            int(stored_index["dir_mtime_ns"]), {
+                entry[0]: ResultFileEntry(*entry)
+                for entry in stored_index["files"]
+            }
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        LOG.warning(f"Could not load result index {index_path}.")
+        return None
+
+
+def __store_index(index_path: Path, result_index: _ResultIndex) -> None:
+    stored_index = {
+        "version": __INDEX_VERSION,
+        "dir_mtime_ns": result_index.dir_mtime_ns,
+        "files": [list(entry) for entry in result_index.entries.values()]
+    }
+    with atomic_write(index_path) as tmp_index_path:
+        with open(tmp_index_path, "w", encoding="utf-8") as index_file:
+            json.dump(stored_index, index_file)
+
+
+def get_result_file_entries(result_dir: Path) -> tp.List[ResultFileEntry]:
+    """
+    Get the indexed components of all files in a result directory.
+
+    The index is kept in memory and in the data cache. The directory is only
+    listed again if its modification time changed, and only files that are
+    new since the last listing are parsed and looked up. Files that are
+    overwritten in place keep their indexed modification time.
+
+    Args:
+        result_dir: the result directory of a project
+
+    Returns:
+        list of the entries of all files in the result directory
+    """
+    try:
+        dir_mtime_ns = result_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+
+    dir_key = str(result_dir)
+    result_index = __RESULT_INDICES.get(dir_key)
+    index_path = __get_index_path(result_dir)
+    if result_index is None:
+        result_index = __load_index(index_path)
+
+    if result_index is None or result_index.dir_mtime_ns != dir_mtime_ns:
+        old_entries = result_index.entries if result_index else {}
+        entries: tp.Dict[str, ResultFileEntry] = {}
+        for file_name in os.listdir(result_dir):
+            entry = old_entries.get(file_name)
+            if entry is None:
+                try:
+                    entry = __create_entry(result_dir, file_name)
+                except FileNotFoundError:
+                    continue
+            entries[file_name] = entry
+
+        if time.time_ns() - dir_mtime_ns < __RACY_INTERVAL_NS:
+            dir_mtime_ns = -1
+        result_index = _ResultIndex(dir_mtime_ns, entries)
+        try:
+            __store_index(index_path, result_index)
+        except OSError:
+            LOG.warning(f"Could not store result index {index_path}.")
+
+    __RESULT_INDICES[dir_key] = result_index
+    return list(result_index.entries.values())
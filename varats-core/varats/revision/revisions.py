@@ -7,19 +7,197 @@ revision specific files, e.g., to get all files of a specific report that have
 been process successfully.
 """
 
+import hashlib
+import inspect
+import logging
 import typing as tp
 from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
+import pygit2
 from benchbuild.project import Project
+from benchbuild.source.base import target_prefix
+from benchbuild.utils.revision_ranges import AbstractRevisionRange
 
 from varats.project.project_util import (
+    get_blocked_revision_ranges,
     get_project_cls_by_name,
     get_primary_project_source,
 )
 from varats.report.report import FileStatusExtension, MetaReport
+from varats.revision.result_index import (
+    ResultFileEntry,
+    get_result_file_entries,
+)
+from varats.utils.filesystem_util import atomic_write
 from varats.utils.settings import vara_cfg
 
+LOG = logging.getLogger(__name__)
+
+# blocked revisions of every project that were computed in this process,
+# together with the source they were computed for
+__BLOCKED_REVISIONS: tp.Dict[str, tp.Tuple[tp.Any,
+                                           tp.Optional[np.ndarray]]] = {}
+
+
+def __get_blocked_revisions_key(
+    project_cls: tp.Type[Project], blocks: tp.List[AbstractRevisionRange],
+    repo: pygit2.Repository
+) -> str:
+    """Key that changes if the definition of the project or the branches of
+    its repository change."""
+    hasher = hashlib.sha256()
+    project_module = inspect.getmodule(project_cls)
+    try:
+        project_definition = inspect.getsource(
+            project_module if project_module else project_cls
+        )
+    except (OSError, TypeError):
+        # the source is unavailable, e.g., for projects that are not defined
+        # in a file, so we can only detect changes of the blocked ranges
+        project_definition = repr(blocks)
+    hasher.update(project_definition.encode())
+    for branch_name in sorted(repo.branches.local):
+        hasher.update(str(repo.branches.local[branch_name].target).encode())
+    return hasher.hexdigest()
+
+
+def __compute_blocked_revisions(
+    project_cls: tp.Type[Project], source: tp.Any,
+    blocks: tp.List[AbstractRevisionRange]
+) -> np.ndarray:
+    """
+    Compute the sorted array of all blocked revisions of a project.
+
+    If the repository of the project is available locally, the result is
+    stored in the data cache and reused until the project definition or the
+    branches of the repository change.
+    """
+    repo_path = pygit2.discover_repository(
+        str(Path(target_prefix()) / source.local)
+    )
+    repo = pygit2.Repository(repo_path) if repo_path else None
+    cache_path = Path(str(vara_cfg()["data_cache"])
+                     ) / "blocked_revisions" / f"{project_cls.NAME}.npz"
+
+    key = __get_blocked_revisions_key(
+        project_cls, blocks, repo
+    ) if repo else None
+    if key and cache_path.exists():
+        try:
+            with np.load(cache_path, allow_pickle=False) as cached:
+                if str(cached["key"]) == key:
+                    return tp.cast(np.ndarray, cached["revisions"])
+        except (OSError, ValueError, KeyError):
+            LOG.warning(f"Could not load blocked revisions {cache_path}.")
+
+    # revision ranges like GoodBadSubgraph need a repository to compute
+    # their revisions
+    repo_dir = Path(repo.workdir or repo.path) if repo else Path(
+        str(source.fetch())
+    )
+    for block in blocks:
+        block.init_cache(str(repo_dir))
+    blocked_revisions = np.array(
+        sorted({revision.encode() for block in blocks for revision in block}),
+        dtype=bytes
+    )
+
+    if key:
+        with atomic_write(cache_path) as tmp_cache_path:
+            np.savez(
+                tmp_cache_path, key=np.array(key), revisions=blocked_revisions
+            )
+
+    return blocked_revisions
+
+
+def get_blocked_revisions(
+    project_cls: tp.Type[Project]
+) -> tp.Optional[np.ndarray]:
+    """
+    Get all revisions that are blocked by the
+    :class:`~varats.project.project_util.block_revisions` specification of a
+    project's primary source.
+
+    The revisions are computed once per process and cached in the data cache.
+
+    Args:
+        project_cls: the project class
+
+    Returns:
+        sorted array of blocked revisions as byte strings, or ``None`` if the
+        source does not expose its blocked revision ranges, so revisions have
+        to be checked one by one with ``is_blocked_revision``
+    """
+    source = get_primary_project_source(project_cls.NAME)
+    cached_source, blocked_revisions = __BLOCKED_REVISIONS.get(
+        project_cls.NAME, (None, None)
+    )
+    if cached_source is source:
+        return blocked_revisions
+
+    blocks = get_blocked_revision_ranges(source)
+    if blocks is None:
+        LOG.debug(
+            f"Blocked revision ranges of {project_cls.NAME} are not exposed, "
+            "checking revisions one by one."
+        )
+        blocked_revisions = None
+    elif not blocks:
+        blocked_revisions = np.array([], dtype="S40")
+    else:
+        blocked_revisions = __compute_blocked_revisions(
+            project_cls, source, blocks
+        )
+
+    __BLOCKED_REVISIONS[project_cls.NAME] = (source, blocked_revisions)
+    return blocked_revisions
+
+
+def blocked_mask(
+    revisions: tp.Iterable[str], project_cls: tp.Type[Project]
+) -> np.ndarray:
+    """
+    Checks for multiple revisions if they are blocked on a given project.
+
+    Like ``is_blocked_revision`` of the project source, a revision is blocked
+    if one of the blocked revisions starts with it.
+
+    Args:
+        revisions: the (short) revisions to check
+        project_cls: the project class the revisions belong to
+
+    Returns:
+        boolean array that is ``True`` for every blocked revision
+    """
+    lookup_revisions = [revision.encode() for revision in revisions]
+    blocked_revisions = get_blocked_revisions(project_cls)
+    if blocked_revisions is None:
+        source = get_primary_project_source(project_cls.NAME)
+        return np.array(
+            [
+                source.is_blocked_revision(revision.decode())[0]
+                for revision in lookup_revisions
+            ],
+            dtype=bool
+        )
+
+    if not lookup_revisions or len(blocked_revisions) == 0:
+        return np.zeros(len(lookup_revisions), dtype=bool)
+
+    lookups = np.array(lookup_revisions, dtype=bytes)
+    indices = np.searchsorted(blocked_revisions, lookups)
+    candidates = blocked_revisions[np.minimum(
+        indices,
+        len(blocked_revisions) - 1,
+    )]
+    return tp.cast(
+        np.ndarray, (indices < len(blocked_revisions)) &
+        np.char.startswith(candidates, lookups)
+    )
+
 
 def is_revision_blocked(revision: str, project_cls: tp.Type[Project]) -> bool:
     """
@@ -32,10 +210,7 @@ def is_revision_blocked(revision: str, project_cls: tp.Type[Project]) -> bool:
     Returns:
         filtered revision list
     """
-    source = get_primary_project_source(project_cls.NAME)
-    if hasattr(source, "is_blocked_revision"):
-        return tp.cast(bool, source.is_blocked_revision(revision)[0])
-    return False
+    return bool(blocked_mask([revision], project_cls)[0])
 
 
 def filter_blocked_revisions(
@@ -51,79 +226,68 @@ def filter_blocked_revisions(
     Returns:
         filtered revision list
     """
+    is_blocked = blocked_mask(revisions, project_cls)
     return [
-        rev for rev in revisions if not is_revision_blocked(rev, project_cls)
+        rev for rev, blocked in zip(revisions, is_blocked) if not blocked
     ]
 
 
+def __get_result_dir(project_name: str) -> Path:
+    return Path(f"{vara_cfg()['result_dir']}/{project_name}/")
+
+
 def __get_result_files_dict(
     project_name: str, result_file_type: MetaReport
-) -> tp.Dict[str, tp.List[Path]]:
+) -> tp.Dict[str, tp.List[ResultFileEntry]]:
     """
-    Returns a dict that maps the commit_hash to a list of all result files, of
-    type result_file_type, for that commit.
+    Returns a dict that maps the commit_hash to a list of the index entries of
+    all result files, of type result_file_type, for that commit.
 
     Args:
         project_name: target project
         result_file_type: the type of the result file
     """
-    res_dir = Path(f"{vara_cfg()['result_dir']}/{project_name}/")
+    shorthand = str(getattr(result_file_type, "SHORTHAND"))
 
-    result_files: tp.DefaultDict[str, tp.List[Path]] = defaultdict(
+    result_files: tp.DefaultDict[str, tp.List[ResultFileEntry]] = defaultdict(
         list
     )  # maps commit hash -> list of res files (success or fail)
-    if not res_dir.exists():
-        return result_files
-
-    for res_file in res_dir.iterdir():
-        if result_file_type.is_result_file(
-            res_file.name
-        ) and result_file_type.is_correct_report_type(res_file.name):
-            commit_hash = result_file_type.get_commit_hash_from_result_file(
-                res_file.name
-            )
-            result_files[commit_hash].append(res_file)
+    for entry in get_result_file_entries(__get_result_dir(project_name)):
+        if entry.is_result_file and entry.shorthand == shorthand:
+            result_files[tp.cast(str, entry.commit_hash)].append(entry)
 
     return result_files
 
 
 def __get_supplementary_result_files_dict(
     project_name: str,
-    result_file_type: MetaReport,
     revision: tp.Optional[str] = None,
-) -> tp.Dict[tp.Tuple[str, str], tp.List[Path]]:
+) -> tp.Dict[tp.Tuple[str, str], tp.List[ResultFileEntry]]:
     """
-    Returns a dict that maps the commit_hash and the info_type to a list of all
-    supplementary result files for that commit and info_type. If an (optional)
-    revision is specified the nonly result files for that commit are returned.
+    Returns a dict that maps the commit_hash and the info_type to a list of the
+    index entries of all supplementary result files for that commit and
+    info_type. If an (optional) revision is specified the nonly result files
+    for that commit are returned.
 
     Args:
         project_name: target project
-        result_file_type: the type of the result file
         revision (str): The revision for which the result files should
                         be returned.
 
     Returns:
         Dict that maps (commit_hash, info_type) to list of result files
     """
-    res_dir = Path(f"{vara_cfg()['result_dir']}/{project_name}/")
-
     result_files: tp.DefaultDict[tp.Tuple[
-        str, str], tp.List[Path]] = defaultdict(
+        str, str], tp.List[ResultFileEntry]] = defaultdict(
             list
         )  # maps (commit_hash, suppl._file_type) -> list of res files
 
-    if res_dir.exists():
-        for res_file in res_dir.iterdir():
-            if result_file_type.is_result_file_supplementary(res_file.name):
-                commit_hash = result_file_type.\
-                    get_commit_hash_from_supplementary_result_file(
-                        res_file.name)
-                info_type = result_file_type.\
-                    get_info_type_from_supplementary_result_file(
-                        res_file.name)
-                if revision is None or commit_hash == revision:
-                    result_files[(commit_hash, info_type)].append(res_file)
+    for entry in get_result_file_entries(__get_result_dir(project_name)):
+        if entry.is_supplementary:
+            commit_hash = tp.cast(str, entry.suppl_commit_hash)
+            if revision is None or commit_hash == revision:
+                result_files[(commit_hash,
+                              tp.cast(str, entry.info_type))].append(entry)
 
     return result_files
 
@@ -152,21 +316,18 @@ def __get_files_with_status(
         a list of file paths to matching revision files
     """
     processed_revisions_paths = []
+    res_dir = __get_result_dir(project_name)
 
     result_files = __get_result_files_dict(project_name, result_file_type)
     for value in result_files.values():
-        sorted_res_files = sorted(
-            value, key=lambda x: Path(x).stat().st_mtime, reverse=True
-        )
+        sorted_res_files = sorted(value, key=lambda x: x.mtime, reverse=True)
         if only_newest:
             sorted_res_files = [sorted_res_files[0]]
         for result_file in sorted_res_files:
             if file_name_filter(result_file.name):
                 continue
-            if result_file_type.get_status_from_result_file(
-                result_file.name
-            ) in file_statuses:
-                processed_revisions_paths.append(result_file)
+            if result_file.status in file_statuses:
+                processed_revisions_paths.append(res_dir / result_file.name)
 
     return processed_revisions_paths
 
@@ -289,8 +450,8 @@ def get_failed_revisions(project_name: str,
 
     result_files = __get_result_files_dict(project_name, result_file_type)
     for commit_hash, value in result_files.items():
-        newest_res_file = max(value, key=lambda x: Path(x).stat().st_mtime)
-        if result_file_type.result_file_has_status_failed(newest_res_file.name):
+        newest_res_file = max(value, key=lambda x: x.mtime)
+        if newest_res_file.status == FileStatusExtension.Failed:
             failed_revisions.append(commit_hash)
 
     return failed_revisions
@@ -298,7 +459,7 @@ def get_failed_revisions(project_name: str,
 
 def __get_tag_for_revision(
     revision: str,
-    file_list: tp.List[Path],
+    file_list: tp.List[ResultFileEntry],
     project_cls: tp.Type[Project],
     result_file_type: MetaReport,
     tag_blocked: bool = True
@@ -308,7 +469,7 @@ def __get_tag_for_revision(
 
     Args:
         revision: the revision to get the status for
-        file_list: the list of result files for the revision
+        file_list: the index entries of the result files for the revision
         project_cls: the project class the revision belongs to
         result_file_type: the report type to be considered
 
@@ -318,11 +479,11 @@ def __get_tag_for_revision(
     if tag_blocked and is_revision_blocked(revision, project_cls):
         return FileStatusExtension.Blocked
 
-    newest_res_file = max(file_list, key=lambda x: x.stat().st_mtime)
-    if result_file_type.is_correct_report_type(str(newest_res_file.name)):
-        return result_file_type.get_status_from_result_file(
-            str(newest_res_file)
-        )
+    newest_res_file = max(file_list, key=lambda x: x.mtime)
+    if newest_res_file.shorthand == str(
+        getattr(result_file_type, "SHORTHAND")
+    ):
+        return newest_res_file.status
 
     return FileStatusExtension.Missing
 
@@ -346,12 +507,17 @@ def get_tagged_revisions(
     """
     revisions = []
     result_files = __get_result_files_dict(project_cls.NAME, result_file_type)
-    for commit_hash, file_list in result_files.items():
+    # look up whether revisions are blocked for all revisions at once
+    is_blocked = blocked_mask(
+        result_files.keys(), project_cls
+    ) if tag_blocked else np.zeros(len(result_files), dtype=bool)
+    for (commit_hash, file_list), blocked in zip(
+        result_files.items(), is_blocked
+    ):
         revisions.append((
-            commit_hash,
-            __get_tag_for_revision(
-                commit_hash, file_list, project_cls, result_file_type,
-                tag_blocked
+            commit_hash, FileStatusExtension.Blocked
+            if blocked else __get_tag_for_revision(
+                commit_hash, file_list, project_cls, result_file_type, False
             )
         ))
 
@@ -385,19 +551,17 @@ def get_tagged_revision(
 
 def get_supplementary_result_files(
     project_name: str,
-    result_file_type: MetaReport,
     revision: tp.Optional[str] = None,
     suppl_info_type: tp.Optional[str] = None
 ) -> tp.List[tp.Tuple[Path, str, str]]:
     """
-    Returns the current supplementary result files for a given project and
-    report type. If a specific revision is specified then only the result files
-    for the passed revision are returned, otherwise all files for all available
-    revisions are returned.
+    Returns the current supplementary result files for a given project. If a
+    specific revision is specified then only the result files for the passed
+    revision are returned, otherwise all files for all available revisions are
+    returned.
 
     Args:
         project_name: target project
-        result_file_type: the type of the result file
         revision: the revision for which the result files should
                         be returned
         suppl_info_type: only include result files of the specified type
@@ -407,14 +571,17 @@ def get_supplementary_result_files(
         file type
     """
     result_files = __get_supplementary_result_files_dict(
-        project_name, result_file_type, revision
+        project_name, revision
     )
+    res_dir = __get_result_dir(project_name)
 
     result = []
 
     for (commit_hash, info_type), file_list in result_files.items():
         if (suppl_info_type is None) or (info_type == suppl_info_type):
-            newest_res_file = max(file_list, key=lambda x: x.stat().st_mtime)
-            result.append((newest_res_file, commit_hash, info_type))
+            newest_res_file = max(file_list, key=lambda x: x.mtime)
+            result.append(
+                (res_dir / newest_res_file.name, commit_hash, info_type)
+            )
 
     return result
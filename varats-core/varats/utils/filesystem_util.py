@@ -1,6 +1,9 @@
 """Utility functions for handling filesystem related tasks."""
 
+import hashlib
+import os
 import typing as tp
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -13,3 +16,50 @@ class FolderAlreadyPresentError(Exception):
             f"Folder: '{str(folder)}' should be created "
             "but was already present."
         )
+
+
+def sha256_checksum(file_path: Path, block_size: int = 65536) -> str:
+    """
+    Compute sha256 checksum of file.
+
+    Args:
+        file_path: path to the file
+        block_size: amount of bytes read per cycle
+
+    Returns:
+        sha256 hash of the file
+    """
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as file_h:
+        for block in iter(lambda: file_h.read(block_size), b''):
+            sha256.update(block)
+    sha256.update(bytes(file_path.name, 'utf-8'))
+    return sha256.hexdigest()
+
+
+@contextmanager
+def atomic_write(file_path: Path) -> tp.Iterator[Path]:
+    """
+    Replace a file atomically with a temporary file that is written in the
+    ``with`` block, so concurrent readers never see a partially written file.
+
+    The temporary file is located next to ``file_path`` and ends with the same
+    suffix. If the ``with`` block raises, ``file_path`` is left untouched.
+
+    Args:
+        file_path: path of the file to write
+
+    Yields:
+        path of the temporary file that should be written
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(
+        f".{file_path.name}.{os.getpid()}{file_path.suffix}"
+    )
+    try:
+        yield tmp_path
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+    os.replace(tmp_path, file_path)
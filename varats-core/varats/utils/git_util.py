@@ -3,6 +3,7 @@
 import os
 import re
 import typing as tp
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -47,6 +48,10 @@ class ChurnConfig():
     can select a specific set of file extensions to only be considered in the
     code churn, e.g., by selecting `h` and `c` only C related files will be used
     to compute the code churn.
+
+    By default, churn is computed by parsing the output of git subprocesses.
+    The ``PYGIT2`` engine computes it in-process with pygit2 diffs instead and
+    can distribute large commit ranges over multiple worker processes.
     """
 
     class Language(Enum):
@@ -57,8 +62,17 @@ class ChurnConfig():
         C = {"h", "c"}
         CPP = {"h", "hxx", "hpp", "cxx", "cpp"}
 
+    class Engine(Enum):
+        """Enum for the different ways to calculate code churn."""
+        value: str
+
+        GIT = "git"
+        PYGIT2 = "pygit2"
+
     def __init__(self) -> None:
         self.__enabled_languages: tp.List[ChurnConfig.Language] = []
+        self.__engine = ChurnConfig.Engine.GIT
+        self.__jobs = 0
 
     @staticmethod
     def create_default_config() -> 'ChurnConfig':
@@ -149,6 +163,36 @@ class ChurnConfig():
         """Disable `language` in the config."""
         self.__enabled_languages.remove(language)
 
+    @property
+    def engine(self) -> 'ChurnConfig.Engine':
+        """The engine that is used to calculate code churn."""
+        return self.__engine
+
+    @engine.setter
+    def engine(self, engine: 'ChurnConfig.Engine') -> None:
+        self.__engine = engine
+
+    @property
+    def jobs(self) -> int:
+        """
+        Number of worker processes the ``PYGIT2`` engine uses for large commit
+        ranges.
+
+        With 0, one worker per CPU core is used.
+        """
+        return self.__jobs
+
+    @jobs.setter
+    def jobs(self, jobs: int) -> None:
+        self.__jobs = jobs
+
+    @property
+    def enabled_extensions(self) -> tp.FrozenSet[str]:
+        """Returns the file extensions of all enabled languages."""
+        return frozenset(
+            ext for lang in self.enabled_languages for ext in lang.value
+        )
+
     def get_extensions_repr(self, sep: str = ", ") -> str:
         """
         Returns a string that containts all file extensions from all enabled
@@ -162,9 +206,7 @@ class ChurnConfig():
         """
         concat_str = ""
         tmp_sep = ""
-        for ext in sorted({
-            ext for lang in self.enabled_languages for ext in lang.value
-        }):
+        for ext in sorted(self.enabled_extensions):
             concat_str += tmp_sep
             tmp_sep = sep
             concat_str += ext
@@ -258,6 +300,8 @@ def create_commit_lookup_helper(project_name: str) -> CommitLookupTy:
 class CommitRepoPair():
     """Pair of a commit hash and the name of the repository it is based in."""
 
+    __slots__ = ("__commit_hash", "__repo_name")
+
     def __init__(self, commit_hash: str, repo_name: str) -> None:
         self.__commit_hash = commit_hash
         self.__repo_name = repo_name
@@ -292,6 +336,30 @@ class CommitRepoPair():
         return f"{self.repository_name}[{self.commit_hash}]"
 
 
+def walk_commits(
+    repo: pygit2.Repository,
+    head: pygit2.Oid,
+    hidden: tp.Optional[pygit2.Oid] = None
+) -> tp.List[str]:
+    """
+    List the commits reachable from ``head`` but not from ``hidden``.
+
+    Args:
+        repo: git repository
+        head: newest commit to list
+        hidden: commit whose ancestors, including itself, are not listed
+
+    Returns:
+        the commit hashes, ordered from old to new
+    """
+    walker = repo.walk(head, pygit2.GIT_SORT_TIME)
+    if hidden is not None:
+        walker.hide(hidden)
+    c_hashes = [str(commit.id) for commit in walker]
+    c_hashes.reverse()
+    return c_hashes
+
+
 MappedCommitResultType = tp.TypeVar("MappedCommitResultType")
 
 
@@ -342,8 +410,6 @@ def __calc_code_churn_range_impl(
         end_range: end churn calculation at end commit
     """
 
-    churn_values: tp.Dict[str, tp.Tuple[int, int, int]] = {}
-
     if start_range is None and end_range is None:
         revision_range = None
     elif start_range is None:
@@ -353,6 +419,58 @@ def __calc_code_churn_range_impl(
     else:
         revision_range = "{}~..{}".format(start_range, end_range)
 
+    return __calc_code_churn_impl(repo_path, churn_config, revision_range)
+
+
+def __calc_code_churn_impl(
+    repo_path: str, churn_config: ChurnConfig,
+    revision_range: tp.Optional[str]
+) -> tp.Dict[str, tp.Tuple[int, int, int]]:
+    """
+    Calculates all churn values for the commits selected by a git revision
+    range with the engine selected in the churn config.
+
+    Args:
+        repo_path: path to the git repository
+        churn_config: churn config to customize churn generation
+        revision_range: git revision range, e.g., ``a..b``; if None, all
+                        commits reachable from HEAD are selected
+    """
+    if churn_config.engine == ChurnConfig.Engine.GIT:
+        return __calc_code_churn_git_impl(
+            repo_path, churn_config, revision_range
+        )
+    return __calc_code_churn_pygit2_impl(
+        repo_path, churn_config, revision_range
+    )
+
+
+def __get_churn_pathspecs(churn_config: ChurnConfig) -> tp.List[str]:
+    """Pathspecs that select the files git includes into the churn
+    calculation."""
+    if churn_config.include_everything:
+        return []
+    return ["--"] + [
+        f"*.{ext}" for ext in sorted(churn_config.enabled_extensions)
+    ]
+
+
+def __calc_code_churn_git_impl(
+    repo_path: str, churn_config: ChurnConfig,
+    revision_range: tp.Optional[str]
+) -> tp.Dict[str, tp.Tuple[int, int, int]]:
+    """
+    Calculates all churn values for the commits selected by a git revision
+    range by parsing the output of ``git log``.
+
+    Args:
+        repo_path: path to the git repository
+        churn_config: churn config to customize churn generation
+        revision_range: git revision range, e.g., ``a..b``; if None, all
+                        commits reachable from HEAD are selected
+    """
+    churn_values: tp.Dict[str, tp.Tuple[int, int, int]] = {}
+
     repo_git = git["-C", repo_path]
     log_base_params = ["log", "--pretty=%H"]
     diff_base_params = [
@@ -362,19 +480,10 @@ def __calc_code_churn_range_impl(
         log_base_params.append(revision_range)
         diff_base_params.append(revision_range)
 
-    if not churn_config.include_everything:
-        diff_base_params.append("--")
-        # builds a regrex to select files that git includes into churn calc
-        diff_base_params.append(
-            ":*.[" + churn_config.get_extensions_repr('|') + "]"
-        )
+    diff_base_params.extend(__get_churn_pathspecs(churn_config))
 
-    if revision_range:
-        stdout = repo_git(diff_base_params)
-        revs = repo_git(log_base_params).strip().split()
-    else:
-        stdout = repo_git(diff_base_params)
-        revs = repo_git(log_base_params).strip().split()
+    stdout = repo_git(diff_base_params)
+    revs = repo_git(log_base_params).strip().split()
     # initialize with 0 as otherwise commits without changes would be
     # missing from the churn data
     for rev in revs:
@@ -395,6 +504,133 @@ def __calc_code_churn_range_impl(
     return churn_values
 
 
+# Commit ranges with fewer commits per worker are not worth the overhead of
+# starting worker processes.
+__MIN_COMMITS_PER_CHURN_JOB = 500
+
+
+def __diff_churn(
+    diff: pygit2.Diff, extensions: tp.Optional[tp.FrozenSet[str]]
+) -> tp.Tuple[int, int, int]:
+    """
+    Sums up the churn of a diff, only considering files with one of the given
+    extensions, if extensions are given.
+
+    Returns:
+        churn triple (files changed, insertions, deletions)
+    """
+    diff.find_similar()
+    if extensions is None:
+        stats = diff.stats
+        return stats.files_changed, stats.insertions, stats.deletions
+
+    files_changed = insertions = deletions = 0
+    for idx, delta in enumerate(diff.deltas):
+        if os.path.splitext(delta.new_file.path)[1][1:] not in extensions and \
+                os.path.splitext(delta.old_file.path)[1][1:] not in extensions:
+            continue
+        # only patches of selected files are generated
+        patch = diff[idx]
+        if patch is None:
+            # unmodified deltas have no patch
+            continue
+        _, file_insertions, file_deletions = patch.line_stats
+        files_changed += 1
+        insertions += file_insertions
+        deletions += file_deletions
+    return files_changed, insertions, deletions
+
+
+def _calc_commits_churn_pygit2(
+    repo_path: str, extensions: tp.Optional[tp.FrozenSet[str]],
+    c_hashes: tp.Sequence[str]
+) -> tp.List[tp.Tuple[int, int, int]]:
+    """
+    Calculates the churn of every given commit, i.e., the diff to its parent.
+
+    Like ``git log``, merge commits have no churn. This function is also
+    executed in worker processes, so it needs to be picklable.
+    """
+    repo = pygit2.Repository(repo_path)
+    churn_values = []
+    for c_hash in c_hashes:
+        commit = repo[c_hash].peel(pygit2.Commit)
+        if len(commit.parents) > 1:
+            churn_values.append((0, 0, 0))
+        elif commit.parents:
+            churn_values.append(
+                __diff_churn(
+                    commit.parents[0].tree.diff_to_tree(
+                        commit.tree, context_lines=0
+                    ), extensions
+                )
+            )
+        else:
+            churn_values.append(
+                __diff_churn(
+                    commit.tree.diff_to_tree(context_lines=0, swap=True),
+                    extensions
+                )
+            )
+    return churn_values
+
+
+def __calc_code_churn_pygit2_impl(
+    repo_path: str, churn_config: ChurnConfig,
+    revision_range: tp.Optional[str]
+) -> tp.Dict[str, tp.Tuple[int, int, int]]:
+    """
+    Calculates all churn values for the commits selected by a git revision
+    range in-process with pygit2 diffs.
+
+    Large ranges are split between ``churn_config.jobs`` worker processes.
+
+    Args:
+        repo_path: path to the git repository
+        churn_config: churn config to customize churn generation
+        revision_range: git revision range, e.g., ``a..b``; if None, all
+                        commits reachable from HEAD are selected
+    """
+    repo = pygit2.Repository(repo_path)
+    if revision_range is None:
+        walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TIME)
+    elif ".." in revision_range:
+        rev_spec = repo.revparse(revision_range)
+        walker = repo.walk(rev_spec.to_object.id, pygit2.GIT_SORT_TIME)
+        walker.hide(rev_spec.from_object.id)
+    else:
+        walker = repo.walk(
+            repo.revparse_single(revision_range).id, pygit2.GIT_SORT_TIME
+        )
+    c_hashes = [str(commit.id) for commit in walker]
+
+    extensions = None if churn_config.include_everything else \
+        churn_config.enabled_extensions
+    jobs = churn_config.jobs if churn_config.jobs > 0 else (
+        os.cpu_count() or 1
+    )
+    jobs = min(jobs, len(c_hashes) // __MIN_COMMITS_PER_CHURN_JOB)
+
+    if jobs <= 1:
+        churn_values = _calc_commits_churn_pygit2(
+            repo.path, extensions, c_hashes
+        )
+    else:
+        chunk_size = -(-len(c_hashes) // jobs)
+        with ProcessPoolExecutor(jobs) as executor:
+            churn_values = [
+                churn for chunk_churn in executor.map(
+                    _calc_commits_churn_pygit2, [repo.path] * jobs,
+                    [extensions] * jobs, [
+                        c_hashes[idx:idx + chunk_size]
+                        for idx in range(0, len(c_hashes), chunk_size)
+                    ]
+                ) for churn in chunk_churn
+            ]
+
+    return dict(zip(c_hashes, churn_values))
+
+
 def calc_code_churn_range(
     repo: tp.Union[pygit2.Repository, str],
     churn_config: tp.Optional[ChurnConfig] = None,
@@ -424,6 +660,43 @@ def calc_code_churn_range(
     )
 
 
+def calc_code_churn_of_new_commits(
+    repo: tp.Union[pygit2.Repository, str],
+    end: tp.Union[pygit2.Commit, str],
+    known_commit: tp.Optional[tp.Union[pygit2.Commit, str]] = None,
+    churn_config: tp.Optional[ChurnConfig] = None
+) -> tp.Dict[str, tp.Tuple[int, int, int]]:
+    """
+    Calculates the churn values of all commits that are reachable from ``end``
+    but not from ``known_commit``, i.e., ``known_commit..end``.
+
+    Args:
+        repo: git repository
+        end: newest commit to calculate churn for
+        known_commit: commit whose history is excluded; if None, the churn of
+                      all commits reachable from ``end`` is calculated
+        churn_config: churn config to customize churn generation
+
+    Returns:
+        dict of churn triples, where the commit hash points to
+        (files changed, insertions, deletions)
+    """
+    churn_config = ChurnConfig.init_as_default_if_none(churn_config)
+    end_hash = str(end.id) if isinstance(end, pygit2.Commit) else end
+    if known_commit is None:
+        revision_range = end_hash
+    else:
+        known_hash = str(known_commit.id) if isinstance(
+            known_commit, pygit2.Commit
+        ) else known_commit
+        revision_range = f"{known_hash}..{end_hash}"
+
+    return __calc_code_churn_impl(
+        repo.path if isinstance(repo, pygit2.Repository) else repo,
+        churn_config, revision_range
+    )
+
+
 def calc_commit_code_churn(
     repo: pygit2.Repository,
     commit: pygit2.Commit,
@@ -465,19 +738,20 @@ def calc_code_churn(
         (files changed, insertions, deletions)
     """
     churn_config = ChurnConfig.init_as_default_if_none(churn_config)
+    if churn_config.engine == ChurnConfig.Engine.PYGIT2:
+        return __diff_churn(
+            commit_a.tree.diff_to_tree(commit_b.tree, context_lines=0),
+            None if churn_config.include_everything else
+            churn_config.enabled_extensions
+        )
+
     repo_git = git["-C", repo.path]
     diff_base_params = [
         "diff", "--shortstat", "-l0",
         str(commit_a.id),
         str(commit_b.id)
     ]
-
-    if not churn_config.include_everything:
-        diff_base_params.append("--")
-        # builds a regrex to select files that git includes into churn calc
-        diff_base_params.append(
-            ":*.[" + churn_config.get_extensions_repr('|') + "]"
-        )
+    diff_base_params.extend(__get_churn_pathspecs(churn_config))
 
     stdout = repo_git(diff_base_params)
     # initialize with 0 as otherwise commits without changes would be
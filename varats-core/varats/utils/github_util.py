@@ -3,13 +3,19 @@ import codecs
 import logging
 import pickle  # nosec
 import re
+import sqlite3
+import threading
+import time
 import typing as tp
+from contextlib import contextmanager
 from pathlib import Path
 
 import pandas as pd
+import requests
+import requests_cache
 from benchbuild.project import Project
 from benchbuild.source import primary
-from github import Github
+from github import Github, GithubException
 from github.GithubObject import GithubObject
 
 from varats.utils.settings import vara_cfg
@@ -36,13 +42,34 @@ def get_github_instance() -> Github:
     return Github()
 
 
-__PYGITHUB_CACHE_FILE_NAME = "pygithub.csv.gz"
+__PYGITHUB_CACHE_DB_NAME = "pygithub.sqlite"
+__PYGITHUB_LEGACY_CACHE_FILE_NAME = "pygithub.csv.gz"
 __PYGITHUB_KEY_COLUMN = "key"
 __PYGITHUB_LIST_LENGTH_COLUMN = "length"
 __PYGITHUB_OBJECT_COLUMN = "object"
 
+__PYGITHUB_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    key TEXT PRIMARY KEY, object TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lists (
+    key TEXT PRIMARY KEY, length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS list_items (
+    list_key TEXT NOT NULL, idx INTEGER NOT NULL, object TEXT NOT NULL,
+    PRIMARY KEY (list_key, idx)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS list_cursors (
+    key TEXT PRIMARY KEY, cursor INTEGER NOT NULL
+);
+"""
+
 PyGithubObj = tp.TypeVar("PyGithubObj", bound=GithubObject)
 
+__SYNC_LOCK = threading.Lock()
+__SYNCED_LISTS: tp.Dict[tp.Tuple[str, str],
+                        tp.Tuple[float, tp.List[GithubObject]]] = {}
+
 
 def _dump_pygithub_object(obj: GithubObject) -> str:
     """
@@ -77,28 +104,87 @@ def _load_pygithub_object(obj: str) -> GithubObject:
     )
 
 
-def _load_cache_file() -> pd.DataFrame:
-    cache_file = Path(
-        str(vara_cfg()["data_cache"])
-    ) / __PYGITHUB_CACHE_FILE_NAME
-    if cache_file.exists():
-        cache_df = pd.read_csv(
-            str(cache_file), index_col=0, compression='infer'
-        )
-        return cache_df
-    return pd.DataFrame(
-        columns=[
-            __PYGITHUB_KEY_COLUMN, __PYGITHUB_OBJECT_COLUMN,
-            __PYGITHUB_LIST_LENGTH_COLUMN
+def __migrate_legacy_cache_file(
+    connection: sqlite3.Connection, legacy_cache_file: Path
+) -> None:
+    """
+    Import the entries of the old CSV based cache into the database.
+
+    The old cache stored single objects as ``(key, object)`` rows and lists as
+    a ``(key, length)`` header row followed by ``(key_<idx>, object)`` rows.
+    """
+    LOG.info(f"Migrating PyGithub cache {legacy_cache_file}.")
+    cache_df = pd.read_csv(
+        str(legacy_cache_file), index_col=0, compression='infer'
+    )
+    objects: tp.Dict[str, str] = {}
+    list_lengths: tp.Dict[str, int] = {}
+    for key, obj, length in zip(
+        cache_df[__PYGITHUB_KEY_COLUMN], cache_df[__PYGITHUB_OBJECT_COLUMN],
+        cache_df[__PYGITHUB_LIST_LENGTH_COLUMN]
+    ):
+        if pd.isna(length):
+            objects[str(key)] = str(obj)
+        else:
+            list_lengths[str(key)] = int(length)
+
+    list_items: tp.List[tp.Tuple[str, int, str]] = []
+    for list_key, length in list(list_lengths.items()):
+        items = [
+            objects.pop(f"{list_key}_{idx}", None) for idx in range(length)
         ]
+        if None in items:
+            # incompletely stored lists are dropped and fetched again
+            LOG.warning(f"Dropping incomplete cached list {list_key}.")
+            del list_lengths[list_key]
+            continue
+        list_items.extend(
+            (list_key, idx, tp.cast(str, item))
+            for idx, item in enumerate(items)
+        )
+
+    connection.executemany(
+        "INSERT OR REPLACE INTO objects VALUES (?, ?)", objects.items()
     )
+    connection.executemany(
+        "INSERT OR REPLACE INTO lists VALUES (?, ?)", list_lengths.items()
+    )
+    connection.executemany(
+        "INSERT OR REPLACE INTO list_items VALUES (?, ?, ?)", list_items
+    )
+
+
+@contextmanager
+def _open_cache_db() -> tp.Iterator[sqlite3.Connection]:
+    """
+    Open the PyGithub object cache in the data cache directory.
 
+    Changes are committed when the context is left without an exception. An
+    existing cache file of the old CSV format is migrated on first use.
 
-def _store_cache_file(cache_df: pd.DataFrame) -> None:
-    cache_file = Path(
-        str(vara_cfg()["data_cache"])
-    ) / __PYGITHUB_CACHE_FILE_NAME
-    cache_df.to_csv(str(cache_file), compression='infer')
+    Returns:
+        a connection to the cache database
+    """
+    cache_dir = Path(str(vara_cfg()["data_cache"]))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(
+        str(cache_dir / __PYGITHUB_CACHE_DB_NAME), timeout=60
+    )
+    try:
+        with connection:
+            connection.executescript(__PYGITHUB_CACHE_SCHEMA)
+            legacy_cache_file = cache_dir / __PYGITHUB_LEGACY_CACHE_FILE_NAME
+            if legacy_cache_file.exists():
+                __migrate_legacy_cache_file(connection, legacy_cache_file)
+                legacy_cache_file.rename(
+                    legacy_cache_file.with_name(
+                        legacy_cache_file.name + ".migrated"
+                    )
+                )
+        with connection:
+            yield connection
+    finally:
+        connection.close()
 
 
 def _cache_pygithub_object(key: str, obj: GithubObject) -> None:
@@ -109,13 +195,11 @@ def _cache_pygithub_object(key: str, obj: GithubObject) -> None:
         key: the unique identifier for the object to store
         obj: the object to store
     """
-    cache_df = _load_cache_file()
-    cache_df = cache_df.append({
-        __PYGITHUB_KEY_COLUMN: key,
-        __PYGITHUB_OBJECT_COLUMN: _dump_pygithub_object(obj)
-    },
-                               ignore_index=True)
-    _store_cache_file(cache_df)
+    with _open_cache_db() as connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO objects VALUES (?, ?)",
+            (key, _dump_pygithub_object(obj))
+        )
 
 
 def _get_cached_pygithub_object(key: str) -> tp.Optional[GithubObject]:
@@ -128,33 +212,35 @@ def _get_cached_pygithub_object(key: str) -> tp.Optional[GithubObject]:
     Returns:
         the cached object if available, else ``None``
     """
-    cache_df = _load_cache_file()
-    selected_rows = cache_df[cache_df[__PYGITHUB_KEY_COLUMN] == key]
-    if selected_rows.empty:
+    with _open_cache_db() as connection:
+        row = connection.execute(
+            "SELECT object FROM objects WHERE key = ?", (key,)
+        ).fetchone()
+    if row is None:
         return None
-    return _load_pygithub_object(selected_rows[__PYGITHUB_OBJECT_COLUMN].item())
+    return _load_pygithub_object(row[0])
 
 
 def _cache_pygithub_object_list(key: str, objs: tp.List[PyGithubObj]) -> None:
     """
     Cache a list of GithubObjects.
 
+    All elements are inserted in a single transaction, replacing a previously
+    cached list with the same key.
+
     Args:
         key: the unique identifier for the list to store
     """
-    cache_df = _load_cache_file()
-    cache_df = cache_df.append({
-        __PYGITHUB_KEY_COLUMN: key,
-        __PYGITHUB_LIST_LENGTH_COLUMN: len(objs)
-    },
-                               ignore_index=True)
-    for idx, obj in enumerate(objs):
-        cache_df = cache_df.append({
-            __PYGITHUB_KEY_COLUMN: f"{key}_{idx}",
-            __PYGITHUB_OBJECT_COLUMN: _dump_pygithub_object(obj)
-        },
-                                   ignore_index=True)
-        _store_cache_file(cache_df)
+    with _open_cache_db() as connection:
+        connection.execute("DELETE FROM list_items WHERE list_key = ?", (key,))
+        connection.executemany(
+            "INSERT INTO list_items VALUES (?, ?, ?)",
+            ((key, idx, _dump_pygithub_object(obj))
+             for idx, obj in enumerate(objs))
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO lists VALUES (?, ?)", (key, len(objs))
+        )
 
 
 def _get_cached_pygithub_object_list(
@@ -169,23 +255,72 @@ def _get_cached_pygithub_object_list(
     Returns:
         the cached list if available, else ``None``
     """
-    cache_df = _load_cache_file()
-    list_header = cache_df[cache_df[__PYGITHUB_KEY_COLUMN] == key]
-    if list_header.empty:
-        return None
-    list_length: int = int(list_header[__PYGITHUB_LIST_LENGTH_COLUMN].item())
-    selected_rows = pd.DataFrame()
-    for idx in range(list_length):
-        selected_rows = selected_rows.append(
-            cache_df[cache_df[__PYGITHUB_KEY_COLUMN] == f"{key}_{idx}"],
-            ignore_index=True
-        )
-    if len(selected_rows) != list_length:
+    with _open_cache_db() as connection:
+        list_header = connection.execute(
+            "SELECT length FROM lists WHERE key = ?", (key,)
+        ).fetchone()
+        if list_header is None:
+            return None
+        objs = [
+            row[0] for row in connection.execute(
+                "SELECT object FROM list_items WHERE list_key = ? "
+                "ORDER BY idx", (key,)
+            )
+        ]
+    if len(objs) != int(list_header[0]):
         raise AssertionError("List length is not equal to list header.")
-    return [
-        _load_pygithub_object(obj)
-        for obj in selected_rows[__PYGITHUB_OBJECT_COLUMN].tolist()
-    ]
+    return [_load_pygithub_object(obj) for obj in objs]
+
+
+def _get_cached_pygithub_list_cursor(key: str) -> tp.Optional[int]:
+    """
+    Load the high-water mark of a synchronized list of GithubObjects.
+
+    Args:
+        key: the unique identifier of the list
+
+    Returns:
+        the largest cursor of all cached elements, or ``None`` if the list was
+        not synchronized yet
+    """
+    with _open_cache_db() as connection:
+        row = connection.execute(
+            "SELECT cursor FROM list_cursors WHERE key = ?", (key,)
+        ).fetchone()
+    return None if row is None else int(row[0])
+
+
+def _append_to_cached_pygithub_object_list(
+    key: str, objs: tp.List[PyGithubObj], cursor: int
+) -> None:
+    """
+    Append GithubObjects to a cached list and update its high-water mark.
+
+    Only the new elements are written; a list that does not exist yet is
+    created.
+
+    Args:
+        key: the unique identifier of the list
+        objs: the objects to append
+        cursor: the new high-water mark of the list
+    """
+    with _open_cache_db() as connection:
+        list_header = connection.execute(
+            "SELECT length FROM lists WHERE key = ?", (key,)
+        ).fetchone()
+        offset = 0 if list_header is None else int(list_header[0])
+        connection.executemany(
+            "INSERT OR REPLACE INTO list_items VALUES (?, ?, ?)",
+            ((key, offset + idx, _dump_pygithub_object(obj))
+             for idx, obj in enumerate(objs))
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO lists VALUES (?, ?)",
+            (key, offset + len(objs))
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO list_cursors VALUES (?, ?)", (key, cursor)
+        )
 
 
 def get_cached_github_object(
@@ -235,6 +370,118 @@ def get_cached_github_object_list(
     return obj_list_to_cache
 
 
+def get_synced_github_object_list(
+    cached_object_key: str,
+    load_function: 'tp.Callable[[Github], PaginatedList[PyGithubObj]]',
+    get_cursor: tp.Callable[[PyGithubObj], int]
+) -> tp.List[PyGithubObj]:
+    """
+    Incrementally synchronizes a cached list of GithubObjects with GitHub.
+
+    The cache stores a high-water mark, i.e., the largest cursor of all cached
+    objects, per list. When a list is synchronized, the PaginatedList is only
+    consumed until the first already known object is reached, so only pages
+    containing new objects are requested. New objects are appended to the
+    cached list.
+
+    A list is synchronized at most once per process, or again when the
+    ``sources/refresh_interval`` has passed. In ``sources/offline`` mode, or if
+    GitHub cannot be reached, the cached list is used as is.
+
+    Args:
+        cached_object_key: unique name to identify the GithubObj list
+        load_function: function that loads a PaginatedList of PygithubObjs
+                       ordered from new to old, e.g., issue events
+        get_cursor: function that returns a strictly increasing value for
+                    newer objects, e.g., the id of an issue event
+
+    Returns:
+        all known GithubObjs ordered from new to old
+    """
+    list_key = (str(vara_cfg()["data_cache"]), cached_object_key)
+    with __SYNC_LOCK:
+        if not __needs_sync(list_key):
+            return [
+                tp.cast(PyGithubObj, obj) for obj in __SYNCED_LISTS[list_key][1]
+            ]
+
+        if vara_cfg()["sources"]["offline"]:
+            cached_list = _get_cached_pygithub_object_list(cached_object_key)
+            if cached_list is None:
+                raise LookupError(
+                    f"The list {cached_object_key} is not cached and GitHub "
+                    "is not queried in offline mode."
+                )
+        else:
+            cached_list = __sync_github_object_list(
+                cached_object_key, load_function, get_cursor
+            )
+
+        synced_list = list(reversed(cached_list))
+        __SYNCED_LISTS[list_key] = (time.monotonic(), synced_list)
+        return [tp.cast(PyGithubObj, obj) for obj in synced_list]
+
+
+def __needs_sync(list_key: tp.Tuple[str, str]) -> bool:
+    if list_key not in __SYNCED_LISTS:
+        return True
+
+    refresh_interval = vara_cfg()["sources"]["refresh_interval"].value
+    return refresh_interval is not None and \
+        time.monotonic() - __SYNCED_LISTS[list_key][0] >= float(
+            refresh_interval
+        )
+
+
+def __sync_github_object_list(
+    cached_object_key: str,
+    load_function: 'tp.Callable[[Github], PaginatedList[PyGithubObj]]',
+    get_cursor: tp.Callable[[PyGithubObj], int]
+) -> tp.List[GithubObject]:
+    """Append the new objects of a list to the cache and return the cached list
+    ordered from old to new."""
+    cursor = _get_cached_pygithub_list_cursor(cached_object_key)
+
+    new_objs: tp.List[PyGithubObj] = []
+    try:
+        # a globally installed HTTP cache would hide new objects
+        with requests_cache.disabled():
+            for obj in load_function(get_github_instance()):
+                if cursor is not None and get_cursor(obj) <= cursor:
+                    break
+                new_objs.append(obj)
+    except (GithubException, requests.exceptions.RequestException) as exc:
+        if cursor is None:
+            raise
+        LOG.warning(
+            f"Could not synchronize {cached_object_key} with GitHub, using "
+            f"the cached list instead: {exc}"
+        )
+        new_objs.clear()
+
+    if new_objs:
+        new_objs.reverse()
+        if cursor is None:
+            # lists cached before without a cursor are replaced
+            _cache_pygithub_object_list(cached_object_key, [])
+        _append_to_cached_pygithub_object_list(
+            cached_object_key, new_objs,
+            max(get_cursor(obj) for obj in new_objs)
+        )
+    LOG.debug(
+        f"Synchronized {len(new_objs)} new objects for {cached_object_key}."
+    )
+
+    return _get_cached_pygithub_object_list(cached_object_key) or []
+
+
+def clear_synced_github_object_lists() -> None:
+    """Forget which lists of GithubObjects were already synchronized, so that
+    they are synchronized again on their next request."""
+    with __SYNC_LOCK:
+        __SYNCED_LISTS.clear()
+
+
 def get_github_repo_name_for_project(
     project: tp.Type[Project]
 ) -> tp.Optional[str]:
@@ -0,0 +1,80 @@
+"""Utility functions for running work in parallel worker processes."""
+
+import multiprocessing
+import os
+import typing as tp
+
+from varats.utils.settings import vara_cfg
+
+ItemTy = tp.TypeVar("ItemTy")
+ResultTy = tp.TypeVar("ResultTy")
+
+# Function and items of the running :func:`fork_map` call. The worker processes
+# are forked, so they inherit both, which are often closures or objects that
+# cannot be pickled.
+__PENDING_MAP: tp.Optional[tp.Tuple[tp.Callable[[tp.Any], tp.Any],
+                                    tp.Sequence[tp.Any]]] = None
+
+
+def get_num_jobs(jobs: tp.Optional[int] = None) -> int:
+    """
+    Resolve the number of worker processes that should be used.
+
+    Args:
+        jobs: requested number of jobs; defaults to the ``cache.jobs`` setting,
+              where 0 means one per CPU core
+
+    Returns:
+        the number of jobs, at least 1
+    """
+    if jobs is None:
+        jobs = int(vara_cfg()["cache"]["jobs"])
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def __call_pending(item_index: int) -> tp.Any:
+    func, items = tp.cast(
+        tp.Tuple[tp.Callable[[tp.Any], tp.Any], tp.Sequence[tp.Any]],
+        __PENDING_MAP
+    )
+    return func(items[item_index])
+
+
+def fork_map(
+    func: tp.Callable[[ItemTy], ResultTy], items: tp.Sequence[ItemTy],
+    jobs: int
+) -> tp.Iterator[ResultTy]:
+    """
+    Lazily apply a function to all items, in a pool of forked worker processes
+    if more than one job is used.
+
+    As the workers are forked, neither the function nor the items need to be
+    picklable, only the results. The items are processed serially if forking
+    is not supported, e.g., on Windows, or inside another ``fork_map`` call.
+
+    Args:
+        func: function applied to every item
+        items: the items to process
+        jobs: maximum number of worker processes
+
+    Yields:
+        the results, in the order of the items
+    """
+    # pylint: disable=global-statement
+    global __PENDING_MAP
+    jobs = min(jobs, len(items))
+    if jobs <= 1 or __PENDING_MAP is not None or \
+            "fork" not in multiprocessing.get_all_start_methods():
+        for item in items:
+            yield func(item)
+        return
+
+    __PENDING_MAP = (func, items)
+    try:
+        with multiprocessing.get_context("fork").Pool(jobs) as pool:
+            for result in pool.imap(__call_pending, range(len(items))):
+                yield tp.cast(ResultTy, result)
+    finally:
+        __PENDING_MAP = None
@@ -0,0 +1,85 @@
+"""Utilities for registries of plugins, like plots, tables, or reports, that are
+defined in separate modules."""
+
+import importlib
+import typing as tp
+
+PluginTy = tp.TypeVar("PluginTy")
+
+
+class LazyRegistry(tp.Dict[str, PluginTy]):
+    """
+    Registry that maps plugin names to the classes that implement them.
+
+    Classes register themselves when their module is imported. In addition,
+    the modules of plugins can be announced without importing them. Looking
+    up an announced plugin then only imports the module of this plugin, while
+    accessing all values of the registry imports all announced modules.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__plugin_modules: tp.Dict[str, str] = {}
+
+    def add_plugin_modules(self, plugin_modules: tp.Mapping[str, str]) -> None:
+        """
+        Announce the modules that define plugins without importing them.
+
+        Args:
+            plugin_modules: mapping from plugin names to module names
+        """
+        for name, module_name in plugin_modules.items():
+            if not super().__contains__(name):
+                self.__plugin_modules[name] = module_name
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether the class of a plugin is already registered."""
+        return super().__contains__(name)
+
+    def load_all(self) -> None:
+        """Import the modules of all announced plugins."""
+        for module_name in dict.fromkeys(self.__plugin_modules.values()):
+            importlib.import_module(module_name)
+        self.__plugin_modules.clear()
+
+    def __setitem__(self, name: str, plugin: PluginTy) -> None:
+        self.__plugin_modules.pop(name, None)
+        super().__setitem__(name, plugin)
+
+    def __missing__(self, name: str) -> PluginTy:
+        module_name = self.__plugin_modules.get(name)
+        if module_name is None:
+            raise KeyError(name)
+        importlib.import_module(module_name)
+        self.__plugin_modules.pop(name, None)
+        # raises a KeyError if the module does not define the plugin anymore
+        return super().__getitem__(name)
+
+    def __contains__(self, name: object) -> bool:
+        return super().__contains__(name) or name in self.__plugin_modules
+
+    def get(self, name: str, default: tp.Any = None) -> tp.Any:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def keys(self) -> tp.List[str]:  # type: ignore[override]
+        """Names of all registered and announced plugins."""
+        return list(dict.fromkeys([*super().keys(), *self.__plugin_modules]))
+
+    def __iter__(self) -> tp.Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def values(self) -> tp.ValuesView[PluginTy]:  # type: ignore[override]
+        self.load_all()
+        return super().values()
+
+    def items(  # type: ignore[override]
+        self
+    ) -> tp.ItemsView[str, PluginTy]:
+        self.load_all()
+        return super().items()
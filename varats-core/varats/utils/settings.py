@@ -135,6 +135,66 @@ _CFG['experiment'] = {
     },
 }
 
+_CFG['cache'] = {
+    "format": {
+        "default": "parquet",
+        "desc":
+            "Storage format of the files in the data cache (csv or parquet). "
+            "Cache files of other formats are converted on first access."
+    },
+    "max_delta_segments": {
+        "default": 16,
+        "desc":
+            "Number of delta segments that incremental updates append to a "
+            "cache file before it gets compacted. With 0, every update "
+            "rewrites the whole cache file."
+    },
+    "jobs": {
+        "default": 1,
+        "desc":
+            "Number of worker processes that create missing cache entries. "
+            "With 0, one worker per CPU core is used."
+    },
+    "blame_report_sidecars": {
+        "default": False,
+        "desc":
+            "Store a binary copy (.brpt) of every loaded blame report in the "
+            "data cache and load it instead of parsing the yaml file again. "
+            "Sidecars can also be created ahead of time with "
+            "vara-gen-blame-sidecars."
+    },
+    "data_manager_max_size": {
+        "default": 2 * 1024**3,
+        "desc":
+            "Maximum size in bytes (estimated by the file sizes) of the loaded "
+            "files that the data manager keeps in memory. Least recently used "
+            "files are evicted first. With 0, the size is not limited."
+    },
+    "data_manager_hash_content": {
+        "default": False,
+        "desc":
+            "Identify files in the data manager by a sha256 hash of their "
+            "content instead of their path, size, and modification time."
+    },
+}
+
+_CFG['sources'] = {
+    "offline": {
+        "default": False,
+        "desc":
+            "Never fetch project sources or query GitHub for new data. Only "
+            "repositories that are already available locally and cached "
+            "GitHub data can be used."
+    },
+    "refresh_interval": {
+        "default": None,
+        "desc":
+            "Number of seconds after which a project source or cached GitHub "
+            "data is fetched again when it is requested. If not set, every "
+            "source is fetched at most once per process."
+    },
+}
+
 _CFG['plots'] = {
     "plot_dir": {
         "desc": "Folder for generated plots",
@@ -27,6 +27,7 @@ setup(
         "seaborn>=0.8.0",
         "matplotlib>=3.1.2",
         "pandas>=0.22.0",
+        "pyarrow>=1.0.0",
         "benchbuild>=6.0.1",
         "plumbum>=1.6.6",
         "wllvm>=1.1.4",
@@ -64,6 +65,8 @@ setup(
             'vara-gen-bbconfig = '
             'varats.tools.driver_gen_benchbuild_config:main',
             'vara-gen-commitmap = varats.tools.driver_gen_commitmap:main',
+            'vara-gen-blame-sidecars = '
+            'varats.tools.driver_gen_blame_sidecars:main',
             'vara-pc = varats.tools.driver_paper_config:main',
             'vara-plot = varats.tools.driver_plot:main',
             'vara-table = varats.tools.driver_table:main',
@@ -1,11 +1,15 @@
 """Utility functions and class to allow easier caching of pandas dataframes and
 other data."""
+import abc
 import logging
 import typing as tp
+from functools import partial
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from varats.utils.parallel_util import fork_map, get_num_jobs
 from varats.utils.settings import vara_cfg
 
 LOG = logging.getLogger(__name__)
@@ -13,8 +17,145 @@ LOG = logging.getLogger(__name__)
 CACHE_ID_COL = 'cache_revision'
 CACHE_TIMESTAMP_COL = 'cache_timestamp'
 
+INDEX_SEGMENT_COL = 'cache_segment'
+INDEX_OFFSET_COL = 'cache_offset'
+INDEX_LENGTH_COL = 'cache_length'
 
-def get_data_file_path(data_id: str, project_name: str) -> Path:
+
+class CacheBackend(abc.ABC):
+    """
+    Storage backend that persists cached dataframes to disk.
+
+    Subclasses register themselves under a ``name`` that can be selected with
+    the ``cache/format`` config option and provide the ``file_suffix`` of the
+    files they write.
+    """
+
+    BACKENDS: tp.Dict[str, 'CacheBackend'] = {}
+
+    NAME: str
+    FILE_SUFFIX: str
+    LEGACY_SUFFIXES: tp.Tuple[str, ...] = ()
+
+    @classmethod
+    def __init_subclass__(
+        cls, *args: tp.Any, name: str, file_suffix: str, **kwargs: tp.Any
+    ) -> None:
+        super().__init_subclass__(*args, **kwargs)
+        cls.NAME = name
+        cls.FILE_SUFFIX = file_suffix
+        CacheBackend.BACKENDS[name] = cls()
+
+    @abc.abstractmethod
+    def load(
+        self,
+        file_path: Path,
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Load a cached dataframe from disk.
+
+        Args:
+            file_path: path to the cache file
+            columns: if given, only these columns are loaded
+
+        Returns:
+            the cached dataframe
+        """
+
+    @abc.abstractmethod
+    def store(self, file_path: Path, dataframe: pd.DataFrame) -> None:
+        """
+        Persist a dataframe to disk.
+
+        Args:
+            file_path: path to the cache file
+            dataframe: pandas dataframe to store
+        """
+
+
+class CSVCacheBackend(CacheBackend, name="csv", file_suffix=".csv.gz"):
+    """Stores cached dataframes as gzipped csv files."""
+
+    # uncompressed csv files written by older versions of the tool suite
+    LEGACY_SUFFIXES = (".csv",)
+
+    def load(
+        self,
+        file_path: Path,
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> pd.DataFrame:
+        # csv files lose type information, so we need to make sure that the
+        # cache columns are read back as strings
+        dataframe = pd.read_csv(
+            str(file_path),
+            index_col=0,
+            compression='infer',
+            dtype={
+                CACHE_ID_COL: str,
+                CACHE_TIMESTAMP_COL: str
+            }
+        )
+        if columns is None:
+            return dataframe
+        return dataframe[columns]
+
+    def store(self, file_path: Path, dataframe: pd.DataFrame) -> None:
+        dataframe.to_csv(str(file_path), compression='infer')
+
+
+class ParquetCacheBackend(
+    CacheBackend, name="parquet", file_suffix=".parquet"
+):
+    """
+    Stores cached dataframes as typed, columnar parquet files.
+
+    In contrast to csv files, parquet files keep the column types and allow
+    loading only a subset of the columns.
+    """
+
+    def load(
+        self,
+        file_path: Path,
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> pd.DataFrame:
+        return pd.read_parquet(str(file_path), columns=columns)
+
+    def store(self, file_path: Path, dataframe: pd.DataFrame) -> None:
+        dataframe.to_parquet(str(file_path))
+
+
+def get_cache_backend(name: tp.Optional[str] = None) -> CacheBackend:
+    """
+    Look up a cache backend by name.
+
+    Args:
+        name: name of the backend; if not given, the backend configured in the
+              ``cache/format`` config option is used
+
+    Returns:
+        the matching cache backend
+
+    Test:
+    >>> get_cache_backend("csv").FILE_SUFFIX
+    '.csv.gz'
+    """
+    if name is None:
+        name = str(vara_cfg()["cache"]["format"])
+
+    if name not in CacheBackend.BACKENDS:
+        raise LookupError(
+            f"Unknown cache format '{name}'. Available formats: "
+            f"{', '.join(CacheBackend.BACKENDS)}"
+        )
+    return CacheBackend.BACKENDS[name]
+
+
+def get_data_file_path(
+    data_id: str,
+    project_name: str,
+    backend: tp.Optional[CacheBackend] = None
+) -> Path:
     """
     Compose the identifier and project into a file path that points to the
     corresponding cache file in the cache directory.
@@ -22,39 +163,282 @@ def get_data_file_path(data_id: str, project_name: str) -> Path:
     Args:
         data_id: identifier or identifier_name of the dataframe
         project_name: name of the project
+        backend: the cache backend that handles the file; if not given, the
+                 configured backend is used
 
     Test:
-    >>> str(get_data_file_path("foo", "tmux"))
+    >>> str(get_data_file_path("foo", "tmux", get_cache_backend("csv")))
     'data_cache/foo-tmux.csv.gz'
 
+    >>> str(get_data_file_path("foo", "tmux", get_cache_backend("parquet")))
+    'data_cache/foo-tmux.parquet'
+
     >>> isinstance(get_data_file_path("foo.csv", "tmux"), Path)
     True
     """
+    if backend is None:
+        backend = get_cache_backend()
+
     return Path(
         str(vara_cfg()["data_cache"])
-    ) / f"{data_id}-{project_name}.csv.gz"
+    ) / f"{data_id}-{project_name}{backend.FILE_SUFFIX}"
 
 
-def load_cached_df_or_none(data_id: str,
-                           project_name: str) -> tp.Optional[pd.DataFrame]:
+def get_segment_file_path(
+    data_id: str,
+    project_name: str,
+    segment: int,
+    backend: tp.Optional[CacheBackend] = None
+) -> Path:
     """
-    Load cached dataframe from disk, otherwise return None.
+    Compose the path of a segment of a cache file.
+
+    Segment ``0`` is the compacted base cache file, all other segments are delta
+    segments that were appended by incremental cache updates.
+
+    Args:
+        data_id: identifier or identifier_name of the dataframe
+        project_name: name of the project
+        segment: number of the segment
+        backend: the cache backend that handles the file; if not given, the
+                 configured backend is used
+
+    Test:
+    >>> str(get_segment_file_path("foo", "tmux", 0, get_cache_backend("csv")))
+    'data_cache/foo-tmux.csv.gz'
+
+    >>> str(get_segment_file_path("foo", "tmux", 2, get_cache_backend("csv")))
+    'data_cache/foo-tmux.delta2.csv.gz'
+    """
+    if backend is None:
+        backend = get_cache_backend()
+
+    if segment == 0:
+        return get_data_file_path(data_id, project_name, backend)
+
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / f"{data_id}-{project_name}.delta{segment}{backend.FILE_SUFFIX}"
+
+
+def get_index_file_path(
+    data_id: str,
+    project_name: str,
+    backend: tp.Optional[CacheBackend] = None
+) -> Path:
+    """
+    Compose the path of the index file of a cache file.
+
+    The index maps every cache entry to its timestamp and the position of its
+    rows in the cache segments.
 
     Args:
         data_id: identifier or identifier_name of the dataframe
         project_name: name of the project
+        backend: the cache backend that handles the file; if not given, the
+                 configured backend is used
+
+    Test:
+    >>> str(get_index_file_path("foo", "tmux", get_cache_backend("parquet")))
+    'data_cache/foo-tmux.index.parquet'
+    """
+    if backend is None:
+        backend = get_cache_backend()
+
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / f"{data_id}-{project_name}.index{backend.FILE_SUFFIX}"
+
+
+def __create_empty_cache_index() -> pd.DataFrame:
+    return pd.DataFrame({
+        CACHE_ID_COL: pd.Series([], dtype=str),
+        CACHE_TIMESTAMP_COL: pd.Series([], dtype=str),
+        INDEX_SEGMENT_COL: pd.Series([], dtype='int64'),
+        INDEX_OFFSET_COL: pd.Series([], dtype='int64'),
+        INDEX_LENGTH_COL: pd.Series([], dtype='int64')
+    })
+
+
+def __load_cache_index_or_none(
+    data_id: str, project_name: str, backend: CacheBackend
+) -> tp.Optional[pd.DataFrame]:
+    index_file_path = get_index_file_path(data_id, project_name, backend)
+    if not index_file_path.exists():
+        return None
+    return backend.load(index_file_path)
+
+
+def __create_cache_index(
+    data_id: str, project_name: str, backend: CacheBackend
+) -> pd.DataFrame:
     """
+    Create the index for a base cache file that was written without one.
 
-    file_path = get_data_file_path(data_id, project_name)
+    All rows of one cache entry are expected to be stored next to each other.
+    If this is not the case, the rows of the cache file get reordered.
+    """
+    file_path = get_data_file_path(data_id, project_name, backend)
     if not file_path.exists():
-        # fall back to uncompressed file if present for seamless migration
-        # to cache file compression
-        if Path(str(file_path)[:-3]).exists():
-            file_path = Path(str(file_path)[:-3])
-        else:
-            return None
+        return __create_empty_cache_index()
+
+    cache_ids = backend.load(file_path, [CACHE_ID_COL, CACHE_TIMESTAMP_COL])
+    entry_starts = np.flatnonzero(
+        (cache_ids[CACHE_ID_COL] != cache_ids[CACHE_ID_COL].shift()).to_numpy()
+    )
+    index = pd.DataFrame({
+        CACHE_ID_COL:
+            cache_ids[CACHE_ID_COL].to_numpy()[entry_starts],
+        CACHE_TIMESTAMP_COL:
+            cache_ids[CACHE_TIMESTAMP_COL].to_numpy()[entry_starts],
+        INDEX_SEGMENT_COL:
+            0,
+        INDEX_OFFSET_COL:
+            entry_starts,
+        INDEX_LENGTH_COL:
+            np.diff(np.append(entry_starts, len(cache_ids)))
+    })
+
+    if index[CACHE_ID_COL].duplicated().any():
+        LOG.info(f"Reordering cache file {file_path}")
+        data_frame = backend.load(file_path)
+        entry_order = np.argsort(
+            pd.factorize(data_frame[CACHE_ID_COL])[0], kind="stable"
+        )
+        backend.store(
+            file_path, data_frame.iloc[entry_order].reset_index(drop=True)
+        )
+        return __create_cache_index(data_id, project_name, backend)
+
+    return index
+
+
+def __load_cache_segments(
+    data_id: str,
+    project_name: str,
+    backend: CacheBackend,
+    index: pd.DataFrame,
+    columns: tp.Optional[tp.List[str]] = None
+) -> pd.DataFrame:
+    """Assemble the rows of all entries in the index from the cache
+    segments."""
+    if index.empty:
+        return backend.load(
+            get_data_file_path(data_id, project_name, backend), columns
+        ).iloc[0:0].reset_index(drop=True)
+
+    data_frames = []
+    for segment, entries in index.sort_values(
+        [INDEX_SEGMENT_COL, INDEX_OFFSET_COL]
+    ).groupby(INDEX_SEGMENT_COL):
+        offsets = entries[INDEX_OFFSET_COL].to_numpy()
+        lengths = entries[INDEX_LENGTH_COL].to_numpy()
+        # expand the (offset, length) pairs into the row positions of the
+        # entries without looping over them
+        rows = np.repeat(offsets - (np.cumsum(lengths) - lengths), lengths) + \
+            np.arange(lengths.sum())
+        data_frames.append(
+            backend.load(
+                get_segment_file_path(data_id, project_name, segment, backend),
+                columns
+            ).iloc[rows]
+        )
+
+    return pd.concat(data_frames, ignore_index=True, sort=False)
+
+
+def __load_cache_file(
+    data_id: str,
+    project_name: str,
+    backend: CacheBackend,
+    columns: tp.Optional[tp.List[str]] = None
+) -> pd.DataFrame:
+    index = __load_cache_index_or_none(data_id, project_name, backend)
+    if index is None:
+        return backend.load(
+            get_data_file_path(data_id, project_name, backend), columns
+        )
+    return __load_cache_segments(
+        data_id, project_name, backend, index, columns
+    )
+
+
+def __remove_cache_files(
+    data_id: str, project_name: str, backend: CacheBackend
+) -> None:
+    """Remove the base cache file together with its delta segments and
+    index."""
+    file_path = get_data_file_path(data_id, project_name, backend)
+    for delta_path in file_path.parent.glob(
+        f"{data_id}-{project_name}.delta*{backend.FILE_SUFFIX}"
+    ):
+        delta_path.unlink()
+    for path in [
+        get_index_file_path(data_id, project_name, backend), file_path
+    ]:
+        if path.exists():
+            path.unlink()
+
+
+def __migrate_cache_file(
+    data_id: str, project_name: str, backend: CacheBackend
+) -> bool:
+    """
+    Convert a cache file written by another backend, or an older version of the
+    tool suite, into the format of the given backend.
+
+    Returns:
+        ``True`` if a cache file was migrated
+    """
+    file_path = get_data_file_path(data_id, project_name, backend)
+    for old_backend in CacheBackend.BACKENDS.values():
+        old_file_path = get_data_file_path(data_id, project_name, old_backend)
+        if old_backend is not backend and old_file_path.exists():
+            LOG.info(f"Migrating cache file {old_file_path} to {file_path}")
+            backend.store(
+                file_path,
+                __load_cache_file(data_id, project_name, old_backend)
+            )
+            __remove_cache_files(data_id, project_name, old_backend)
+            return True
+
+        for suffix in old_backend.LEGACY_SUFFIXES:
+            old_path = old_file_path.with_name(
+                old_file_path.name[:-len(old_backend.FILE_SUFFIX)] + suffix
+            )
+            if old_path.exists():
+                LOG.info(f"Migrating cache file {old_path} to {file_path}")
+                backend.store(file_path, old_backend.load(old_path))
+                old_path.unlink()
+                return True
+
+    return False
 
-    return pd.read_csv(str(file_path), index_col=0, compression='infer')
+
+def load_cached_df_or_none(
+    data_id: str,
+    project_name: str,
+    columns: tp.Optional[tp.List[str]] = None
+) -> tp.Optional[pd.DataFrame]:
+    """
+    Load cached dataframe from disk, otherwise return None.
+
+    Cache files stored in a different format than the configured one are
+    transparently converted on first access.
+
+    Args:
+        data_id: identifier or identifier_name of the dataframe
+        project_name: name of the project
+        columns: if given, only load these columns
+    """
+    backend = get_cache_backend()
+    file_path = get_data_file_path(data_id, project_name, backend)
+    if not file_path.exists() and not __migrate_cache_file(
+        data_id, project_name, backend
+    ):
+        return None
+
+    return __load_cache_file(data_id, project_name, backend, columns)
 
 
 def cache_dataframe(
@@ -63,13 +447,97 @@ def cache_dataframe(
     """
     Cache a dataframe by persisting it to disk.
 
+    This replaces the whole cache file, including all delta segments that were
+    appended by :func:`build_cached_report_table`.
+
     Args:
         data_id: identifier or identifier_name of the dataframe
         project_name: name of the project
         dataframe: pandas dataframe to store
     """
-    file_path = get_data_file_path(data_id, project_name)
-    dataframe.to_csv(str(file_path), compression='infer')
+    backend = get_cache_backend()
+    __remove_cache_files(data_id, project_name, backend)
+    backend.store(get_data_file_path(data_id, project_name, backend), dataframe)
+
+
+def __compact_cache(
+    data_id: str, project_name: str, backend: CacheBackend,
+    index: pd.DataFrame
+) -> None:
+    """Merge all delta segments of a cache file into a new base file."""
+    LOG.info(f"Compacting cache file for {data_id}-{project_name}")
+    data_frame = __load_cache_segments(data_id, project_name, backend, index)
+
+    index = index.sort_values([INDEX_SEGMENT_COL, INDEX_OFFSET_COL])
+    lengths = index[INDEX_LENGTH_COL].to_numpy()
+    index = index.assign(
+        **{
+            INDEX_SEGMENT_COL: 0,
+            INDEX_OFFSET_COL: np.cumsum(lengths) - lengths
+        }
+    ).reset_index(drop=True)
+
+    __remove_cache_files(data_id, project_name, backend)
+    backend.store(
+        get_data_file_path(data_id, project_name, backend), data_frame
+    )
+    backend.store(get_index_file_path(data_id, project_name, backend), index)
+
+
+def __update_cache(
+    data_id: str, project_name: str, backend: CacheBackend,
+    index: pd.DataFrame, new_entries: tp.List[tp.Tuple[str, str,
+                                                       pd.DataFrame]],
+    dropped_entries: tp.List[str]
+) -> None:
+    """
+    Append new cache entries as a delta segment and drop outdated entries.
+
+    Only the new segment and the index are written, the rows of outdated
+    entries stay in their segments until the cache gets compacted.
+    """
+    new_entry_ids = [entry_id for entry_id, _, _ in new_entries]
+    index = index[~index[CACHE_ID_COL].
+                  isin(new_entry_ids + dropped_entries)].copy()
+
+    if new_entries:
+        # the base file can be replaced if none of its rows are used anymore
+        segment = int(index[INDEX_SEGMENT_COL].max() +
+                      1) if not index.empty else 0
+        lengths = np.array([len(entry) for _, _, entry in new_entries])
+        backend.store(
+            get_segment_file_path(data_id, project_name, segment, backend),
+            pd.concat([entry for _, _, entry in new_entries],
+                      ignore_index=True,
+                      sort=False)
+        )
+        index = pd.concat([
+            index,
+            pd.DataFrame({
+                CACHE_ID_COL:
+                    new_entry_ids,
+                CACHE_TIMESTAMP_COL: [
+                    entry_timestamp for _, entry_timestamp, _ in new_entries
+                ],
+                INDEX_SEGMENT_COL:
+                    segment,
+                INDEX_OFFSET_COL:
+                    np.cumsum(lengths) - lengths,
+                INDEX_LENGTH_COL:
+                    lengths
+            })
+        ],
+                          ignore_index=True)
+
+    num_delta_segments = index[INDEX_SEGMENT_COL].nunique() - int(
+        (index[INDEX_SEGMENT_COL] == 0).any()
+    )
+    if num_delta_segments > int(vara_cfg()["cache"]["max_delta_segments"]):
+        __compact_cache(data_id, project_name, backend, index)
+    else:
+        backend.store(
+            get_index_file_path(data_id, project_name, backend), index
+        )
 
 
 InDataType = tp.TypeVar("InDataType")
@@ -79,11 +547,76 @@ def __create_cache_entry(
     create_df_from_report: tp.Callable[[InDataType], tp.Tuple[pd.DataFrame, str,
                                                               str]],
     data: InDataType
-) -> pd.DataFrame:
+) -> tp.Tuple[str, str, pd.DataFrame]:
     new_df, entry_id, entry_timestamp = create_df_from_report(data)
     new_df[CACHE_ID_COL] = entry_id
     new_df[CACHE_TIMESTAMP_COL] = entry_timestamp
-    return new_df
+    return entry_id, entry_timestamp, new_df
+
+
+def __create_cache_entries(
+    create_df_from_report: tp.Callable[[InDataType], tp.Tuple[pd.DataFrame, str,
+                                                              str]],
+    data_entries: tp.List[InDataType], description: str
+) -> tp.List[tp.Tuple[str, str, pd.DataFrame]]:
+    """
+    Create the cache entries for a list of data items.
+
+    If more than one job is configured in ``cache/jobs``, the entries are
+    created in a pool of forked worker processes. The created entries are
+    always returned in the order of the data items.
+    """
+    new_entries = []
+    for num, new_entry in enumerate(
+        fork_map(
+            partial(__create_cache_entry, create_df_from_report), data_entries,
+            get_num_jobs()
+        )
+    ):
+        LOG.info(
+            f"{description} ({(num + 1)}/{len(data_entries)}): "
+            f"{data_entries[num]}"
+        )
+        new_entries.append(new_entry)
+    return new_entries
+
+
+def __find_changed_entries(
+    cache_index: pd.DataFrame, data_entries: tp.List[InDataType],
+    get_entry_id: tp.Callable[[InDataType], str],
+    get_entry_timestamp: tp.Callable[[InDataType], str],
+    is_newer_timestamp: tp.Callable[[str, str], bool]
+) -> tp.Tuple[tp.List[InDataType], tp.List[InDataType]]:
+    """
+    Split data items into items that are missing in the cache and items that
+    are newer than their cached entry.
+
+    The cached timestamps are joined with the data items through a hash map, so
+    every item is only looked up, and its timestamp computed, once.
+
+    Returns:
+        a tuple with the missing and the newer data items
+    """
+    first_entries = cache_index.drop_duplicates(CACHE_ID_COL)
+    cached_timestamps: tp.Dict[str, str] = dict(
+        zip(
+            first_entries[CACHE_ID_COL].to_numpy(),
+            first_entries[CACHE_TIMESTAMP_COL].to_numpy()
+        )
+    )
+
+    missing_entries: tp.List[InDataType] = []
+    newer_entries: tp.List[InDataType] = []
+    for data_entry in data_entries:
+        cached_timestamp = cached_timestamps.get(get_entry_id(data_entry), None)
+        if cached_timestamp is None:
+            missing_entries.append(data_entry)
+        elif is_newer_timestamp(
+            get_entry_timestamp(data_entry), cached_timestamp
+        ):
+            newer_entries.append(data_entry)
+
+    return missing_entries, newer_entries
 
 
 def build_cached_report_table(
@@ -94,11 +627,17 @@ def build_cached_report_table(
                                                                 str, str]],
     get_entry_id: tp.Callable[[InDataType], str],
     get_entry_timestamp: tp.Callable[[InDataType], str],
-    is_newer_timestamp: tp.Callable[[str, str], bool]
+    is_newer_timestamp: tp.Callable[[str, str], bool],
+    columns: tp.Optional[tp.List[str]] = None
 ) -> pd.DataFrame:
     """
     Build up an automatically cache dataframe.
 
+    The cache is updated incrementally: new and updated entries are appended to
+    the cache file as a delta segment and an index keeps track of the rows that
+    belong to each entry. Once there are more than ``cache/max_delta_segments``
+    delta segments, they are compacted into a single file.
+
     Args:
         data_id: graph cache identifier
         project_name: name of the project to work with
@@ -111,81 +650,60 @@ def build_cached_report_table(
                              to determine which of two data items is newer
         is_newer_timestamp: checks whether one data item is newer than another
                             based on their timestamps
+        columns: if given, only these columns are loaded from the cache
+
+    Returns:
+        a dataframe with all cached data items without the internal cache
+        columns
     """
+    backend = get_cache_backend()
+    file_path = get_data_file_path(data_id, project_name, backend)
+    if not file_path.exists():
+        __migrate_cache_file(data_id, project_name, backend)
 
     # mypy needs this
-    optional_cached_df = load_cached_df_or_none(data_id, project_name)
-    if optional_cached_df is None:
-        cached_df = create_empty_df()
-        cached_df[CACHE_ID_COL] = ""
-        cached_df[CACHE_TIMESTAMP_COL] = ""
+    optional_index = __load_cache_index_or_none(data_id, project_name, backend)
+    if optional_index is None:
+        cache_index = __create_cache_index(data_id, project_name, backend)
     else:
-        cached_df = optional_cached_df
-
-    def is_missing_file(report_file: InDataType) -> bool:
-        return not tp.cast(
-            bool, (cached_df[CACHE_ID_COL] == get_entry_id(report_file)).any()
-        )
-
-    def is_newer_file(report_file: InDataType) -> bool:
-        cached_entry = cached_df[cached_df[CACHE_ID_COL] ==
-                                 get_entry_id(report_file)][CACHE_TIMESTAMP_COL]
-
-        if len(cached_entry) > 0:
-            return is_newer_timestamp(
-                get_entry_timestamp(report_file), cached_entry.iloc[0]
-            )
-        # We found no existing entry, so it will never be considered for
-        # updating and does not need to be deleted.
-        return False
-
-    missing_entries = [
-        entry for entry in data_to_load if is_missing_file(entry)
-    ]
-
-    updated_entries = [entry for entry in data_to_load if is_newer_file(entry)]
-
-    failed_entries = [
-        get_entry_id(entry) for entry in data_to_drop if is_newer_file(entry)
-    ]
-
-    new_data_frames = []
-    for num, data_entry in enumerate(missing_entries):
-        LOG.info(
-            f"Creating missing entry ({(num + 1)}/"
-            f"{len(missing_entries)}): {data_entry}"
-        )
-        new_data_frames.append(
-            __create_cache_entry(create_cache_entry_data, data_entry)
-        )
-
-    new_df = pd.concat([cached_df] + new_data_frames,
-                       ignore_index=True,
-                       sort=False)
-
-    new_df.set_index(CACHE_ID_COL, inplace=True)
-    for num, data_entry in enumerate(updated_entries):
-        LOG.info(
-            f"Updating outdated entry "
-            f"({(num + 1)}/{len(updated_entries)}): {data_entry}"
-        )
-        updated_entry = __create_cache_entry(
-            create_cache_entry_data, data_entry
-        )
-        updated_entry.set_index(CACHE_ID_COL, inplace=True)
-        new_df.update(updated_entry)
-    new_df.reset_index(inplace=True)
+        cache_index = optional_index
+
+    missing_entries, updated_entries = __find_changed_entries(
+        cache_index, data_to_load, get_entry_id, get_entry_timestamp,
+        is_newer_timestamp
+    )
+
+    # We found no existing entry for missing entries, so they do not need to
+    # be deleted.
+    _, dropped_entries = __find_changed_entries(
+        cache_index, data_to_drop, get_entry_id, get_entry_timestamp,
+        is_newer_timestamp
+    )
+    failed_entries = [get_entry_id(entry) for entry in dropped_entries]
+
+    new_entries = __create_cache_entries(
+        create_cache_entry_data, missing_entries, "Creating missing entry"
+    ) + __create_cache_entries(
+        create_cache_entry_data, updated_entries, "Updating outdated entry"
+    )
 
     if len(failed_entries) > 0:
         LOG.info(f"Dropping {len(failed_entries)} entries")
-        new_df.drop(
-            new_df[new_df[CACHE_ID_COL].isin(failed_entries)].index,
-            inplace=True
+
+    if new_entries or failed_entries:
+        __update_cache(
+            data_id, project_name, backend, cache_index, new_entries,
+            failed_entries
         )
 
-    cache_dataframe(data_id, project_name, new_df)
+    if file_path.exists():
+        data_frame = __load_cache_file(
+            data_id, project_name, backend, columns
+        )
+    else:
+        data_frame = create_empty_df()
 
-    return new_df.loc[:, [
-        col for col in new_df.columns
+    return data_frame.loc[:, [
+        col for col in (data_frame.columns if columns is None else columns)
         if col not in [CACHE_ID_COL, CACHE_TIMESTAMP_COL]
     ]]
@@ -8,36 +8,45 @@ addition, this speeds up reloading of files, for example, in interactive plots,
 like in jupyter notebooks, where we sometimes re-execute triggers a file load.
 """
 
-import hashlib
 import os
 import typing as tp
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from threading import Lock
 
 from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 
 from varats.report.report import BaseReport
+from varats.utils.filesystem_util import sha256_checksum
+from varats.utils.settings import vara_cfg
 
 LoadableType = tp.TypeVar('LoadableType', bound=BaseReport)
 
 
-def sha256_checksum(file_path: Path, block_size: int = 65536) -> str:
+def get_file_key(file_path: Path, hash_content: bool = False) -> str:
     """
-    Compute sha256 checksum of file.
+    Compute the key that identifies a file in the data manager.
+
+    By default, the key is derived from the path, size, and modification time
+    of the file, which only requires a ``stat`` call. With ``hash_content``,
+    the key is the sha256 checksum of the file instead, which also detects
+    files that were replaced without changing their size and modification
+    time, but requires reading the whole file.
 
     Args:
         file_path: path to the file
-        block_size: amount of bytes read per cycle
+        hash_content: whether to hash the content of the file
 
     Returns:
-        sha256 hash of the file
+        key for the file
     """
-    sha256 = hashlib.sha256()
-    with open(file_path, "rb") as file_h:
-        for block in iter(lambda: file_h.read(block_size), b''):
-            sha256.update(block)
-    sha256.update(bytes(file_path.name, 'utf-8'))
-    return sha256.hexdigest()
+    if hash_content:
+        return sha256_checksum(file_path)
+
+    file_stat = os.stat(file_path)
+    return f"{os.path.abspath(file_path)}:{file_stat.st_size}:" \
+        f"{file_stat.st_mtime_ns}"
 
 
 class FileBlob():
@@ -49,12 +58,16 @@ class FileBlob():
         key: identifier for the file
         file_path: path to the file
         data: a blob of data in memory
+        size: estimated size of the data in bytes
     """
 
-    def __init__(self, key: str, file_path: Path, data: LoadableType) -> None:
+    def __init__(
+        self, key: str, file_path: Path, data: LoadableType, size: int = 0
+    ) -> None:
         self.__key = key
         self.__file_path = file_path
         self.__class_object = data
+        self.__size = size
 
     @property
     def key(self) -> str:
@@ -71,11 +84,71 @@ class FileBlob():
         """The loaded DataClass from the file."""
         return self.__class_object
 
+    @property
+    def size(self) -> int:
+        """Estimated size of the loaded DataClass in bytes."""
+        return self.__size
+
+
+class CacheStatistics():
+    """Snapshot of the cache statistics of a :class:`DataManager`."""
+
+    def __init__(
+        self, hits: int, misses: int, evictions: int, num_entries: int,
+        size: int, max_size: int
+    ) -> None:
+        self.__hits = hits
+        self.__misses = misses
+        self.__evictions = evictions
+        self.__num_entries = num_entries
+        self.__size = size
+        self.__max_size = max_size
+
+    @property
+    def hits(self) -> int:
+        """Number of loads that were served from the cache."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Number of loads that had to load the file."""
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of files that were evicted from the cache."""
+        return self.__evictions
+
+    @property
+    def num_entries(self) -> int:
+        """Number of files currently in the cache."""
+        return self.__num_entries
+
+    @property
+    def size(self) -> int:
+        """Estimated size of all files currently in the cache in bytes."""
+        return self.__size
+
+    @property
+    def max_size(self) -> int:
+        """Size limit of the cache in bytes; 0 means unlimited."""
+        return self.__max_size
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of loads that were served from the cache."""
+        num_loads = self.__hits + self.__misses
+        return self.__hits / num_loads if num_loads else 0.0
+
+    def __str__(self) -> str:
+        return f"hits={self.hits} misses={self.misses} " \
+            f"hit_rate={self.hit_rate:.2%} evictions={self.evictions} " \
+            f"entries={self.num_entries} size={self.size}/{self.max_size}"
+
 
 class FileSignal(QObject):
     """Emit signals after the file was loaded."""
     finished = pyqtSignal(object)
-    clean = pyqtSignal()
 
 
 class FileLoader(QRunnable):
@@ -96,7 +169,14 @@ class FileLoader(QRunnable):
         """Run the file loading method."""
         loaded_data_class = self.func(self.file_path, self.class_type)
         self.signal.finished.emit(loaded_data_class)
-        self.signal.clean.emit()
+
+
+def _create_data_class(
+    DataClassTy: tp.Type[LoadableType], file_path: Path
+) -> LoadableType:
+    # pylint: disable=invalid-name
+    """Create a DataClass in a worker process of the batch loader."""
+    return DataClassTy(file_path)
 
 
 class DataManager():
@@ -105,32 +185,171 @@ class DataManager():
 
     The DataManager handles the concurrent file loading, creation of DataClasses
     and caching of loaded files.
+
+    Loaded files are kept in a least recently used cache, which is bounded by
+    the estimated size of the loaded files (see the ``cache`` section of the
+    vara config). Different files are loaded concurrently, while concurrent
+    requests for the same file wait for a single load of the file.
     """
 
     def __init__(self) -> None:
-        self.file_map: tp.Dict[str, FileBlob] = dict()
+        self.file_map: tp.OrderedDict[str, FileBlob] = OrderedDict()
         self.thread_pool = QThreadPool()
-        self.loader_lock = Lock()
+        # guards the cache and the pending loads, but is never held while a
+        # file is loaded
+        self.__cache_lock = Lock()
+        self.__pending_loads: tp.Dict[str, 'Future[BaseReport]'] = {}
+        self.__cache_size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @staticmethod
+    def __get_max_cache_size() -> int:
+        return int(vara_cfg()["cache"]["data_manager_max_size"])
+
+    @staticmethod
+    def __get_key(file_path: Path, DataClassTy: tp.Type[LoadableType]) -> str:
+        # pylint: disable=invalid-name
+        return DataClassTy.__name__ + ":" + get_file_key(
+            file_path, bool(vara_cfg()["cache"]["data_manager_hash_content"])
+        )
+
+    def __evict_files(self, max_size: int) -> None:
+        """Evict the least recently used files until the cache fits into
+        ``max_size`` bytes."""
+        while self.file_map and self.__cache_size > max_size:
+            _, evicted_blob = self.file_map.popitem(last=False)
+            self.__cache_size -= evicted_blob.size
+            self.__evictions += 1
+
+    def __lookup_or_reserve(
+        self, key: str
+    ) -> tp.Tuple[tp.Optional[FileBlob], 'Future[BaseReport]', bool]:
+        """
+        Look up a file in the cache or reserve it for loading.
+
+        Must be called while holding the cache lock.
+
+        Returns:
+            the cached blob, if the file is already loaded, the future of the
+            load of the file, and whether the caller has to load the file
+        """
+        cached_blob = self.file_map.get(key, None)
+        if cached_blob is not None:
+            self.__hits += 1
+            self.file_map.move_to_end(key)
+            return cached_blob, Future(), False
+
+        pending_load = self.__pending_loads.get(key, None)
+        if pending_load is not None:
+            self.__hits += 1
+            return None, pending_load, False
+
+        self.__misses += 1
+        pending_load = Future()
+        self.__pending_loads[key] = pending_load
+        return None, pending_load, True
+
+    def __finish_load(
+        self, key: str, file_path: Path, pending_load: 'Future[BaseReport]',
+        data: tp.Optional[BaseReport], error: tp.Optional[BaseException]
+    ) -> None:
+        """
+        Insert a loaded file into the cache and wake up all requests that wait
+        for it.
+
+        The future of the load is always resolved, so waiting requests never
+        block forever. If the file cannot be inserted into the cache, e.g.,
+        because it was removed after loading, the future reports this error.
+        """
+        try:
+            with self.__cache_lock:
+                self.__pending_loads.pop(key, None)
+                if error is None:
+                    new_blob = FileBlob(
+                        key, file_path, tp.cast(BaseReport, data),
+                        os.path.getsize(file_path)
+                    )
+                    self.file_map[key] = new_blob
+                    self.__cache_size += new_blob.size
+
+                    max_size = self.__get_max_cache_size()
+                    if max_size > 0:
+                        self.__evict_files(max_size)
+        except Exception as insert_error:  # pylint: disable=broad-except
+            error = insert_error
+        finally:
+            if error is None:
+                pending_load.set_result(tp.cast(BaseReport, data))
+            else:
+                pending_load.set_exception(error)
 
     def __load_data_class(
         self, file_path: Path, DataClassTy: tp.Type[LoadableType]
     ) -> LoadableType:
         # pylint: disable=invalid-name
         """Load a DataClass of type <DataClassTy> from a file."""
-        self.loader_lock.acquire()
-
-        key = sha256_checksum(file_path)
-        if key in self.file_map:
-            return tp.cast(LoadableType, self.file_map[key].data)
+        key = self.__get_key(file_path, DataClassTy)
+        with self.__cache_lock:
+            cached_blob, pending_load, needs_load = self.__lookup_or_reserve(
+                key
+            )
+        if cached_blob is not None:
+            return tp.cast(LoadableType, cached_blob.data)
+        if not needs_load:
+            return tp.cast(LoadableType, pending_load.result())
 
         try:
-            new_blob = FileBlob(key, file_path, DataClassTy(file_path))
-        except Exception as e:
-            self.loader_lock.release()
-            raise e
-        self.file_map[key] = new_blob
+            data = DataClassTy(file_path)
+        except BaseException as e:
+            self.__finish_load(key, file_path, pending_load, None, e)
+            raise
+        self.__finish_load(key, file_path, pending_load, data, None)
+        return tp.cast(LoadableType, pending_load.result())
+
+    def __load_in_worker_processes(
+        self, loads: tp.Dict[str, Path], results: tp.Dict[str,
+                                                          'Future[BaseReport]'],
+        DataClassTy: tp.Type[LoadableType], num_jobs: int
+    ) -> None:
+        # pylint: disable=invalid-name
+        with ProcessPoolExecutor(num_jobs) as executor:
+            worker_loads = {
+                key:
+                executor.submit(_create_data_class, DataClassTy, file_path)
+                for key, file_path in loads.items()
+            }
+            for key, worker_load in worker_loads.items():
+                error = worker_load.exception()
+                self.__finish_load(
+                    key, loads[key], results[key],
+                    None if error else worker_load.result(), error
+                )
 
-        return tp.cast(LoadableType, new_blob.data)
+    @property
+    def cache_statistics(self) -> CacheStatistics:
+        """Statistics about the cache of loaded files, e.g., for profiling."""
+        with self.__cache_lock:
+            return CacheStatistics(
+                self.__hits, self.__misses, self.__evictions,
+                len(self.file_map), self.__cache_size,
+                self.__get_max_cache_size()
+            )
+
+    def reset_cache_statistics(self) -> None:
+        """Reset the hit, miss, and eviction counters of the cache."""
+        with self.__cache_lock:
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+
+    def clear_cache(self) -> None:
+        """Remove all loaded files from the cache."""
+        with self.__cache_lock:
+            self.__evictions += len(self.file_map)
+            self.file_map.clear()
+            self.__cache_size = 0
 
     def load_data_class(
         self, file_path: Path, DataClassTy: tp.Type[LoadableType],
@@ -150,7 +369,6 @@ class DataManager():
 
         worker = FileLoader(self.__load_data_class, file_path, DataClassTy)
         worker.signal.finished.connect(loaded_callback)
-        worker.signal.clean.connect(self._release_lock)
         self.thread_pool.start(worker)
 
     def load_data_class_sync(
@@ -170,12 +388,97 @@ class DataManager():
         if not os.path.isfile(file_path):
             raise FileNotFoundError
 
-        loaded_file = self.__load_data_class(file_path, DataClassTy)
-        self._release_lock()
-        return loaded_file
+        return self.__load_data_class(file_path, DataClassTy)
+
+    def load_data_classes(
+        self,
+        file_paths: tp.Sequence[Path],
+        DataClassTy: tp.Type[LoadableType],
+        jobs: tp.Optional[int] = None
+    ) -> tp.List[LoadableType]:
+        # pylint: disable=invalid-name
+        """
+        Load DataClasses of type <DataClassTy> from multiple files.
+
+        Files that are not cached yet are loaded in a pool of worker
+        processes, so parsing the files is not limited by the global
+        interpreter lock.
+
+        Args:
+            file_paths: to the files
+            DataClassTy: type of the report class to be loaded
+            jobs: number of worker processes; defaults to the number of CPUs
 
-    def _release_lock(self) -> None:
-        self.loader_lock.release()
+        Returns:
+            the loaded report files in the order of ``file_paths``
+        """
+        for file_path in file_paths:
+            if not os.path.isfile(file_path):
+                raise FileNotFoundError(file_path)
+
+        keys = [
+            self.__get_key(file_path, DataClassTy) for file_path in file_paths
+        ]
+        results, loads = self.__reserve_loads(keys, file_paths)
+        self.__load_files(
+            loads, results, DataClassTy,
+            min(jobs if jobs else (os.cpu_count() or 1), len(loads))
+        )
+
+        return [tp.cast(LoadableType, results[key].result()) for key in keys]
+
+    def __reserve_loads(
+        self, keys: tp.List[str], file_paths: tp.Sequence[Path]
+    ) -> tp.Tuple[tp.Dict[str, 'Future[BaseReport]'], tp.Dict[str, Path]]:
+        """
+        Look up files in the cache or reserve them for loading.
+
+        Returns:
+            the future of every key and the files that have to be loaded
+        """
+        results: tp.Dict[str, 'Future[BaseReport]'] = {}
+        loads: tp.Dict[str, Path] = {}
+        with self.__cache_lock:
+            for key, file_path in zip(keys, file_paths):
+                if key in results:
+                    continue
+                cached_blob, pending_load, needs_load = \
+                    self.__lookup_or_reserve(key)
+                if cached_blob is not None:
+                    pending_load.set_result(cached_blob.data)
+                elif needs_load:
+                    loads[key] = file_path
+                results[key] = pending_load
+        return results, loads
+
+    def __load_files(
+        self, loads: tp.Dict[str, Path], results: tp.Dict[str,
+                                                          'Future[BaseReport]'],
+        DataClassTy: tp.Type[LoadableType], num_jobs: int
+    ) -> None:
+        # pylint: disable=invalid-name
+        """Load the reserved files, in worker processes if more than one job
+        is used, and resolve their futures."""
+        try:
+            if num_jobs > 1:
+                self.__load_in_worker_processes(
+                    loads, results, DataClassTy, num_jobs
+                )
+                return
+
+            for key, file_path in loads.items():
+                try:
+                    data = DataClassTy(file_path)
+                except Exception as e:  # pylint: disable=broad-except
+                    self.__finish_load(key, file_path, results[key], None, e)
+                else:
+                    self.__finish_load(key, file_path, results[key], data, None)
+        except BaseException as e:
+            # never leave loads pending that other requests may wait for
+            for key, file_path in loads.items():
+                if not results[key].done():
+                    self.__finish_load(key, file_path, results[key], None, e)
+            raise
 
 
 VDM = DataManager()
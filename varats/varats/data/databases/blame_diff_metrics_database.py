@@ -1,5 +1,6 @@
 """Module for diff based commit-data metrics."""
 import typing as tp
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from itertools import chain
 from pathlib import Path
@@ -174,27 +175,25 @@ class BlameDiffMetricsDatabase(
             )
 
         def get_predecessor_report_file(c_hash: str) -> tp.Optional[Path]:
-            commit_time_id = commit_map.short_time_id(c_hash)
-            pred_commits = [(short_time_id_cache[rev], rev)
-                            for rev in sampled_revs
-                            if short_time_id_cache[rev] < commit_time_id]
+            pred_idx = bisect_left(
+                sorted_time_ids, commit_map.short_time_id(c_hash)
+            ) - 1
 
-            if not pred_commits:
+            if pred_idx < 0:
                 return None
 
-            pred_report_commit_hash = max(pred_commits, key=lambda x: x[0])[1]
+            pred_report_commit_hash = sorted_revs[pred_idx][1]
             return report_files.get(pred_report_commit_hash[:10], None)
 
         def get_successor_report_file(c_hash: str) -> tp.Optional[Path]:
-            commit_time_id = commit_map.short_time_id(c_hash)
-            succ_commits = [(short_time_id_cache[rev], rev)
-                            for rev in sampled_revs
-                            if short_time_id_cache[rev] > commit_time_id]
+            succ_idx = bisect_right(
+                sorted_time_ids, commit_map.short_time_id(c_hash)
+            )
 
-            if not succ_commits:
+            if succ_idx >= len(sorted_revs):
                 return None
 
-            succ_report_commit_hash = min(succ_commits, key=lambda x: x[0])[1]
+            succ_report_commit_hash = sorted_revs[succ_idx][1]
             return report_files.get(succ_report_commit_hash[:10], None)
 
         report_files: tp.Dict[str, Path] = {
@@ -214,6 +213,13 @@ class BlameDiffMetricsDatabase(
         short_time_id_cache: tp.Dict[str, int] = {
             rev: commit_map.short_time_id(rev) for rev in sampled_revs
         }
+        # sampled revisions ordered by time, to find the closest predecessor
+        # or successor of a revision with a binary search
+        sorted_revs = sorted(
+            ((short_time_id_cache[rev], rev) for rev in sampled_revs),
+            key=lambda x: x[0]
+        )
+        sorted_time_ids = [time_id for time_id, _ in sorted_revs]
 
         failed_report_files: tp.Dict[str, Path] = {
             MetaReport.get_commit_hash_from_result_file(report.name): report
@@ -250,7 +256,8 @@ class BlameDiffMetricsDatabase(
             create_dataframe_layout, create_data_frame_for_report,
             BlameDiffMetricsDatabase._id_from_paths,
             BlameDiffMetricsDatabase._timestamp_from_paths,
-            BlameDiffMetricsDatabase._compare_timestamps
+            BlameDiffMetricsDatabase._compare_timestamps,
+            columns=kwargs.get("columns", None)
         )
 
         return data_frame
@@ -150,6 +150,7 @@ class BlameVerifierReportDatabase(
             lambda path: MetaReport.get_commit_hash_from_result_file(path.name)
             + path.name.split("-", 1)[0],
             lambda path: str(path.stat().st_mtime_ns),
-            lambda a, b: int(a) > int(b)
+            lambda a, b: int(a) > int(b),
+            columns=kwargs.get("columns", None)
         )
         return data_frame
@@ -86,7 +86,8 @@ class CommitInteractionDatabase(
             create_dataframe_layout, create_data_frame_for_report,
             lambda path: MetaReport.get_commit_hash_from_result_file(path.name),
             lambda path: str(path.stat().st_mtime_ns),
-            lambda a, b: int(a) > int(b)
+            lambda a, b: int(a) > int(b),
+            columns=kwargs.get("columns", None)
         )
 
         return data_frame
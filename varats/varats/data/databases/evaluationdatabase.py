@@ -42,7 +42,7 @@ class EvaluationDatabase(abc.ABC):
     @abc.abstractmethod
     def _load_dataframe(
         cls, project_name: str, commit_map: CommitMap,
-        case_study: tp.Optional[CaseStudy], **kwargs: tp.Dict[str, tp.Any]
+        case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
     ) -> pd.DataFrame:
         """
         Load and transparently cache the dataframe for this database class.
@@ -54,7 +54,9 @@ class EvaluationDatabase(abc.ABC):
             project_name: the project to load data for
             commit_map: the commit map to use
             case_study: the case_study to load data for
-            kwargs: additional arguments used to load data
+            kwargs: additional arguments used to load data; ``columns``
+                    contains the columns that are requested by the caller,
+                    so implementations may skip loading all other columns
 
         Return:
             a pandas dataframe with all the cached data
@@ -65,22 +67,32 @@ class EvaluationDatabase(abc.ABC):
         cls, project_name: str, columns: tp.List[str], commit_map: CommitMap,
         case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
     ) -> pd.DataFrame:
+        if not all(column in cls.COLUMNS for column in columns):
+            raise ValueError(
+                f"All values in 'columns' must be in {cls.__name__}.COLUMNS"
+            )
+
+        # databases that support column projection only need to load the
+        # requested columns and the revision to filter for the case study
+        load_columns = [
+            column for column in cls.COLUMNS
+            if column in columns or column == "revision"
+        ]
         data: pd.DataFrame = cls._load_dataframe(
-            project_name, commit_map, case_study, **kwargs
+            project_name,
+            commit_map,
+            case_study,
+            columns=load_columns,
+            **kwargs
         )
 
-        if not [*data] == cls.COLUMNS:
+        if [*data] not in (cls.COLUMNS, load_columns):
             raise AssertionError(
                 "Loaded dataframe does not match expected layout."
                 "Consider removing the cache file "
                 f"{get_data_file_path(cls.CACHE_ID, project_name)}."
             )
 
-        if not all(column in cls.COLUMNS for column in columns):
-            raise ValueError(
-                f"All values in 'columns' must be in {cls.__name__}.COLUMNS"
-            )
-
         def cs_filter(data_frame: pd.DataFrame) -> pd.DataFrame:
             """Filter out all commits that are not in the case study if one was
             selected."""
@@ -1,8 +1,9 @@
 """This modules handles auto discovering of reports from the tool suite."""
 
-from varats.data import reports as __REPORTS__
+from varats.ts_utils.plugin_manifest import initialize_plugins
 
 
 def initialize_reports() -> None:
-    # Discover and initialize all Reports
-    __REPORTS__.discover()
+    # Discover and initialize all Reports, report modules are imported on first
+    # use
+    initialize_plugins("reports")
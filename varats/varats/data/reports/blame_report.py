@@ -1,6 +1,9 @@
 """Module for BlameReport, a collection of blame interactions."""
 
+import logging
 import typing as tp
+import zipfile
+from array import array
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime
@@ -12,7 +15,16 @@ import yaml
 
 from varats.base.version_header import VersionHeader
 from varats.report.report import BaseReport, FileStatusExtension, MetaReport
-from varats.utils.git_util import map_commits, CommitRepoPair, CommitLookupTy
+from varats.utils.filesystem_util import atomic_write, sha256_checksum
+from varats.utils.git_util import (
+    CommitLookupTy,
+    CommitRepoPair,
+    MappedCommitResultType,
+    map_commits,
+)
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
 
 
 class BlameInstInteractions():
@@ -24,6 +36,8 @@ class BlameInstInteractions():
     instruction.
     """
 
+    __slots__ = ("__base_hash", "__interacting_hashes", "__amount")
+
     def __init__(
         self, base_hash: CommitRepoPair,
         interacting_hashes: tp.List[CommitRepoPair], amount: int
@@ -147,7 +161,7 @@ class BlameResultFunctionEntry():
         str_representation = "{name} ({demangled_name})\n".format(
             name=self.name, demangled_name=self.demangled_name
         )
-        for inst in self.__inst_list:
+        for inst in self.interactions:
             str_representation += "  - {}".format(inst)
         return str_representation
 
@@ -217,6 +231,523 @@ class BlameReportMetaData():
         return BlameReportMetaData(num_functions, num_instructions)
 
 
+class BlameInteractionTable():
+    """
+    Compact, array-backed storage for all blame interactions of a report.
+
+    Every distinct commit-repository pair is stored only once in the commit
+    table and interactions refer to it by index. The interacting commits of
+    all interactions are stored in one flat array, where the commits of
+    interaction ``i`` are located between ``interacting_offsets[i]`` and
+    ``interacting_offsets[i + 1]``. In the same way, the interactions of
+    function ``f`` are located between ``function_offsets[f]`` and
+    ``function_offsets[f + 1]``.
+    """
+
+    __slots__ = (
+        "__commits", "__function_names", "__demangled_names",
+        "__function_offsets", "__base_commits", "__amounts",
+        "__interacting_offsets", "__interacting_commits"
+    )
+
+    def __init__(
+        self, commits: tp.List[CommitRepoPair], function_names: tp.List[str],
+        demangled_names: tp.List[str], function_offsets: np.ndarray,
+        base_commits: np.ndarray, amounts: np.ndarray,
+        interacting_offsets: np.ndarray, interacting_commits: np.ndarray
+    ) -> None:
+        self.__commits = commits
+        self.__function_names = function_names
+        self.__demangled_names = demangled_names
+        self.__function_offsets = function_offsets
+        self.__base_commits = base_commits
+        self.__amounts = amounts
+        self.__interacting_offsets = interacting_offsets
+        self.__interacting_commits = interacting_commits
+
+    @staticmethod
+    def create_interaction_table(
+        function_entries: tp.Iterable[BlameResultFunctionEntry]
+    ) -> 'BlameInteractionTable':
+        """Creates a `BlameInteractionTable` from a collection of function
+        entries."""
+        builder = _BlameInteractionTableBuilder()
+        for func_entry in function_entries:
+            for interaction in func_entry.interactions:
+                builder.add_interaction(
+                    builder.add_commit_repo_pair(interaction.base_commit), [
+                        builder.add_commit_repo_pair(commit)
+                        for commit in interaction.interacting_commits
+                    ], interaction.amount
+                )
+            builder.add_function(func_entry.name, func_entry.demangled_name)
+        return builder.build()
+
+    @property
+    def commits(self) -> tp.List[CommitRepoPair]:
+        """Table of all distinct commits that occur in the interactions."""
+        return self.__commits
+
+    @property
+    def function_names(self) -> tp.List[str]:
+        """Mangled names of all functions."""
+        return self.__function_names
+
+    @property
+    def demangled_names(self) -> tp.List[str]:
+        """Demangled names of all functions."""
+        return self.__demangled_names
+
+    @property
+    def function_offsets(self) -> np.ndarray:
+        """Start offsets of the interactions of every function."""
+        return self.__function_offsets
+
+    @property
+    def base_commits(self) -> np.ndarray:
+        """Index of the base commit of every interaction."""
+        return self.__base_commits
+
+    @property
+    def amounts(self) -> np.ndarray:
+        """Amount of every interaction."""
+        return self.__amounts
+
+    @property
+    def interacting_offsets(self) -> np.ndarray:
+        """Start offsets of the interacting commits of every interaction."""
+        return self.__interacting_offsets
+
+    @property
+    def interacting_commits(self) -> np.ndarray:
+        """Indices of the interacting commits of all interactions."""
+        return self.__interacting_commits
+
+    @property
+    def num_interactions(self) -> int:
+        """Number of interactions in the table."""
+        return len(self.__amounts)
+
+    @property
+    def degrees(self) -> np.ndarray:
+        """Number of interacting commits of every interaction."""
+        return tp.cast(np.ndarray, np.diff(self.__interacting_offsets))
+
+    def interacting_commit_ids(self, interaction_idx: int) -> np.ndarray:
+        """Indices of the interacting commits of one interaction."""
+        return self.__interacting_commits[
+            self.__interacting_offsets[interaction_idx]:self.
+            __interacting_offsets[interaction_idx + 1]]
+
+    def create_interaction(self, interaction_idx: int) -> BlameInstInteractions:
+        """Creates the `BlameInstInteractions` object for one interaction."""
+        return BlameInstInteractions(
+            self.__commits[self.__base_commits[interaction_idx]], [
+                self.__commits[commit_idx]
+                for commit_idx in self.interacting_commit_ids(interaction_idx)
+            ], int(self.__amounts[interaction_idx])
+        )
+
+    def create_function_interactions(
+        self, function_idx: int
+    ) -> tp.List[BlameInstInteractions]:
+        """Creates the `BlameInstInteractions` objects for all interactions of
+        one function."""
+        return [
+            self.create_interaction(interaction_idx)
+            for interaction_idx in range(
+                self.__function_offsets[function_idx],
+                self.__function_offsets[function_idx + 1]
+            )
+        ]
+
+
+class _BlameInteractionTableBuilder():
+    """Collects interactions and interns their commits while building up a
+    `BlameInteractionTable`."""
+
+    def __init__(self) -> None:
+        self.__commit_ids: tp.Dict[tp.Tuple[str, str], int] = {}
+        self.__commits: tp.List[CommitRepoPair] = []
+        self.__function_names: tp.List[str] = []
+        self.__demangled_names: tp.List[str] = []
+        self.__function_offsets = array('q', [0])
+        self.__base_commits = array('l')
+        self.__amounts = array('q')
+        self.__interacting_offsets = array('q', [0])
+        self.__interacting_commits = array('l')
+
+    def add_commit(self, commit_hash: str, repo_name: str) -> int:
+        """Interns a commit and returns its index in the commit table."""
+        commit_key = (commit_hash, repo_name)
+        commit_id = self.__commit_ids.get(commit_key, None)
+        if commit_id is None:
+            commit_id = len(self.__commits)
+            self.__commit_ids[commit_key] = commit_id
+            self.__commits.append(CommitRepoPair(commit_hash, repo_name))
+        return commit_id
+
+    def add_raw_commit(self, raw_hash: str) -> int:
+        """Interns a commit given as ``<hash>[-<repo>]`` string."""
+        commit_hash, *repo_name = raw_hash.split('-', maxsplit=1)
+        return self.add_commit(
+            commit_hash, repo_name[0] if repo_name else "Unknown"
+        )
+
+    def add_commit_repo_pair(self, commit: CommitRepoPair) -> int:
+        """Interns a `CommitRepoPair`."""
+        return self.add_commit(commit.commit_hash, commit.repository_name)
+
+    def add_interaction(
+        self, base_commit: int, interacting_commits: tp.List[int], amount: int
+    ) -> None:
+        """Adds an interaction to the function that is currently built."""
+        # keep the same order as BlameInstInteractions
+        interacting_commits.sort(
+            key=lambda commit_id: (
+                self.__commits[commit_id].commit_hash, self.__commits[
+                    commit_id].repository_name
+            )
+        )
+        self.__base_commits.append(base_commit)
+        self.__amounts.append(amount)
+        self.__interacting_commits.extend(interacting_commits)
+        self.__interacting_offsets.append(len(self.__interacting_commits))
+
+    def add_function(self, name: str, demangled_name: str) -> None:
+        """Finishes a function with all interactions added since the last
+        function."""
+        self.__function_names.append(name)
+        self.__demangled_names.append(demangled_name)
+        self.__function_offsets.append(len(self.__amounts))
+
+    def build(self) -> BlameInteractionTable:
+        """Creates the `BlameInteractionTable`."""
+        return BlameInteractionTable(
+            self.__commits, self.__function_names, self.__demangled_names,
+            np.array(self.__function_offsets, dtype=np.int64),
+            np.array(self.__base_commits, dtype=np.int32),
+            np.array(self.__amounts, dtype=np.int64),
+            np.array(self.__interacting_offsets, dtype=np.int64),
+            np.array(self.__interacting_commits, dtype=np.int32)
+        )
+
+
+def _skip_yaml_node(loader: yaml.CLoader) -> None:
+    """Skips the next yaml node, including all of its children."""
+    depth = 0
+    while True:
+        event = loader.get_event()
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
+
+
+def _get_yaml_scalar(loader: yaml.CLoader) -> str:
+    event = loader.get_event()
+    if not isinstance(event, yaml.ScalarEvent):
+        raise AssertionError(f"Expected a yaml scalar but got {event}")
+    return tp.cast(str, event.value)
+
+
+def _expect_yaml_event(
+    loader: yaml.CLoader, event_type: tp.Type[yaml.Event]
+) -> None:
+    event = loader.get_event()
+    if not isinstance(event, event_type):
+        raise AssertionError(f"Expected {event_type.__name__} but got {event}")
+
+
+def _parse_blame_inst_interaction(
+    loader: yaml.CLoader, builder: _BlameInteractionTableBuilder
+) -> None:
+    base_commit = -1
+    interacting_commits: tp.List[int] = []
+    amount = 0
+
+    _expect_yaml_event(loader, yaml.MappingStartEvent)
+    while not loader.check_event(yaml.MappingEndEvent):
+        key = _get_yaml_scalar(loader)
+        if key == 'base-hash':
+            base_commit = builder.add_raw_commit(_get_yaml_scalar(loader))
+        elif key == 'interacting-hashes':
+            _expect_yaml_event(loader, yaml.SequenceStartEvent)
+            while not loader.check_event(yaml.SequenceEndEvent):
+                interacting_commits.append(
+                    builder.add_raw_commit(_get_yaml_scalar(loader))
+                )
+            loader.get_event()
+        elif key == 'amount':
+            amount = int(_get_yaml_scalar(loader))
+        else:
+            _skip_yaml_node(loader)
+    loader.get_event()
+
+    builder.add_interaction(base_commit, interacting_commits, amount)
+
+
+def _parse_blame_result_map(
+    loader: yaml.CLoader, builder: _BlameInteractionTableBuilder
+) -> None:
+    _expect_yaml_event(loader, yaml.MappingStartEvent)
+    while not loader.check_event(yaml.MappingEndEvent):
+        name = _get_yaml_scalar(loader)
+        demangled_name = name
+
+        _expect_yaml_event(loader, yaml.MappingStartEvent)
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = _get_yaml_scalar(loader)
+            if key == 'demangled-name':
+                demangled_name = _get_yaml_scalar(loader)
+            elif key == 'insts':
+                _expect_yaml_event(loader, yaml.SequenceStartEvent)
+                while not loader.check_event(yaml.SequenceEndEvent):
+                    _parse_blame_inst_interaction(loader, builder)
+                loader.get_event()
+            else:
+                _skip_yaml_node(loader)
+        loader.get_event()
+
+        builder.add_function(name, demangled_name)
+    loader.get_event()
+
+
+def parse_blame_interaction_table(
+    loader: yaml.CLoader
+) -> BlameInteractionTable:
+    """
+    Parses the result document of a blame report into a
+    `BlameInteractionTable`.
+
+    The document is processed as a stream of yaml events, so no intermediate
+    python objects are created for the whole document.
+
+    Args:
+        loader: yaml loader that is positioned in front of the result document
+    """
+    builder = _BlameInteractionTableBuilder()
+
+    _expect_yaml_event(loader, yaml.DocumentStartEvent)
+    _expect_yaml_event(loader, yaml.MappingStartEvent)
+    while not loader.check_event(yaml.MappingEndEvent):
+        if _get_yaml_scalar(loader) == 'result-map':
+            _parse_blame_result_map(loader, builder)
+        else:
+            _skip_yaml_node(loader)
+    loader.get_event()
+    _expect_yaml_event(loader, yaml.DocumentEndEvent)
+
+    return builder.build()
+
+
+BlameReportData = tp.Tuple[BlameReportMetaData, BlameInteractionTable]
+
+BLAME_REPORT_SIDECAR_SUFFIX = ".brpt"
+_BLAME_REPORT_SIDECAR_VERSION = 1
+
+
+def _parse_blame_report_data(report_path: Path) -> BlameReportData:
+    with open(report_path, 'r') as stream:
+        loader = yaml.CLoader(stream)
+        try:
+            version_header = VersionHeader(loader.get_data())
+            version_header.raise_if_not_type("BlameReport")
+            version_header.raise_if_version_is_less_than(3)
+
+            meta_data = BlameReportMetaData.create_blame_report_meta_data(
+                loader.get_data()
+            )
+
+            return meta_data, parse_blame_interaction_table(loader)
+        finally:
+            loader.dispose()
+
+
+def _pack_strings(strings: tp.List[str]) -> np.ndarray:
+    return np.frombuffer("\0".join(strings).encode("utf-8"), dtype=np.uint8)
+
+
+def _unpack_strings(packed_strings: np.ndarray, count: int) -> tp.List[str]:
+    if count == 0:
+        return []
+    return packed_strings.tobytes().decode("utf-8").split("\0")
+
+
+def get_blame_report_sidecar_path(checksum: str) -> Path:
+    """
+    Computes the path of the binary sidecar file of a blame report.
+
+    Sidecar files live in the data cache and are keyed by the checksum of the
+    yaml report, so they never get out of sync with the report they were
+    created from.
+
+    Args:
+        checksum: sha256 checksum of the yaml report file
+
+    Test:
+    >>> str(get_blame_report_sidecar_path("e3b0c442"))
+    'data_cache/blame_reports/e3b0c442.brpt'
+    """
+    return Path(str(vara_cfg()["data_cache"])
+               ) / "blame_reports" / (checksum + BLAME_REPORT_SIDECAR_SUFFIX)
+
+
+def _store_blame_report_sidecar(
+    sidecar_path: Path, checksum: str, report_data: BlameReportData
+) -> None:
+    meta_data, table = report_data
+
+    # write to a temporary file first, so concurrent loads never see a
+    # partially written sidecar
+    with atomic_write(sidecar_path) as tmp_sidecar_path:
+        with open(tmp_sidecar_path, "wb") as sidecar_file:
+            np.savez(
+                sidecar_file,
+                version=np.array(_BLAME_REPORT_SIDECAR_VERSION),
+                checksum=np.array(checksum),
+                num_functions=np.array(meta_data.num_functions),
+                num_instructions=np.array(meta_data.num_instructions),
+                num_commits=np.array(len(table.commits)),
+                commit_hashes=_pack_strings([
+                    commit.commit_hash for commit in table.commits
+                ]),
+                repository_names=_pack_strings([
+                    commit.repository_name for commit in table.commits
+                ]),
+                function_names=_pack_strings(table.function_names),
+                demangled_names=_pack_strings(table.demangled_names),
+                function_offsets=table.function_offsets,
+                base_commits=table.base_commits,
+                amounts=table.amounts,
+                interacting_offsets=table.interacting_offsets,
+                interacting_commits=table.interacting_commits
+            )
+
+
+def _load_blame_report_sidecar(
+    sidecar_path: Path, checksum: str
+) -> tp.Optional[BlameReportData]:
+    if not sidecar_path.exists():
+        return None
+
+    try:
+        with np.load(sidecar_path, allow_pickle=False) as sidecar:
+            if int(sidecar["version"]) != _BLAME_REPORT_SIDECAR_VERSION or \
+                    str(sidecar["checksum"]) != checksum:
+                return None
+
+            num_commits = int(sidecar["num_commits"])
+            function_offsets = sidecar["function_offsets"]
+            num_functions = len(function_offsets) - 1
+            commits = [
+                CommitRepoPair(commit_hash, repository_name)
+                for commit_hash, repository_name in zip(
+                    _unpack_strings(sidecar["commit_hashes"], num_commits),
+                    _unpack_strings(sidecar["repository_names"], num_commits)
+                )
+            ]
+            table = BlameInteractionTable(
+                commits,
+                _unpack_strings(sidecar["function_names"], num_functions),
+                _unpack_strings(sidecar["demangled_names"], num_functions),
+                function_offsets, sidecar["base_commits"], sidecar["amounts"],
+                sidecar["interacting_offsets"], sidecar["interacting_commits"]
+            )
+            meta_data = BlameReportMetaData(
+                int(sidecar["num_functions"]), int(sidecar["num_instructions"])
+            )
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        LOG.warning(f"Ignoring unreadable blame report sidecar {sidecar_path}")
+        return None
+
+    return meta_data, table
+
+
+def load_blame_report_data(report_path: Path) -> BlameReportData:
+    """
+    Loads the meta data and interactions of a blame report.
+
+    Reports are parsed from yaml without touching the data cache, unless blame
+    report sidecars are enabled in the cache config. Then, the data is loaded
+    from the binary sidecar of the report, and reports without a sidecar are
+    parsed from yaml and a sidecar is created for future loads.
+
+    Args:
+        report_path: path to the yaml report file
+
+    Returns:
+        the meta data and the interaction table of the report
+    """
+    if not vara_cfg()["cache"]["blame_report_sidecars"]:
+        return _parse_blame_report_data(report_path)
+
+    checksum = sha256_checksum(report_path)
+    sidecar_path = get_blame_report_sidecar_path(checksum)
+    report_data = _load_blame_report_sidecar(sidecar_path, checksum)
+    if report_data is None:
+        report_data = _parse_blame_report_data(report_path)
+        _store_blame_report_sidecar(sidecar_path, checksum, report_data)
+
+    return report_data
+
+
+def create_blame_report_sidecar(
+    report_path: Path, overwrite: bool = False
+) -> bool:
+    """
+    Creates the binary sidecar file of a blame report.
+
+    Args:
+        report_path: path to the yaml report file
+        overwrite: whether to recreate already existing sidecar files
+
+    Returns:
+        ``True``, if a new sidecar file was written
+    """
+    checksum = sha256_checksum(report_path)
+    sidecar_path = get_blame_report_sidecar_path(checksum)
+    if not overwrite and sidecar_path.exists():
+        return False
+
+    _store_blame_report_sidecar(
+        sidecar_path, checksum, _parse_blame_report_data(report_path)
+    )
+    return True
+
+
+class _LazyBlameResultFunctionEntry(BlameResultFunctionEntry):
+    """Function entry that creates its interactions on demand from the
+    `BlameInteractionTable` of a report."""
+
+    def __init__(
+        self, interaction_table: BlameInteractionTable, function_idx: int
+    ) -> None:
+        super().__init__(
+            interaction_table.function_names[function_idx],
+            interaction_table.demangled_names[function_idx], []
+        )
+        self.__interaction_table = interaction_table
+        self.__function_idx = function_idx
+
+    @property
+    def interactions(self) -> tp.List[BlameInstInteractions]:
+        """List of found instruction blame-interactions."""
+        return self.__interaction_table.create_function_interactions(
+            self.__function_idx
+        )
+
+    def __deepcopy__(
+        self, memo: tp.Dict[int, tp.Any]
+    ) -> BlameResultFunctionEntry:
+        # copies do not need to keep the whole interaction table alive
+        return BlameResultFunctionEntry(
+            self.name, self.demangled_name, deepcopy(self.interactions, memo)
+        )
+
+
 class BlameReport(BaseReport):
     """Full blame report containing all blame interactions."""
 
@@ -226,27 +757,17 @@ class BlameReport(BaseReport):
     def __init__(self, path: Path) -> None:
         super().__init__(path)
         self.__path = path
-        with open(path, 'r') as stream:
-            documents = yaml.load_all(stream, Loader=yaml.CLoader)
-            version_header = VersionHeader(next(documents))
-            version_header.raise_if_not_type("BlameReport")
-            version_header.raise_if_version_is_less_than(3)
+        self.__meta_data, self.__interaction_table = load_blame_report_data(
+            path
+        )
 
-            self.__meta_data = BlameReportMetaData \
-                .create_blame_report_meta_data(next(documents))
-
-            self.__function_entries: tp.Dict[str,
-                                             BlameResultFunctionEntry] = dict()
-            raw_blame_report = next(documents)
-            for raw_func_entry in raw_blame_report['result-map']:
-                new_function_entry = (
-                    BlameResultFunctionEntry.create_blame_result_function_entry(
-                        raw_func_entry,
-                        raw_blame_report['result-map'][raw_func_entry]
-                    )
-                )
-                self.__function_entries[new_function_entry.name
-                                       ] = new_function_entry
+        # function entries create their interactions only when accessed
+        self.__function_entries: tp.Dict[str, BlameResultFunctionEntry] = {
+            function_name: _LazyBlameResultFunctionEntry(
+                self.__interaction_table, function_idx
+            ) for function_idx, function_name in
+            enumerate(self.__interaction_table.function_names)
+        }
 
     def get_blame_result_function_entry(
         self, mangled_function_name: str
@@ -264,6 +785,11 @@ class BlameReport(BaseReport):
         """Iterate over all function entries."""
         return self.__function_entries.values()
 
+    @property
+    def interaction_table(self) -> BlameInteractionTable:
+        """Compact table of all interactions in the report."""
+        return self.__interaction_table
+
     @property
     def head_commit(self) -> str:
         """The current HEAD commit under which this CommitReport was created."""
@@ -317,6 +843,7 @@ class BlameReportDiff():
         self, base_report: BlameReport, prev_report: BlameReport
     ) -> None:
         self.__function_entries: tp.Dict[str, BlameResultFunctionEntry] = dict()
+        self.__interaction_table: tp.Optional[BlameInteractionTable] = None
         self.__base_head = base_report.head_commit
         self.__prev_head = prev_report.head_commit
         self.__calc_diff_br(base_report, prev_report)
@@ -334,6 +861,16 @@ class BlameReportDiff():
         """Iterate over all function entries in the diff."""
         return self.__function_entries.values()
 
+    @property
+    def interaction_table(self) -> BlameInteractionTable:
+        """Compact table of all interactions in the diff."""
+        if self.__interaction_table is None:
+            self.__interaction_table = \
+                BlameInteractionTable.create_interaction_table(
+                    self.__function_entries.values()
+                )
+        return self.__interaction_table
+
     def get_blame_result_function_entry(
         self, mangled_function_name: str
     ) -> BlameResultFunctionEntry:
@@ -410,21 +947,27 @@ class BlameReportDiff():
         return str_representation
 
 
-ElementType = tp.TypeVar('ElementType')
-
-
-def __count_elements(
-    report: tp.Union[BlameReport, BlameReportDiff],
-    get_elements_from_interaction: tp.Callable[[BlameInstInteractions],
-                                               tp.Iterable[ElementType]]
-) -> int:
-    elements: tp.Set[ElementType] = set()
-
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            elements.update(get_elements_from_interaction(interaction))
-
-    return len(elements)
+def __map_interacting_commits(
+    interaction_table: BlameInteractionTable,
+    func: tp.Callable[[pygit2.Commit], MappedCommitResultType],
+    commit_lookup: CommitLookupTy
+) -> tp.Dict[int, MappedCommitResultType]:
+    """Maps a function over all distinct interacting commits, skipping the
+    0000 hashes that mark uncommitted files."""
+    commit_ids = np.unique(interaction_table.interacting_commits).tolist()
+    return dict(
+        zip((
+            commit_id for commit_id in commit_ids
+            if interaction_table.commits[commit_id].commit_hash !=
+            "0000000000000000000000000000000000000000"
+        ),
+            map_commits(
+                func, [
+                    interaction_table.commits[commit_id]
+                    for commit_id in commit_ids
+                ], commit_lookup
+            ))
+    )
 
 
 def count_interactions(report: tp.Union[BlameReport, BlameReportDiff]) -> int:
@@ -437,13 +980,7 @@ def count_interactions(report: tp.Union[BlameReport, BlameReportDiff]) -> int:
     Returns:
         the number of interactions in this report or diff
     """
-    amount = 0
-
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            amount += abs(interaction.amount)
-
-    return amount
+    return int(np.abs(report.interaction_table.amounts).sum())
 
 
 def count_interacting_commits(
@@ -458,9 +995,7 @@ def count_interacting_commits(
     Returns:
         the number unique interacting commits in this report or diff
     """
-    return __count_elements(
-        report, lambda interaction: interaction.interacting_commits
-    )
+    return len(np.unique(report.interaction_table.interacting_commits))
 
 
 def count_interacting_authors(
@@ -477,18 +1012,16 @@ def count_interacting_authors(
     Returns:
         the number unique interacting authors in this report or diff
     """
-
-    def extract_interacting_authors(
-        interaction: BlameInstInteractions
-    ) -> tp.Iterable[str]:
-        return map_commits(
-            # Issue (se-passau/VaRA#647): improve author uniquifying
-            lambda c: tp.cast(str, c.author.name),
-            interaction.interacting_commits,
-            commit_lookup
+    return len(
+        set(
+            __map_interacting_commits(
+                report.interaction_table,
+                # Issue (se-passau/VaRA#647): improve author uniquifying
+                lambda c: c.author.name,
+                commit_lookup
+            ).values()
         )
-
-    return __count_elements(report, extract_interacting_authors)
+    )
 
 
 def generate_degree_tuples(
@@ -508,10 +1041,12 @@ def generate_degree_tuples(
     """
     degree_dict: tp.DefaultDict[int, int] = defaultdict(int)
 
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            degree = len(interaction.interacting_commits)
-            degree_dict[degree] += interaction.amount
+    interaction_table = report.interaction_table
+    for degree, amount in zip(
+        interaction_table.degrees.tolist(),
+        interaction_table.amounts.tolist()
+    ):
+        degree_dict[degree] += amount
 
     return list(degree_dict.items())
 
@@ -536,17 +1071,23 @@ def generate_author_degree_tuples(
 
     degree_dict: tp.DefaultDict[int, int] = defaultdict(int)
 
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            author_list = map_commits(
-                # Issue (se-passau/VaRA#647): improve author uniquifying
-                lambda c: tp.cast(str, c.author.name),
-                interaction.interacting_commits,
-                commit_lookup
-            )
+    interaction_table = report.interaction_table
+    commit_authors = __map_interacting_commits(
+        interaction_table,
+        # Issue (se-passau/VaRA#647): improve author uniquifying
+        lambda c: c.author.name,
+        commit_lookup
+    )
 
-            degree = len(set(author_list))
-            degree_dict[degree] += interaction.amount
+    for interaction_idx, amount in enumerate(
+        interaction_table.amounts.tolist()
+    ):
+        degree = len({
+            commit_authors[commit_id] for commit_id in interaction_table.
+            interacting_commit_ids(interaction_idx).tolist()
+            if commit_id in commit_authors
+        })
+        degree_dict[degree] += amount
 
     return list(degree_dict.items())
 
@@ -576,35 +1117,44 @@ def generate_time_delta_distribution_tuples(
     """
     degree_dict: tp.DefaultDict[int, int] = defaultdict(int)
 
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            if (
-                interaction.base_commit.commit_hash ==
-                "0000000000000000000000000000000000000000"
-            ):
-                continue
-
-            base_commit = commit_lookup(
-                interaction.base_commit.commit_hash,
-                interaction.base_commit.repository_name
-            )
-            base_c_time = datetime.utcfromtimestamp(base_commit.commit_time)
-
-            def translate_to_time_deltas2(
-                commit: pygit2.Commit,
-                base_time: datetime = base_c_time
-            ) -> int:
-                other_c_time = datetime.utcfromtimestamp(commit.commit_time)
-                return abs((base_time - other_c_time).days)
+    interaction_table = report.interaction_table
+    commit_times = __map_interacting_commits(
+        interaction_table,
+        lambda c: datetime.utcfromtimestamp(c.commit_time), commit_lookup
+    )
+    base_commit_times: tp.Dict[int, datetime] = {}
 
-            author_list = map_commits(
-                translate_to_time_deltas2, interaction.interacting_commits,
-                commit_lookup
+    for interaction_idx, (base_commit_id, amount) in enumerate(
+        zip(
+            interaction_table.base_commits.tolist(),
+            interaction_table.amounts.tolist()
+        )
+    ):
+        base_commit = interaction_table.commits[base_commit_id]
+        if (
+            base_commit.commit_hash ==
+            "0000000000000000000000000000000000000000"
+        ):
+            continue
+
+        if base_commit_id not in base_commit_times:
+            base_commit_times[base_commit_id] = datetime.utcfromtimestamp(
+                commit_lookup(
+                    base_commit.commit_hash, base_commit.repository_name
+                ).commit_time
             )
+        base_c_time = base_commit_times[base_commit_id]
+
+        time_deltas = [
+            abs((base_c_time - commit_times[commit_id]).days)
+            for commit_id in interaction_table.
+            interacting_commit_ids(interaction_idx).tolist()
+            if commit_id in commit_times
+        ]
 
-            degree = aggregate_function(author_list) if author_list else 0
-            bucket = round(degree / bucket_size)
-            degree_dict[bucket] += interaction.amount
+        degree = aggregate_function(time_deltas) if time_deltas else 0
+        bucket = round(degree / bucket_size)
+        degree_dict[bucket] += amount
 
     return list(degree_dict.items())
 
@@ -666,16 +1216,19 @@ def generate_in_head_interactions(
     Args:
         report: BlameReport to get the interactions from
     """
-    head_interactions = []
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            if interaction.base_commit.commit_hash.startswith(
-                report.head_commit
-            ):
-                head_interactions.append(interaction)
-                continue
+    interaction_table = report.interaction_table
+    is_head_commit = np.array([
+        commit.commit_hash.startswith(report.head_commit)
+        for commit in interaction_table.commits
+    ],
+                              dtype=bool)
 
-    return head_interactions
+    return [
+        interaction_table.create_interaction(interaction_idx)
+        for interaction_idx in np.flatnonzero(
+            is_head_commit[interaction_table.base_commits]
+        ).tolist()
+    ]
 
 
 def generate_out_head_interactions(
@@ -688,13 +1241,21 @@ def generate_out_head_interactions(
     Args:
         report: BlameReport to get the interactions from
     """
-    head_interactions = []
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            for interacting_commit in interaction.interacting_commits:
-                if interacting_commit.commit_hash.startswith(
-                    report.head_commit
-                ):
-                    head_interactions.append(interaction)
-                    break
-    return head_interactions
+    interaction_table = report.interaction_table
+    is_head_commit = np.array([
+        commit.commit_hash.startswith(report.head_commit)
+        for commit in interaction_table.commits
+    ],
+                              dtype=bool)
+
+    # count the interacting HEAD commits of every interaction via prefix sums
+    head_commit_counts = np.concatenate(([0], np.cumsum(
+        is_head_commit[interaction_table.interacting_commits]
+    )))
+    offsets = interaction_table.interacting_offsets
+    return [
+        interaction_table.create_interaction(interaction_idx)
+        for interaction_idx in np.flatnonzero(
+            head_commit_counts[offsets[1:]] - head_commit_counts[offsets[:-1]]
+        ).tolist()
+    ]
@@ -3,6 +3,7 @@ import logging
 import typing as tp
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import yaml
 
@@ -135,6 +136,32 @@ class FunctionGraphEdges():
         return repr_str
 
 
+class RegionEdges(tp.NamedTuple):
+    """
+    Sparse representation of the edges between regions in coordinate format,
+    i.e., the edge ``i`` connects the region with index ``sources[i]`` to the
+    region with index ``targets[i]``.
+    """
+
+    sources: np.ndarray
+    targets: np.ndarray
+
+    def degrees(self, num_regions: int) -> tp.Tuple[np.ndarray, np.ndarray]:
+        """
+        Count the outgoing and incoming edges of every region.
+
+        Args:
+            num_regions: number of indexed regions
+
+        Returns:
+            tuple (outgoing edges, incoming edges) with one entry per region
+        """
+        return (
+            np.bincount(self.sources, minlength=num_regions),
+            np.bincount(self.targets, minlength=num_regions)
+        )
+
+
 class CommitReport(BaseReport):
     """Data class that gives access to a loaded commit report."""
 
@@ -169,6 +196,97 @@ class CommitReport(BaseReport):
                 f_edge = FunctionGraphEdges(raw_fg_edge)
                 self.graph_info[f_edge.fid] = f_edge
 
+        # regions are indexed in the order of the region mapping, followed by
+        # unmapped regions that only occur in edges
+        self.__region_indices: tp.Dict[str, int] = {
+            region_id: idx
+            for idx, region_id in enumerate(self.region_mappings)
+        }
+        self.__cf_edges = self.__index_edges(
+            lambda f_edge: f_edge.cf_edges
+        )
+        self.__df_edges = self.__index_edges(
+            lambda f_edge: f_edge.df_relations
+        )
+        self.__cf_degrees: tp.Optional[tp.Tuple[np.ndarray, np.ndarray]] = None
+        self.__df_degrees: tp.Optional[tp.Tuple[np.ndarray, np.ndarray]] = None
+        self.__head_region_index: tp.Optional[int] = None
+
+    def __get_region_index(self, region_id: str) -> int:
+        region_index = self.__region_indices.get(region_id)
+        if region_index is None:
+            region_index = len(self.__region_indices)
+            self.__region_indices[region_id] = region_index
+        return region_index
+
+    def __index_edges(
+        self, get_edges: tp.Callable[[FunctionGraphEdges],
+                                     tp.List[RegionToRegionEdge]]
+    ) -> RegionEdges:
+        sources: tp.List[int] = []
+        targets: tp.List[int] = []
+        for func_g_edge in self.graph_info.values():
+            for edge in get_edges(func_g_edge):
+                sources.append(self.__get_region_index(edge.edge_from))
+                targets.append(self.__get_region_index(edge.edge_to))
+        return RegionEdges(
+            np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64)
+        )
+
+    @property
+    def region_ids(self) -> tp.List[str]:
+        """IDs of all regions, ordered by their index in the region edges."""
+        return list(self.__region_indices)
+
+    @property
+    def cf_edges(self) -> RegionEdges:
+        """All control-flow edges of the report."""
+        return self.__cf_edges
+
+    @property
+    def df_edges(self) -> RegionEdges:
+        """All data-flow relations of the report."""
+        return self.__df_edges
+
+    def cf_degrees(self) -> tp.Tuple[np.ndarray, np.ndarray]:
+        """
+        Number of control-flow interactions of every region.
+
+        Returns:
+            tuple (outgoing interactions, incoming interactions), indexed like
+            :attr:`region_ids`
+        """
+        if self.__cf_degrees is None:
+            self.__cf_degrees = self.__cf_edges.degrees(
+                len(self.__region_indices)
+            )
+        return self.__cf_degrees
+
+    def df_degrees(self) -> tp.Tuple[np.ndarray, np.ndarray]:
+        """
+        Number of data-flow interactions of every region.
+
+        Returns:
+            tuple (outgoing interactions, incoming interactions), indexed like
+            :attr:`region_ids`
+        """
+        if self.__df_degrees is None:
+            self.__df_degrees = self.__df_edges.degrees(
+                len(self.__region_indices)
+            )
+        return self.__df_degrees
+
+    def __get_head_region_index(self) -> int:
+        """Index of the region of the HEAD commit, or -1 if the report has
+        none."""
+        if self.__head_region_index is None:
+            head_commit = self.head_commit
+            self.__head_region_index = next((
+                idx for region_id, idx in self.__region_indices.items()
+                if region_id.startswith(head_commit)
+            ), -1)
+        return self.__head_region_index
+
     @property
     def head_commit(self) -> str:
         """The current HEAD commit under which this CommitReport was created."""
@@ -232,26 +350,16 @@ class CommitReport(BaseReport):
     def calc_max_cf_edges(self) -> int:
         """Calculate the highest amount of control-flow interactions of a single
         commit region."""
-        cf_map: tp.Dict[str, tp.List[int]] = dict()
-        self.init_cf_map_with_edges(cf_map)
-
-        total = 0
-        for from_to_pair in cf_map.values():
-            total = max(max(from_to_pair[0], from_to_pair[1]), total)
-
-        return total
+        return max(
+            int(np.max(degrees, initial=0)) for degrees in self.cf_degrees()
+        )
 
     def calc_max_df_edges(self) -> int:
         """Calculate the highest amount of data-flow interactions of a single
         commit region."""
-        df_map: tp.Dict[str, tp.List[int]] = dict()
-        self.init_df_map_with_edges(df_map)
-
-        total = 0
-        for from_to_pair in df_map.values():
-            total = max(max(from_to_pair[0], from_to_pair[1]), total)
-
-        return total
+        return max(
+            int(np.max(degrees, initial=0)) for degrees in self.df_degrees()
+        )
 
     def __str__(self) -> str:
         return "FInfo:\n\t{}\nRegionMappings:\n\t{}\n" \
@@ -263,6 +371,16 @@ class CommitReport(BaseReport):
     def __lt__(self, other: 'CommitReport') -> bool:
         return self.path < other.path
 
+    @staticmethod
+    def __init_map_with_degrees(
+        region_map: tp.Dict[str, tp.List[int]], region_ids: tp.List[str],
+        degrees: tp.Tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        for region_id, from_count, to_count in zip(
+            region_ids, degrees[0].tolist(), degrees[1].tolist()
+        ):
+            region_map[region_id] = [from_count, to_count]
+
     def init_cf_map_with_edges(
         self, cf_map: tp.Dict[str, tp.List[int]]
     ) -> None:
@@ -272,25 +390,13 @@ class CommitReport(BaseReport):
         Args:
             cf_map: control-flow
         """
-        # if any information is missing add all from the original
-        # report to avoid errors.
-        for reg_mapping in self.region_mappings.values():
-            cf_map[reg_mapping.id] = [0, 0]
-
-        for func_g_edge in self.graph_info.values():
-            for cf_edge in func_g_edge.cf_edges:
-                cf_map[cf_edge.edge_from][0] += 1
-                cf_map[cf_edge.edge_to][1] += 1
+        # all regions of the region mapping are indexed, so regions without
+        # edges are added, too
+        self.__init_map_with_degrees(cf_map, self.region_ids, self.cf_degrees())
 
     def number_of_cf_interactions(self) -> int:
         """Total number of found control-flow interactions."""
-        cf_map: tp.Dict[str, tp.List[int]] = dict()
-        self.init_cf_map_with_edges(cf_map)
-
-        total_interactions = 0
-        for interaction_tuple in cf_map.values():
-            total_interactions += interaction_tuple[0]
-        return total_interactions
+        return len(self.__cf_edges.sources)
 
     def number_of_head_cf_interactions(self) -> tp.Tuple[int, int]:
         """
@@ -300,14 +406,15 @@ class CommitReport(BaseReport):
         Returns:
             tuple (incoming_head_interactions, outgoing_head_interactions)
         """
-        cf_map: tp.Dict[str, tp.List[int]] = dict()
-        self.init_cf_map_with_edges(cf_map)
-        for key in cf_map:
-            if key.startswith(self.head_commit):
-                interaction_tuple = cf_map[key]
-                return (interaction_tuple[0], interaction_tuple[1])
-
-        return (0, 0)
+        head_region_index = self.__get_head_region_index()
+        if head_region_index < 0:
+            return (0, 0)
+
+        cf_degrees = self.cf_degrees()
+        return (
+            int(cf_degrees[0][head_region_index]),
+            int(cf_degrees[1][head_region_index])
+        )
 
     def init_df_map_with_edges(
         self, df_map: tp.Dict[str, tp.List[int]]
@@ -318,37 +425,26 @@ class CommitReport(BaseReport):
         Returns:
             tuple (incoming_head_interactions, outgoing_head_interactions)
         """
-        # if any information is missing add all from the original report
-        # to avoid errors.
-        for reg_mapping in self.region_mappings.values():
-            df_map[reg_mapping.id] = [0, 0]
-
-        for func_g_edge in self.graph_info.values():
-            for df_edge in func_g_edge.df_relations:
-                df_map[df_edge.edge_from][0] += 1
-                df_map[df_edge.edge_to][1] += 1
+        # all regions of the region mapping are indexed, so regions without
+        # edges are added, too
+        self.__init_map_with_degrees(df_map, self.region_ids, self.df_degrees())
 
     def number_of_df_interactions(self) -> int:
         """Total number of found data-flow interactions."""
-        df_map: tp.Dict[str, tp.List[int]] = dict()
-        self.init_df_map_with_edges(df_map)
-
-        total_interactions = 0
-        for interaction_tuple in df_map.values():
-            total_interactions += interaction_tuple[0]
-        return total_interactions
+        return len(self.__df_edges.sources)
 
     def number_of_head_df_interactions(self) -> tp.Tuple[int, int]:
         """The number of control-flow interactions the HEAD commit has with
         other commits."""
-        df_map: tp.Dict[str, tp.List[int]] = dict()
-        self.init_df_map_with_edges(df_map)
-        for key in df_map:
-            if key.startswith(self.head_commit):
-                interaction_tuple = df_map[key]
-                return (interaction_tuple[0], interaction_tuple[1])
-
-        return (0, 0)
+        head_region_index = self.__get_head_region_index()
+        if head_region_index < 0:
+            return (0, 0)
+
+        df_degrees = self.df_degrees()
+        return (
+            int(df_degrees[0][head_region_index]),
+            int(df_degrees[1][head_region_index])
+        )
 
 
 class CommitReportMeta():
@@ -444,21 +540,29 @@ def generate_interactions(
         commit_report: the report
         c_map: commit map for mapping commits to unique IDs
     """
-    node_rows = []
-    for item in commit_report.region_mappings.values():
-        node_rows.append([item.hash, c_map.time_id(item.hash)])
-
-    node_rows.sort(key=lambda row: int(tp.cast(int, row[1])), reverse=True)
-    nodes = pd.DataFrame(node_rows, columns=['hash', 'id'])
-
-    link_rows = []
-    for func_g_edge in commit_report.graph_info.values():
-        for cf_edge in func_g_edge.cf_edges:
-            link_rows.append([
-                cf_edge.edge_from, cf_edge.edge_to, 1,
-                c_map.time_id(cf_edge.edge_from)
-            ])
-
+    node_hashes = [item.hash for item in commit_report.region_mappings.values()]
+    nodes = pd.DataFrame({
+        'hash': node_hashes,
+        'id': c_map.time_ids(node_hashes)
+    }, columns=['hash', 'id'])
+    nodes = nodes.sort_values(
+        by='id', ascending=False, kind='stable'
+    ).reset_index(drop=True)
+
+    # look up the time id of every source region only once
+    region_ids = np.array(commit_report.region_ids, dtype=object)
+    cf_edges = commit_report.cf_edges
+    source_indices, edge_sources = np.unique(
+        cf_edges.sources, return_inverse=True
+    )
+    source_time_ids = c_map.time_ids(region_ids[source_indices].tolist())
+
+    link_rows = {
+        'source': region_ids[cf_edges.sources],
+        'target': region_ids[cf_edges.targets],
+        'value': np.ones(len(cf_edges.sources), dtype=np.int64),
+        'src_id': source_time_ids[edge_sources]
+    }
     links = pd.DataFrame(
         link_rows, columns=['source', 'target', 'value', 'src_id']
     )
@@ -1,6 +1,7 @@
 """This module provides different jupyther helpers to allow easier interaction
 with varas file handling APIs."""
 
+import typing as tp
 from pathlib import Path
 
 from varats.data.data_manager import VDM
@@ -33,6 +34,16 @@ def load_blame_report(file_path: Path) -> BlameReport:
     return VDM.load_data_class_sync(file_path, BlameReport)
 
 
+def load_blame_reports(file_paths: tp.Sequence[Path]) -> tp.List[BlameReport]:
+    """
+    Load multiple BlameReports, parsing them in parallel.
+
+    Attributes:
+        file_paths (Sequence[Path]): Full paths to the files
+    """
+    return VDM.load_data_classes(file_paths, BlameReport)
+
+
 def load_commit_map(file_path: str) -> CommitMap:
     """
     Load a CommitMap from a file.
@@ -0,0 +1,227 @@
+"""
+Incremental generation of the :class:`artefacts<varats.paper_mgmt.artefacts>`
+of a paper config.
+
+Every artefact gets a fingerprint of the inputs it is generated from: its
+definition, the code of the plot or table class that generates it, the case
+study files of the paper config, and the result files of the projects it
+covers. Fingerprints of generated artefacts are stored in the data cache, so
+that artefacts whose inputs did not change and whose output files exist are
+not generated again. Outdated artefacts are generated in a pool of forked
+worker processes.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import typing as tp
+from pathlib import Path
+
+from varats.paper_mgmt.artefacts import Artefact, PlotArtefact, TableArtefact
+from varats.paper_mgmt.paper_config import get_paper_config
+from varats.revision.result_index import get_result_file_entries
+from varats.utils.filesystem_util import atomic_write
+from varats.utils.parallel_util import fork_map, get_num_jobs
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
+
+
+class ArtefactState(tp.NamedTuple):
+    """The build state of an artefact."""
+
+    artefact: Artefact
+    fingerprint: str
+    #: why the artefact needs to be generated, ``None`` if it is up to date
+    reason: tp.Optional[str]
+
+
+def __get_generator_class(artefact: Artefact) -> tp.Type[tp.Any]:
+    if isinstance(artefact, PlotArtefact):
+        return artefact.plot_type_class
+    if isinstance(artefact, TableArtefact):
+        return artefact.table_type_class
+
+    raise AssertionError(
+        f"Missing implementation for artefact type {artefact.artefact_type}"
+    )
+
+
+def __get_artefact_projects(artefact: Artefact) -> tp.List[str]:
+    """Projects whose results an artefact consumes."""
+    artefact_dict = artefact.get_dict()
+    if "project" in artefact_dict and not artefact_dict.get("paper_config"):
+        return [str(artefact_dict["project"])]
+    return sorted({
+        case_study.project_name
+        for case_study in get_paper_config().get_all_case_studies()
+    })
+
+
+def get_artefact_fingerprint(artefact: Artefact) -> str:
+    """
+    Compute a fingerprint of the inputs an artefact is generated from.
+
+    Args:
+        artefact: the artefact
+
+    Returns:
+        hex digest that changes if the inputs of the artefact change
+    """
+    hasher = hashlib.sha256()
+    hasher.update(
+        json.dumps(artefact.get_dict(), sort_keys=True, default=str).encode()
+    )
+    hasher.update(str(artefact.output_path.resolve()).encode())
+    generator_class = __get_generator_class(artefact)
+    generator_module = inspect.getmodule(generator_class)
+    try:
+        hasher.update(
+            inspect.getsource(
+                generator_module if generator_module else generator_class
+            ).encode()
+        )
+    except (OSError, TypeError):
+        # without its source, changes of the generator are not detected
+        hasher.update(generator_class.__qualname__.encode())
+
+    case_study_files = sorted(get_paper_config().path.glob("*.case_study"))
+    cs_path = artefact.get_dict().get("cs_path")
+    if cs_path:
+        case_study_files.append(Path(str(cs_path)))
+    for case_study_file in case_study_files:
+        hasher.update(case_study_file.name.encode())
+        if case_study_file.exists():
+            hasher.update(case_study_file.read_bytes())
+
+    result_dir = Path(str(vara_cfg()["result_dir"]))
+    for project_name in __get_artefact_projects(artefact):
+        hasher.update(project_name.encode())
+        for entry in sorted(
+            get_result_file_entries(result_dir / project_name),
+            key=lambda entry: entry.name
+        ):
+            hasher.update(f"{entry.name}:{entry.mtime!r}\n".encode())
+
+    return hasher.hexdigest()
+
+
+def __get_fingerprints_path() -> Path:
+    return Path(str(vara_cfg()["data_cache"])) / "artefacts" / (
+        f"{get_paper_config().path.name}-fingerprints.json"
+    )
+
+
+def __load_fingerprints() -> tp.Dict[str, str]:
+    fingerprints_path = __get_fingerprints_path()
+    if not fingerprints_path.exists():
+        return {}
+    try:
+        with open(
+            fingerprints_path, "r", encoding="utf-8"
+        ) as fingerprints_file:
+            return tp.cast(tp.Dict[str, str], json.load(fingerprints_file))
+    except (OSError, ValueError):
+        LOG.warning(
+            f"Could not load artefact fingerprints {fingerprints_path}."
+        )
+        return {}
+
+
+def __store_fingerprints(fingerprints: tp.Dict[str, str]) -> None:
+    with atomic_write(__get_fingerprints_path()) as tmp_fingerprints_path:
+        with open(
+            tmp_fingerprints_path, "w", encoding="utf-8"
+        ) as fingerprints_file:
+            json.dump(fingerprints, fingerprints_file, indent=2, sort_keys=True)
+
+
+def __has_all_output_files(artefact: Artefact) -> bool:
+    if not artefact.output_path.exists():
+        return False
+    return all((artefact.output_path / file_info["file_name"]).exists()
+               for file_info in artefact.get_artefact_file_infos())
+
+
+def get_artefact_states(
+    artefacts: tp.Iterable[Artefact]
+) -> tp.List[ArtefactState]:
+    """
+    Check which artefacts need to be generated.
+
+    An artefact is outdated if it was never generated, if its fingerprint
+    changed since it was generated, or if one of its output files is missing.
+
+    Args:
+        artefacts: the artefacts to check
+
+    Returns:
+        the build state of every artefact
+    """
+    stored_fingerprints = __load_fingerprints()
+    artefact_states = []
+    for artefact in artefacts:
+        fingerprint = get_artefact_fingerprint(artefact)
+        stored_fingerprint = stored_fingerprints.get(artefact.name)
+        reason: tp.Optional[str] = None
+        if stored_fingerprint is None:
+            reason = "not generated yet"
+        elif stored_fingerprint != fingerprint:
+            reason = "inputs changed"
+        elif not __has_all_output_files(artefact):
+            reason = "output files missing"
+        artefact_states.append(ArtefactState(artefact, fingerprint, reason))
+
+    return artefact_states
+
+
+def __generate_artefact(artefact: Artefact) -> None:
+    LOG.info(
+        f"Generating artefact {artefact.name} in location "
+        f"{artefact.output_path}"
+    )
+    artefact.generate_artefact()
+
+
+def generate_artefacts(
+    artefacts: tp.Iterable[Artefact],
+    jobs: tp.Optional[int] = None,
+    force: bool = False
+) -> tp.List[Artefact]:
+    """
+    Generate all artefacts that are outdated.
+
+    If more than one job is used, the artefacts are generated in a pool of
+    forked worker processes. The workers inherit the data that was loaded
+    before, e.g., the paper config and the result indices, and share the data
+    cache, so data that one artefact cached can be reused by the others.
+
+    Args:
+        artefacts: the artefacts to generate
+        jobs: number of artefacts generated in parallel; defaults to the
+              ``cache.jobs`` setting, where 0 means one per CPU
+        force: also generate artefacts that are up to date
+
+    Returns:
+        the generated artefacts
+    """
+    artefact_states = [
+        state for state in get_artefact_states(artefacts)
+        if force or state.reason is not None
+    ]
+    outdated_artefacts = [state.artefact for state in artefact_states]
+
+    fingerprints = __load_fingerprints()
+    try:
+        for _, state in zip(
+            fork_map(
+                __generate_artefact, outdated_artefacts, get_num_jobs(jobs)
+            ), artefact_states
+        ):
+            fingerprints[state.artefact.name] = state.fingerprint
+    finally:
+        if artefact_states:
+            __store_fingerprints(fingerprints)
+
+    return outdated_artefacts
@@ -17,9 +17,9 @@ from pathlib import Path
 
 from varats.base.version_header import VersionHeader
 from varats.plot.plot import Plot
-from varats.plot.plots import PlotRegistry, build_plots
+from varats.plot.plots import PlotRegistry, build_plots, prepare_plots
 from varats.table.table import TableFormat, Table
-from varats.table.tables import TableRegistry, build_tables
+from varats.table.tables import TableRegistry, build_tables, prepare_tables
 from varats.utils.settings import vara_cfg
 from varats.utils.yaml_util import load_yaml, store_as_yaml
 
@@ -93,6 +93,16 @@ class Artefact(ABC):
     def generate_artefact(self) -> None:
         """Generate the specified artefact."""
 
+    @abc.abstractmethod
+    def get_artefact_file_infos(self) -> tp.List[tp.Dict[str, str]]:
+        """
+        Look up the files this artefact generates.
+
+        Returns:
+            a list of dicts with the ``file_name`` relative to the output path
+            and the ``project`` of every file
+        """
+
 
 class PlotArtefact(Artefact):
     """
@@ -159,6 +169,18 @@ class PlotArtefact(Artefact):
             **self.__plot_kwargs
         )
 
+    def get_artefact_file_infos(self) -> tp.List[tp.Dict[str, str]]:
+        plots = prepare_plots(
+            plot_type=self.plot_type,
+            result_output=self.output_path,
+            file_format=self.file_format,
+            **self.__plot_kwargs
+        )
+        return [{
+            "file_name": plot.plot_file_name(self.file_format),
+            "project": plot.plot_kwargs.get("project", "[UNKNOWN]")
+        } for plot in plots]
+
 
 class TableArtefact(Artefact):
     """
@@ -227,6 +249,18 @@ class TableArtefact(Artefact):
             **self.table_kwargs
         )
 
+    def get_artefact_file_infos(self) -> tp.List[tp.Dict[str, str]]:
+        tables = prepare_tables(
+            table_type=self.table_type,
+            result_output=self.output_path,
+            file_format=self.file_format,
+            **self.table_kwargs
+        )
+        return [{
+            "file_name": table.table_file_name(),
+            "project": table.table_kwargs.get("project", "[UNKNOWN]")
+        } for table in tables]
+
 
 class ArtefactType(Enum):
     """
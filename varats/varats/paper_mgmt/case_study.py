@@ -23,13 +23,17 @@ from varats.plot.plots import PlotRegistry
 from varats.project.project_util import get_project_cls_by_name
 from varats.provider.release.release_provider import ReleaseProvider
 from varats.report.report import FileStatusExtension, MetaReport
+from varats.revision.result_index import (
+    ResultFileEntry,
+    get_result_file_entries,
+)
 from varats.revision.revisions import (
+    blocked_mask,
     get_failed_revisions,
     get_processed_revisions,
     get_tagged_revision,
     get_tagged_revisions,
     filter_blocked_revisions,
-    is_revision_blocked,
 )
 
 
@@ -91,11 +95,43 @@ def failed_revisions_for_case_study(
     ]
 
 
+# short commit hash -> (commit hash of the result file, status)
+RevisionStatusMapTy = tp.Dict[str, tp.Tuple[str, FileStatusExtension]]
+
+
+def get_revision_status_map(
+    project_name: str,
+    result_file_type: MetaReport,
+    tag_blocked: bool = True
+) -> RevisionStatusMapTy:
+    """
+    Computes the file status of all revisions of a project that have result
+    files, so that the status of the revisions of all case studies of the
+    project can be looked up without scanning the results again.
+
+    Args:
+        project_name: name of the project
+        result_file_type: report type of the result files
+        tag_blocked: if true, also blocked commits are tagged
+
+    Returns:
+        mapping from short commit hashes to the commit hash of the result files
+        and the file status of the revision
+    """
+    status_map: RevisionStatusMapTy = {}
+    for tagged_rev in get_tagged_revisions(
+        get_project_cls_by_name(project_name), result_file_type, tag_blocked
+    ):
+        status_map.setdefault(tagged_rev[0][:10], tagged_rev)
+    return status_map
+
+
 def get_revisions_status_for_case_study(
     case_study: CaseStudy,
     result_file_type: MetaReport,
     stage_num: int = -1,
-    tag_blocked: bool = True
+    tag_blocked: bool = True,
+    status_map: tp.Optional[RevisionStatusMapTy] = None
 ) -> tp.List[tp.Tuple[str, FileStatusExtension]]:
     """
     Computes the file status for all revisions in this case study.
@@ -105,36 +141,44 @@ def get_revisions_status_for_case_study(
         result_file_type: report type of the result files
         stage_num: only consider a specific stage of the case study
         tag_blocked: if true, also blocked commits are tagged
+        status_map: status of the revisions of the project, as computed by
+                    ``get_revision_status_map``; computed if not given
 
     Returns:
         a list of (revision, status) tuples
     """
     project_cls = get_project_cls_by_name(case_study.project_name)
-    tagged_revisions = get_tagged_revisions(
-        project_cls, result_file_type, tag_blocked
-    )
+    if status_map is None:
+        status_map = get_revision_status_map(
+            case_study.project_name, result_file_type, tag_blocked
+        )
 
     def filtered_tagged_revs(
         rev_provider: tp.Iterable[str]
     ) -> tp.List[tp.Tuple[str, FileStatusExtension]]:
+        short_revs = [rev[:10] for rev in rev_provider]
+        untagged_revs = [rev for rev in short_revs if rev not in status_map]
+        blocked_revs: tp.Set[str] = set()
+        if tag_blocked and untagged_revs:
+            blocked_revs = {
+                rev for rev, blocked in
+                zip(untagged_revs, blocked_mask(untagged_revs, project_cls))
+                if blocked
+            }
+
         filtered_revisions = []
-        for rev in rev_provider:
-            found = False
-            short_rev = rev[:10]
-            for tagged_rev in tagged_revisions:
-                if short_rev == tagged_rev[0][:10]:
-                    filtered_revisions.append(tagged_rev)
-                    found = True
-                    break
-            if not found:
-                if tag_blocked and is_revision_blocked(short_rev, project_cls):
-                    filtered_revisions.append(
-                        (short_rev, FileStatusExtension.Blocked)
-                    )
-                else:
-                    filtered_revisions.append(
-                        (short_rev, FileStatusExtension.Missing)
-                    )
+        for short_rev in short_revs:
+            tagged_rev = status_map.get(short_rev)
+            if tagged_rev is not None:
+                filtered_revisions.append(tagged_rev)
+            elif short_rev in blocked_revs:
+                filtered_revisions.append(
+                    (short_rev, FileStatusExtension.Blocked)
+                )
+            else:
+                filtered_revisions.append(
+                    (short_rev, FileStatusExtension.Missing)
+                )
         return filtered_revisions
 
     if stage_num == -1:
@@ -181,29 +225,19 @@ def get_newest_result_files_for_case_study(
     Returns:
         list of result file paths
     """
-    files_to_store: tp.Dict[str, Path] = dict()
+    files_to_store: tp.Dict[str, ResultFileEntry] = dict()
+    shorthand = str(getattr(report_type, "SHORTHAND"))
 
     result_dir /= case_study.project_name
-    if not result_dir.exists():
-        return []
-
-    for opt_res_file in result_dir.iterdir():
-        if report_type.is_correct_report_type(opt_res_file.name):
-            commit_hash = report_type.get_commit_hash_from_result_file(
-                opt_res_file.name
-            )
+    for entry in get_result_file_entries(result_dir):
+        if entry.is_result_file and entry.shorthand == shorthand:
+            commit_hash = tp.cast(str, entry.commit_hash)
             if case_study.has_revision(commit_hash):
-                current_file = files_to_store.get(commit_hash, None)
-                if current_file is None:
-                    files_to_store[commit_hash] = opt_res_file
-                else:
-                    if (
-                        current_file.stat().st_mtime <
-                        opt_res_file.stat().st_mtime
-                    ):
-                        files_to_store[commit_hash] = opt_res_file
+                current_entry = files_to_store.get(commit_hash, None)
+                if current_entry is None or current_entry.mtime < entry.mtime:
+                    files_to_store[commit_hash] = entry
 
-    return list(files_to_store.values())
+    return [result_dir / entry.name for entry in files_to_store.values()]
 
 
 def get_case_study_file_name_filter(
@@ -435,12 +469,20 @@ def extend_with_revs_per_year(
             random.sample(range(len(commits_in_year)), samples)
         )
 
-        for commit_index in sample_commit_indices:
-            commit_hash = commits_in_year[commit_index]
-            if kwargs["ignore_blocked"] and is_revision_blocked(
-                commit_hash, get_project_cls_by_name(case_study.project_name)
-            ):
-                continue
+        sampled_commits = [
+            commits_in_year[commit_index]
+            for commit_index in sample_commit_indices
+        ]
+        if kwargs["ignore_blocked"]:
+            is_blocked = blocked_mask(
+                sampled_commits,
+                get_project_cls_by_name(case_study.project_name)
+            )
+            sampled_commits = [
+                commit_hash for commit_hash, blocked in
+                zip(sampled_commits, is_blocked) if not blocked
+            ]
+        for commit_hash in sampled_commits:
             time_id = cmap.time_id(commit_hash)
             new_rev_items.append((commit_hash, time_id))
 
@@ -465,10 +507,6 @@ def extend_with_distrib_sampling(
         case_study: to extend
         cmap: commit map to map revisions to unique IDs
     """
-    is_blocked: tp.Callable[[str, tp.Type[tp.Any]], bool] = lambda rev, _: False
-    if kwargs["ignore_blocked"]:
-        is_blocked = is_revision_blocked
-
     # Needs to be sorted so the propability distribution over the length
     # of the list is the same as the distribution over the commits age history
     project_cls = get_project_cls_by_name(case_study.project_name)
@@ -476,9 +514,15 @@ def extend_with_distrib_sampling(
         rev_item
         for rev_item in sorted(list(cmap.mapping_items()), key=lambda x: x[1])
         if not case_study.
-        has_revision_in_stage(rev_item[0], kwargs['merge_stage']) and
-        not is_blocked(rev_item[0], project_cls)
+        has_revision_in_stage(rev_item[0], kwargs['merge_stage'])
     ]
+    if kwargs["ignore_blocked"]:
+        is_blocked = blocked_mask([rev for rev, _ in revision_list],
+                                  project_cls)
+        revision_list = [
+            rev_item for rev_item, blocked in zip(revision_list, is_blocked)
+            if not blocked
+        ]
 
     sampling_method = kwargs['distribution']
 
@@ -5,6 +5,7 @@ to package a whole paper config into a zip folder."""
 import re
 import typing as tp
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from zipfile import ZIP_DEFLATED, ZipFile
 
@@ -14,21 +15,71 @@ import varats.paper_mgmt.paper_config as PC
 from varats.mapping.commit_map import create_lazy_commit_map_loader
 from varats.paper.case_study import CaseStudy
 from varats.paper_mgmt.case_study import (
+    RevisionStatusMapTy,
+    get_revision_status_map,
     get_revisions_status_for_case_study,
     get_newest_result_files_for_case_study,
 )
 from varats.report.report import FileStatusExtension, MetaReport
 from varats.revision.revisions import get_all_revisions_files
+from varats.utils.parallel_util import get_num_jobs
 from varats.utils.settings import vara_cfg
 
 
+def get_revision_status_maps(
+    project_names: tp.Iterable[str],
+    result_file_type: MetaReport,
+    jobs: tp.Optional[int] = None
+) -> tp.Dict[str, RevisionStatusMapTy]:
+    """
+    Computes the revision status maps of multiple projects, scanning the
+    results of every project only once.
+
+    Args:
+        project_names: names of the projects
+        result_file_type: report type of the result files
+        jobs: number of projects processed concurrently; defaults to the
+              ``cache.jobs`` setting, where 0 means one per CPU
+
+    Returns:
+        mapping from project names to their revision status maps
+    """
+    project_names = list(dict.fromkeys(project_names))
+    jobs = min(get_num_jobs(jobs), len(project_names))
+
+    if jobs <= 1:
+        status_maps = [
+            get_revision_status_map(project_name, result_file_type)
+            for project_name in project_names
+        ]
+    else:
+        with ProcessPoolExecutor(jobs) as executor:
+            status_maps = list(
+                executor.map(
+                    get_revision_status_map, project_names,
+                    [result_file_type] * len(project_names)
+                )
+            )
+
+    return dict(zip(project_names, status_maps))
+
+
 def show_status_of_case_studies(
-    report_name: str, filter_regex: str, short_status: bool, sort: bool,
-    print_rev_list: bool, sep_stages: bool, print_legend: bool
+    report_name: str,
+    filter_regex: str,
+    short_status: bool,
+    sort: bool,
+    print_rev_list: bool,
+    sep_stages: bool,
+    print_legend: bool,
+    jobs: tp.Optional[int] = None
 ) -> None:
     """
     Prints the status of all matching case studies to the console.
 
+    The results of every project are only scanned once for all of its case
+    studies.
+
     Args:
         report_name: name of the report whose files will be considered
         filter_regex: applied to a ``name_version`` string for filtering the
@@ -38,6 +89,7 @@ def show_status_of_case_studies(
         print_rev_list: print a list of revisions for every case study
         sep_stages: print each stage separeted
         print_legend: print a legend for the different types
+        jobs: number of projects whose results are scanned concurrently
     """
     current_config = PC.get_paper_config()
 
@@ -65,6 +117,12 @@ def show_status_of_case_studies(
     report_type = MetaReport.REPORT_TYPES[report_name]
     total_status_occurrences: tp.DefaultDict[FileStatusExtension,
                                              tp.Set[str]] = defaultdict(set)
+    status_maps: tp.Dict[str, RevisionStatusMapTy] = {}
+    if not print_rev_list:
+        status_maps = get_revision_status_maps(
+            [case_study.project_name for case_study in output_case_studies],
+            report_type, jobs
+        )
 
     for case_study in output_case_studies:
         if print_rev_list:
@@ -73,14 +131,16 @@ def show_status_of_case_studies(
             print(
                 get_short_status(
                     case_study, report_type, longest_cs_name, True,
-                    total_status_occurrences
+                    total_status_occurrences,
+                    status_maps[case_study.project_name]
                 )
             )
         else:
             print(
                 get_status(
                     case_study, report_type, longest_cs_name, sep_stages, sort,
-                    True, total_status_occurrences
+                    True, total_status_occurrences,
+                    status_maps[case_study.project_name]
                 )
             )
 
@@ -222,7 +282,8 @@ def get_short_status(
     longest_cs_name: int,
     use_color: bool = False,
     total_status_occurrences: tp.Optional[tp.DefaultDict[FileStatusExtension,
-                                                         tp.Set[str]]] = None
+                                                         tp.Set[str]]] = None,
+    status_map: tp.Optional[RevisionStatusMapTy] = None
 ) -> str:
     """
     Return a short string representation that describes the current status of
@@ -236,6 +297,7 @@ def get_short_status(
         use_color: add color escape sequences for highlighting
         total_status_occurrences: mapping from all occured status to a set of
                                   all revisions (total amount of revisions)
+        status_map: precomputed status of the revisions of the project
 
     Returns:
         a short string representation of a case study
@@ -250,7 +312,7 @@ def get_short_status(
     status_occurrences: tp.DefaultDict[FileStatusExtension,
                                        tp.Set[str]] = defaultdict(set)
     for tagged_rev in get_revisions_status_for_case_study(
-        case_study, result_file_type
+        case_study, result_file_type, status_map=status_map
     ):
         status_occurrences[tagged_rev[1]].add(tagged_rev[0])
 
@@ -270,7 +332,8 @@ def get_status(
     sort: bool,
     use_color: bool = False,
     total_status_occurrences: tp.Optional[tp.DefaultDict[FileStatusExtension,
-                                                         tp.Set[str]]] = None
+                                                         tp.Set[str]]] = None,
+    status_map: tp.Optional[RevisionStatusMapTy] = None
 ) -> str:
     """
     Return a string representation that describes the current status of the case
@@ -285,13 +348,19 @@ def get_status(
         use_color: add color escape sequences for highlighting
         total_status_occurrences: mapping from all occured status to a set of
                                   all revisions (total amount of revisions)
+        status_map: precomputed status of the revisions of the project
 
     Returns:
         a full string representation of all case studies
     """
+    if status_map is None:
+        status_map = get_revision_status_map(
+            case_study.project_name, result_file_type
+        )
+
     status = get_short_status(
         case_study, result_file_type, longest_cs_name, use_color,
-        total_status_occurrences
+        total_status_occurrences, status_map
     ) + "\n"
 
     if sort:
@@ -309,7 +378,7 @@ def get_status(
                 status += " ({})".format(stage_name)
             status += "\n"
             tagged_revs = get_revisions_status_for_case_study(
-                case_study, result_file_type, stage_num
+                case_study, result_file_type, stage_num, status_map=status_map
             )
             if sort:
                 tagged_revs = sorted(tagged_revs, key=rev_time, reverse=True)
@@ -322,7 +391,7 @@ def get_status(
         tagged_revs = list(
             dict.fromkeys(
                 get_revisions_status_for_case_study(
-                    case_study, result_file_type
+                    case_study, result_file_type, status_map=status_map
                 )
             )
         )
@@ -12,6 +12,7 @@ from varats.data.databases.blame_interaction_database import (
     BlameInteractionDatabase,
 )
 from varats.data.metrics import gini_coefficient, lorenz_curve
+from varats.mapping.churn_index import get_churn_index
 from varats.mapping.commit_map import CommitMap
 from varats.paper.case_study import CaseStudy
 from varats.plot.plot import Plot, PlotDataEmpty
@@ -19,8 +20,7 @@ from varats.plots.repository_churn import (
     build_repo_churn_table,
     draw_code_churn,
 )
-from varats.project.project_util import get_local_project_git
-from varats.utils.git_util import ChurnConfig, calc_repo_code_churn
+from varats.utils.git_util import ChurnConfig
 
 
 def draw_interaction_lorenz_curve(
@@ -117,12 +117,11 @@ def filter_non_code_changes(
     Returns:
         filtered data frame without rows related to non code changes
     """
-    repo = get_local_project_git(project_name)
-    code_related_changes = [
-        x[:10] for x in calc_repo_code_churn(
-            repo, ChurnConfig.create_c_style_languages_config()
-        )
-    ]
+    code_related_changes = {
+        c_hash[:10].decode() for c_hash in get_churn_index(
+            project_name, ChurnConfig.create_c_style_languages_config()
+        ).hashes
+    }
     return blame_data[blame_data.apply(
         lambda x: x['revision'][:10] in code_related_changes, axis=1
     )]
@@ -15,6 +15,7 @@ from varats.plot.plot import Plot
 from varats.plot.plot_utils import check_required_args
 from varats.project.project_util import get_project_cls_by_name
 from varats.report.report import FileStatusExtension, MetaReport
+from varats.revision.revisions import blocked_mask
 
 SUCCESS_COLOR = (0.5568627450980392, 0.7294117647058823, 0.25882352941176473)
 BLOCKED_COLOR = (0.20392156862745098, 0.5411764705882353, 0.7411764705882353)
@@ -48,11 +49,16 @@ def _gen_overview_data(tag_blocked: bool,
         "success": []
     }
 
-    for c_hash, index in commit_map.mapping_items():
-        if not case_study.has_revision(c_hash):
+    mapping_items = list(commit_map.mapping_items())
+    c_hashes = [c_hash for c_hash, _ in mapping_items]
+    in_case_study = case_study.has_revisions(c_hashes)
+    is_blocked = blocked_mask(c_hashes, project)
+    for (_, index), is_cs_revision, blocked in zip(
+        mapping_items, in_case_study, is_blocked
+    ):
+        if not is_cs_revision:
             positions["background"].append(index)
-            if hasattr(project, "is_blocked_revision"
-                      ) and project.is_blocked_revision(c_hash)[0]:
+            if blocked:
                 positions["blocked_all"].append(index)
 
     revisions = FileStatusDatabase.get_data_for_project(
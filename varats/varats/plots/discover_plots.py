@@ -1,8 +1,8 @@
 """This modules handles auto discovering of plots from the tool suite."""
 
-from varats import plots as __PLOTS__
+from varats.ts_utils.plugin_manifest import initialize_plugins
 
 
 def initialize_plots() -> None:
-    # Discover and initialize all plots
-    __PLOTS__.discover()
+    # Discover and initialize all plots, plot modules are imported on first use
+    initialize_plugins("plots")
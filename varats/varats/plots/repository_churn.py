@@ -13,15 +13,11 @@ import pandas as pd
 
 #import varats.data.discover_reports
 #from varats.data.discover_reports import foo
+from varats.mapping.churn_index import get_churn_index
 from varats.mapping.commit_map import CommitMap
 from varats.paper.case_study import CaseStudy
 from varats.plot.plot import Plot
-from varats.project.project_util import get_local_project_git
-from varats.utils.git_util import (
-    ChurnConfig,
-    calc_repo_code_churn,
-    calc_code_churn,
-)
+from varats.utils.git_util import ChurnConfig
 
 
 def build_repo_churn_table(
@@ -52,17 +48,17 @@ def build_repo_churn_table(
         df_layout.changed_files = df_layout.changed_files.astype('int64')
         return df_layout
 
-    repo = get_local_project_git(project_name)
     # By default we only look at c-style code files
-    code_churn = calc_repo_code_churn(
-        repo, ChurnConfig.create_c_style_languages_config()
+    churn_index = get_churn_index(
+        project_name, ChurnConfig.create_c_style_languages_config()
     )
+    revisions = [c_hash.decode() for c_hash in churn_index.hashes]
     churn_data = pd.DataFrame({
-        "revision": list(code_churn),
-        "time_id": [commit_map.time_id(x) for x in code_churn],
-        "insertions": [x[1] for x in code_churn.values()],
-        "deletions": [x[2] for x in code_churn.values()],
-        "changed_files": [x[0] for x in code_churn.values()]
+        "revision": revisions,
+        "time_id": commit_map.time_ids(revisions),
+        "insertions": churn_index.churn[:, 1],
+        "deletions": churn_index.churn[:, 2],
+        "changed_files": churn_index.churn[:, 0]
     })
 
     return pd.concat([create_dataframe_layout(), churn_data])
@@ -75,8 +71,8 @@ def build_revisions_churn_table(
     Build a pandas data frame that contains all churn related data for the given
     list of revisions.
 
-    The churn is calculated as the diff between two successive revisions in
-    the ``revisions`` list.
+    The churn of a revision is the summed up churn of all commits since the
+    previous revision in the ``revisions`` list.
 
     Table layout:
             "revision", "time_id", "insertions", "deletions", "changed_files"
@@ -103,15 +99,14 @@ def build_revisions_churn_table(
         df_layout.changed_files = df_layout.changed_files.astype('int64')
         return df_layout
 
-    repo = get_local_project_git(project_name)
+    churn_index = get_churn_index(
+        project_name, ChurnConfig.create_c_style_languages_config()
+    )
 
     revision_pairs = zip(*(islice(revisions, i, None) for i in range(2)))
     code_churn = [(0, 0, 0)]
     code_churn.extend([
-        calc_code_churn(
-            repo, repo.get(a), repo.get(b),
-            ChurnConfig.create_c_style_languages_config()
-        ) for a, b in revision_pairs
+        churn_index.churn_between(a, b) for a, b in revision_pairs
     ])
     churn_data = pd.DataFrame({
         "revision": revisions,
@@ -187,8 +182,8 @@ def draw_code_churn_for_revisions(
     Draws a churn plot onto an axis, showing insertions with green and deletions
     with red.
 
-    The churn is calculated as the diff between two successive revisions in
-    the ``revisions`` list.
+    The churn of a revision is the summed up churn of all commits since the
+    previous revision in the ``revisions`` list.
 
     Args:
         axis: axis to plot on
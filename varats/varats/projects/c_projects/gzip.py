@@ -4,12 +4,13 @@ import typing as tp
 
 import benchbuild as bb
 from benchbuild.utils.cmd import make
-from benchbuild.utils.revision_ranges import block_revisions, RevisionRange
+from benchbuild.utils.revision_ranges import RevisionRange
 from benchbuild.utils.settings import get_number_of_jobs
 from plumbum import local
 
 from varats.paper_mgmt.paper_config import project_filter_generator
 from varats.project.project_util import (
+    block_revisions,
     get_tagged_commits,
     wrap_paths_to_binaries,
     ProjectBinaryWrapper,
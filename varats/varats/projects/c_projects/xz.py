@@ -4,7 +4,6 @@ import typing as tp
 import benchbuild as bb
 from benchbuild.utils.cmd import autoreconf, make
 from benchbuild.utils.revision_ranges import (
-    block_revisions,
     GoodBadSubgraph,
     RevisionRange,
 )
@@ -13,6 +12,7 @@ from plumbum import local
 
 from varats.paper_mgmt.paper_config import project_filter_generator
 from varats.project.project_util import (
+    block_revisions,
     ProjectBinaryWrapper,
     get_all_revisions_between,
     wrap_paths_to_binaries,
@@ -3,13 +3,14 @@ import typing as tp
 
 import benchbuild as bb
 from benchbuild.utils.cmd import cmake, cp, make
-from benchbuild.utils.revision_ranges import block_revisions, GoodBadSubgraph
+from benchbuild.utils.revision_ranges import GoodBadSubgraph
 from benchbuild.utils.settings import get_number_of_jobs
 from plumbum import local
 from plumbum.path.utils import delete
 
 from varats.paper_mgmt.paper_config import project_filter_generator
 from varats.project.project_util import (
+    block_revisions,
     ProjectBinaryWrapper,
     wrap_paths_to_binaries,
     BinaryType,
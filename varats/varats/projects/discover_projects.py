@@ -1,15 +1,15 @@
 """This modules handles auto discovering of projects from the tool suite."""
 
-from varats import projects as __PROJECTS__
+from varats.ts_utils.plugin_manifest import initialize_plugins
 
 PROJECTS_DISCOVERED = False
 
 
 def initialize_projects() -> None:
     """Scan the varats projects folder and initialize all projects from the
-    found python files."""
+    found python files, which are imported when a project is looked up."""
     global PROJECTS_DISCOVERED  # pylint: disable=global-statement
     if not PROJECTS_DISCOVERED:
         # Discover and initialize all projects
-        __PROJECTS__.discover()
+        initialize_plugins("projects")
         PROJECTS_DISCOVERED = True
@@ -1,8 +1,9 @@
 """This modules handles auto discovering of tables from the tool suite."""
 
-from varats import tables as __TABLES__
+from varats.ts_utils.plugin_manifest import initialize_plugins
 
 
 def initialize_tables() -> None:
-    # Discover and initialize all plots
-    __TABLES__.discover()
+    # Discover and initialize all tables, table modules are imported on first
+    # use
+    initialize_plugins("tables")
@@ -14,6 +14,10 @@ import yaml
 from argparse_utils import enum_action
 
 from varats.data.discover_reports import initialize_reports
+from varats.paper_mgmt.artefact_builder import (
+    generate_artefacts,
+    get_artefact_states,
+)
 from varats.paper_mgmt.artefacts import (
     Artefact,
     ArtefactType,
@@ -21,13 +25,10 @@ from varats.paper_mgmt.artefacts import (
     store_artefacts,
     PlotArtefact,
     filter_plot_artefacts,
-    TableArtefact,
 )
 from varats.paper_mgmt.paper_config import get_paper_config
-from varats.plot.plots import prepare_plots
 from varats.plots.discover_plots import initialize_plots
 from varats.projects.discover_projects import initialize_projects
-from varats.table.tables import prepare_tables
 from varats.tables.discover_tables import initialize_tables
 from varats.ts_utils.html_utils import (
     CSS_IMAGE_MATRIX,
@@ -79,6 +80,26 @@ def main() -> None:
         nargs='+',
         help="Only generate artefacts with the given names."
     )
+    generate_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of artefacts generated in parallel "
+        "(default: the cache.jobs setting, 0 uses one job per CPU)."
+    )
+    generate_parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        default=False,
+        help="Also generate artefacts that are up to date."
+    )
+    generate_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        default=False,
+        help="Only print which artefacts would be generated."
+    )
 
     # vara-art add
     add_parser = sub_parsers.add_parser(
@@ -165,12 +186,19 @@ def _artefact_generate(args: tp.Dict[str, tp.Any]) -> None:
     else:
         artefacts = get_paper_config().get_all_artefacts()
 
-    for artefact in artefacts:
-        LOG.info(
-            f"Generating artefact {artefact.name} in location "
-            f"{artefact.output_path}"
-        )
-        artefact.generate_artefact()
+    if args.get('dry_run', False):
+        for state in get_artefact_states(artefacts):
+            if args.get('force', False) or state.reason is not None:
+                print(f"{state.artefact.name}: {state.reason or 'forced'}")
+        return
+
+    generated_artefacts = generate_artefacts(
+        artefacts, args.get('jobs', None), args.get('force', False)
+    )
+    LOG.info(
+        f"Generated {len(generated_artefacts)} artefacts, "
+        f"{len(list(artefacts)) - len(generated_artefacts)} were up to date."
+    )
 
     # generate index.html
     _generate_index_html(
@@ -315,7 +343,7 @@ def _generate_artefact_html(artefact: Artefact,
                             cwd: Path) -> tp.Tuple[str, str]:
     artefact_info = f"{artefact.name} ({artefact.artefact_type.name})"
     list_entries: tp.List[str] = []
-    entries = _get_artefact_files_info(artefact)
+    entries = artefact.get_artefact_file_infos()
     for entry in entries:
         artefact_file = entry["file_name"]
         artefact_file_path = _locate_artefact_file(
@@ -332,38 +360,6 @@ def _generate_artefact_html(artefact: Artefact,
     return artefact_info, "\n".join(list_entries)
 
 
-def _get_artefact_files_info(artefact: Artefact) -> tp.List[tp.Dict[str, str]]:
-    if artefact.artefact_type == ArtefactType.plot:
-        artefact = tp.cast(PlotArtefact, artefact)
-        plots = prepare_plots(
-            plot_type=artefact.plot_type,
-            result_output=artefact.output_path,
-            file_format=artefact.file_format,
-            **artefact.plot_kwargs
-        )
-        return [{
-            "file_name": plot.plot_file_name(artefact.file_format),
-            "project": plot.plot_kwargs.get("project", "[UNKNOWN]")
-        } for plot in plots]
-
-    if artefact.artefact_type == ArtefactType.table:
-        artefact = tp.cast(TableArtefact, artefact)
-        tables = prepare_tables(
-            table_type=artefact.table_type,
-            result_output=artefact.output_path,
-            file_format=artefact.file_format,
-            **artefact.table_kwargs
-        )
-        return [{
-            "file_name": table.table_file_name(),
-            "project": table.table_kwargs.get("project", "[UNKNOWN]")
-        } for table in tables]
-
-    raise AssertionError(
-        f"Missing implementation for artefact type {artefact.artefact_type}"
-    )
-
-
 def _locate_artefact_file(artefact_file: Path, output_path: Path,
                           cwd: Path) -> tp.Optional[Path]:
     if not (output_path / artefact_file).exists():
@@ -133,6 +133,14 @@ def __create_status_parser(sub_parsers: _SubParsersAction) -> None:
         action="store_true",
         default=False
     )
+    status_parser.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of projects whose results are scanned in parallel "
+        "(default: the cache.jobs setting, 0 uses one job per CPU)",
+        type=int,
+        default=None
+    )
 
 
 def __add_common_args(sub_parser: ArgumentParser) -> None:
@@ -338,7 +346,8 @@ def __casestudy_status(
         parser.error("At most one argument of: --short, --ws can be used.")
     PCM.show_status_of_case_studies(
         args['report_name'], args['filter_regex'], args['short'],
-        args['sorted'], args['list_revs'], args['ws'], args['legend']
+        args['sorted'], args['list_revs'], args['ws'], args['legend'],
+        args['jobs']
     )
 
 
@@ -0,0 +1,89 @@
+"""Driver module for `vara-gen-blame-sidecars`."""
+
+import argparse
+import typing as tp
+from functools import partial
+from multiprocessing import Pool
+from pathlib import Path
+
+from varats.data.reports.blame_report import (
+    BlameReport,
+    create_blame_report_sidecar,
+)
+from varats.report.report import MetaReport
+from varats.utils.cli_util import initialize_cli_tool
+from varats.utils.settings import vara_cfg
+
+
+def __find_blame_reports(paths: tp.List[Path]) -> tp.List[Path]:
+    report_paths: tp.List[Path] = []
+    for path in paths:
+        candidates = path.rglob("*") if path.is_dir() else [path]
+        for candidate in candidates:
+            if candidate.is_file() and \
+                    BlameReport.is_correct_report_type(candidate.name) and \
+                    not MetaReport.is_result_file_supplementary(
+                        candidate.name) and \
+                    MetaReport.result_file_has_status_success(candidate.name):
+                report_paths.append(candidate)
+    return sorted(report_paths)
+
+
+def main() -> None:
+    """Convert blame reports into binary sidecar files, so subsequent loads do
+    not have to parse the yaml reports."""
+    initialize_cli_tool()
+    parser = argparse.ArgumentParser("vara-gen-blame-sidecars")
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="Result directories or report files to convert "
+        "(default: the configured result dir)"
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        default=False,
+        help="Recreate sidecar files that already exist"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of reports converted in parallel"
+    )
+
+    args = parser.parse_args()
+
+    paths = args.paths if args.paths else [Path(str(vara_cfg()["result_dir"]))]
+    for path in paths:
+        if not path.exists():
+            raise argparse.ArgumentTypeError(f"Path {path} does not exist")
+
+    report_paths = __find_blame_reports(paths)
+    convert_report = partial(create_blame_report_sidecar, overwrite=args.force)
+    with Pool(max(args.jobs, 1)) as pool:
+        num_converted = 0
+        for idx, (report_path, converted) in enumerate(
+            zip(report_paths, pool.imap(convert_report, report_paths)), 1
+        ):
+            status = "converted" if converted else "up to date"
+            print(f"[{idx}/{len(report_paths)}] {report_path.name}: {status}")
+            num_converted += int(converted)
+
+    print(
+        f"Created {num_converted} sidecar files for "
+        f"{len(report_paths)} blame reports."
+    )
+    if not vara_cfg()["cache"]["blame_report_sidecars"]:
+        print(
+            "Blame reports are only loaded from their sidecars after enabling "
+            "them with: vara-config set cache/blame_report_sidecars=True"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""
+Manifest of the plugins, i.e., plots, tables, reports, and projects, that the
+tool suite provides.
+
+Discovering plugins imports every module of a plugin package, which pulls in
+heavy dependencies like pandas or matplotlib even if a tool only needs one
+plugin. Therefore, the names of the plugins and the modules that define them
+are stored in a manifest in the data cache. As long as the sources of the
+package do not change, the plugins are only announced to their registries,
+which import the module of a plugin when it is looked up the first time.
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import typing as tp
+from pathlib import Path
+from types import ModuleType
+
+from varats.utils.filesystem_util import atomic_write
+from varats.utils.plugin_util import LazyRegistry
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
+
+__MANIFEST_VERSION = 1
+
+__PLUGIN_PACKAGES = {
+    "plots": "varats.plots",
+    "tables": "varats.tables",
+    "reports": "varats.data.reports",
+    "projects": "varats.projects",
+}
+
+
+def __get_package_fingerprint(package: ModuleType) -> str:
+    """Hash the paths, sizes, and modification times of all sources of a
+    package."""
+    hasher = hashlib.sha256()
+    for package_dir in sorted(package.__path__):
+        for root, dirs, files in os.walk(package_dir):
+            dirs[:] = sorted(
+                directory for directory in dirs if directory != "__pycache__"
+            )
+            for file_name in sorted(files):
+                if not file_name.endswith(".py"):
+                    continue
+                file_path = os.path.join(root, file_name)
+                file_stat = os.stat(file_path)
+                hasher.update(
+                    f"{os.path.relpath(file_path, package_dir)}:"
+                    f"{file_stat.st_mtime_ns}:{file_stat.st_size}\n".encode()
+                )
+    return hasher.hexdigest()
+
+
+def __get_manifest_path(package: ModuleType) -> Path:
+    """Manifests are stored per package location, so that different
+    installations of the tool suite do not overwrite each other's manifest."""
+    package_digest = hashlib.sha256(
+        str(Path(package.__path__[0]).resolve()).encode()
+    ).hexdigest()[:16]
+    manifest_dir = Path(str(vara_cfg()["data_cache"])) / "plugin_manifests"
+    return manifest_dir / f"{package.__name__}-{package_digest}.json"
+
+
+def __load_manifest(package: ModuleType,
+                    fingerprint: str) -> tp.Optional[tp.Dict[str, str]]:
+    manifest_path = __get_manifest_path(package)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("version") != __MANIFEST_VERSION or manifest.get(
+        "fingerprint"
+    ) != fingerprint:
+        return None
+    return tp.cast(tp.Dict[str, str], manifest["plugins"])
+
+
+def __store_manifest(
+    package: ModuleType, fingerprint: str, plugins: tp.Dict[str, str]
+) -> None:
+    manifest_path = __get_manifest_path(package)
+    manifest = {
+        "version": __MANIFEST_VERSION,
+        "fingerprint": fingerprint,
+        "plugins": plugins
+    }
+    try:
+        with atomic_write(manifest_path) as tmp_manifest_path:
+            with open(
+                tmp_manifest_path, "w", encoding="utf-8"
+            ) as manifest_file:
+                json.dump(manifest, manifest_file, indent=2)
+    except OSError:
+        # the data cache may not be writable, so plugins are discovered
+        # again next time
+        LOG.debug(f"Could not store plugin manifest {manifest_path}.")
+
+
+def __get_plugin_registry(kind: str) -> tp.Optional[LazyRegistry[tp.Any]]:
+    """Registry of a kind of plugin, or ``None`` for projects, which are
+    registered with BenchBuild."""
+    # pylint: disable=import-outside-toplevel
+    if kind == "plots":
+        from varats.plot.plots import PlotRegistry
+        return PlotRegistry.plots
+    if kind == "tables":
+        from varats.table.tables import TableRegistry
+        return TableRegistry.tables
+    if kind == "reports":
+        from varats.report.report import MetaReport
+        return MetaReport.REPORT_TYPES
+    return None
+
+
+def __get_registered_plugins(kind: str) -> tp.Dict[str, tp.Any]:
+    registry = __get_plugin_registry(kind)
+    if registry is None:
+        # pylint: disable=import-outside-toplevel
+        import benchbuild as bb
+        return dict(bb.project.ProjectRegistry.projects)
+    # only the plugins that are already registered, without loading others
+    return dict(dict.items(registry))
+
+
+def __announce_plugins(kind: str, plugins: tp.Dict[str, str]) -> None:
+    registry = __get_plugin_registry(kind)
+    if registry is None:
+        # pylint: disable=import-outside-toplevel
+        from varats.project.project_util import add_project_modules
+        add_project_modules(plugins)
+    else:
+        registry.add_plugin_modules(plugins)
+
+
+def initialize_plugins(kind: str) -> None:
+    """
+    Make all plugins of a kind available in their registry.
+
+    If the manifest of the plugin package is up to date, the plugins are only
+    announced to the registry and their modules are imported on first use.
+    Otherwise, all modules of the package are imported and the manifest is
+    generated again.
+
+    Args:
+        kind: the kind of plugins, i.e., ``plots``, ``tables``, ``reports``,
+              or ``projects``
+    """
+    package_name = __PLUGIN_PACKAGES[kind]
+    package = importlib.import_module(package_name)
+    fingerprint = __get_package_fingerprint(package)
+
+    plugins = __load_manifest(package, fingerprint)
+    if plugins is not None:
+        __announce_plugins(kind, plugins)
+        return
+
+    package.discover()
+    plugins = {
+        name: plugin.__module__
+        for name, plugin in __get_registered_plugins(kind).items()
+        if plugin.__module__.startswith(package_name + ".")
+    }
+    __store_manifest(package, fingerprint, plugins)